@@ -0,0 +1,130 @@
+"""LLM 요청 hedging: 느린 응답의 꼬리 지연을 줄이기 위한 중복 요청.
+
+1차 요청이 임계 시간(프롬프트별 지연 분포의 백분위 또는 frontmatter 고정값)을 넘기면
+같은 모델 또는 대체 프로바이더/모델로 2차 요청을 보내고, 먼저 끝난 쪽을 쓰고 나머지는 취소한다.
+1차 요청이 임계 전에 일시적 오류(retry.is_transient)로 실패하면 2차 요청을 바로 보낸다 (fallback).
+400·스키마 오류처럼 다시 보내도 실패할 오류는 2차 요청 없이 그대로 올린다.
+중복 요청 비용은 프롬프트별 예산(전체 호출 대비 비율)으로 제한한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from ..config import (
+    LLM_HEDGE_BUDGET,
+    LLM_HEDGE_DEFAULT_AFTER_S,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_PERCENTILE,
+)
+from .retry import is_transient
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgePolicy:
+    """프롬프트 한 개의 hedging 설정 (frontmatter ``hedge_*`` 키로 덮어쓸 수 있음)."""
+
+    after_s: Optional[float] = None        # 고정 임계값 (None이면 지연 분포 백분위 사용)
+    percentile: float = LLM_HEDGE_PERCENTILE
+    budget: float = LLM_HEDGE_BUDGET       # 전체 호출 대비 중복 요청 허용 비율
+    provider: Optional[str] = None         # 2차 요청 대상 (None이면 1차와 동일)
+    model: Optional[str] = None
+
+
+def parse_hedge_policy(meta: dict[str, Any]) -> HedgePolicy:
+    """frontmatter extra → HedgePolicy. ``hedge_to: openai:gpt-5.2`` 형식으로 대체 대상 지정."""
+    policy = HedgePolicy()
+    for key, attr in (("hedge_after_s", "after_s"), ("hedge_percentile", "percentile"), ("hedge_budget", "budget")):
+        if key in meta:
+            try:
+                setattr(policy, attr, float(meta[key]))
+            except (TypeError, ValueError):
+                LOGGER.warning("frontmatter %s 값 무시: %r", key, meta[key])
+    target = str(meta.get("hedge_to", "")).strip()
+    if target:
+        provider, _, model = target.partition(":")
+        policy.provider, policy.model = provider.strip(), model.strip() or None
+    return policy
+
+
+class LatencyTracker:
+    """키(프롬프트명)별 최근 지연 시간 표본."""
+
+    def __init__(self, window: int = 200, min_samples: int = LLM_HEDGE_MIN_SAMPLES) -> None:
+        self.min_samples = min_samples
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def observe(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[key].append(seconds)
+
+    def percentile(self, key: str, pct: float) -> Optional[float]:
+        """표본이 ``min_samples`` 미만이면 None."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < max(self.min_samples, 1):
+            return None
+        rank = min(len(samples) - 1, max(0, math.ceil(pct / 100 * len(samples)) - 1))
+        return samples[rank]
+
+
+class HedgeBudget:
+    """키별 중복 요청 수를 전체 호출 수의 일정 비율 이하로 유지."""
+
+    def __init__(self) -> None:
+        self._calls: dict[str, int] = defaultdict(int)
+        self._hedges: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def count_call(self, key: str) -> None:
+        with self._lock:
+            self._calls[key] += 1
+
+    def try_acquire(self, key: str, ratio: float) -> bool:
+        with self._lock:
+            if self._hedges[key] >= ratio * self._calls[key]:
+                return False
+            self._hedges[key] += 1
+            return True
+
+
+async def hedged_call(
+    primary: Callable[[], Awaitable[T]],
+    backup: Callable[[], Awaitable[T]],
+    after_s: float,
+    allow_backup: Callable[[], bool],
+) -> T:
+    """``after_s`` 안에 끝나지 않거나 일시적 오류로 실패하면 backup을 띄우고 먼저 성공한 결과를 반환."""
+    first = asyncio.ensure_future(primary())
+    done, _ = await asyncio.wait({first}, timeout=after_s)
+    if first in done and (first.exception() is None or not is_transient(first.exception())):
+        return first.result()
+    if not allow_backup():
+        return await first
+
+    pending = {first} - done
+    pending.add(asyncio.ensure_future(backup()))
+    last_exc: Optional[BaseException] = first.exception() if first in done else None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                last_exc = task.exception()
+        assert last_exc is not None
+        raise last_exc
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,282 @@
+"""스트리밍 LLM 출력용 증분 JSON 파서.
+
+모델이 ``{"topics": [ {...}, {...} ]}`` 형태를 토큰 단위로 흘려보낼 때,
+배열 원소 객체가 닫히는 즉시 파싱해서 돌려준다. 전체 응답을 기다리지 않고
+첫 원소부터 다음 단계를 시작할 수 있다.
+
+``JSONStreamValidator`` 는 여기에 구조 검증을 더해, 깨진 출력을 생성 도중에 감지한다
+(끝까지 받은 뒤 파싱 실패로 재시도하는 대신 즉시 중단).
+
+``extract_json_object`` 는 완성된 응답 텍스트에서 JSON 객체를 뽑는 공용 추출기다.
+orjson이 설치돼 있으면 디코딩에 사용하고, 없으면 표준 json으로 대체한다.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+# 루트 객체 밖(문자열 외부)에 올 수 있는 문자: 구조 문자, 숫자, true/false/null
+_JSON_BARE_CHARS = frozenset(' \t\r\n{}[],:"0123456789-+.eEtruefalsn')
+_CLOSERS = {"}": "{", "]": "["}
+
+# 루트 객체 앞에 허용하는 설명문/코드펜스 길이
+_MAX_PREFIX_CHARS = 200
+
+
+class JSONStructureError(ValueError):
+    """스트리밍 중 JSON 구조가 깨진 것을 감지 (extract_json_object 실패와 같은 재시도 경로)."""
+
+
+def loads(text: str) -> Any:
+    """orjson 우선 JSON 디코딩. 실패 시 json.JSONDecodeError (orjson 오류도 그 하위 클래스)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _object_end(text: str, start: int) -> int:
+    """``text[start] == "{"`` 인 객체의 짝이 맞는 ``}`` 위치 (문자열/이스케이프 인식). 없으면 -1."""
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def extract_json_object(raw_text: str) -> dict[str, Any]:
+    """응답 텍스트에서 가장 바깥 JSON 객체를 추출 (코드펜스·앞뒤 설명문 허용).
+
+    순수 JSON이면 한 번에 디코딩하고, 아니면 단일 패스 스캐너로 첫 객체의 범위를 찾아
+    그 구간만 디코딩한다 (앞쪽 ``{`` 가 설명문이면 다음 ``{`` 부터 다시 시도).
+    """
+    text = raw_text.strip()
+    if text.startswith("```"):
+        text = text.partition("\n")[2] if "\n" in text else text[3:]
+        if text.rstrip().endswith("```"):
+            text = text.rstrip()[:-3]
+        text = text.strip()
+    if text[:1] in ("{", "[") and text[-1:] in ("}", "]"):
+        try:
+            parsed = loads(text)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if not isinstance(parsed, dict):
+                raise ValueError("Model output JSON is not an object.")
+            return parsed
+
+    start = text.find("{")
+    if start == -1:
+        raise ValueError(f"No JSON object found in model output. (length={len(raw_text)})")
+    last_error: Optional[Exception] = None
+    while start != -1:
+        end = _object_end(text, start)
+        if end == -1:
+            break
+        try:
+            parsed = loads(text[start:end + 1])
+        except json.JSONDecodeError as e:
+            last_error = e
+        else:
+            if isinstance(parsed, dict):
+                return parsed
+        start = text.find("{", start + 1)
+    if last_error is not None:
+        raise last_error
+    raise ValueError(f"Unterminated JSON object in model output. (length={len(raw_text)})")
+
+
+class IncrementalArrayParser:
+    """루트 객체의 ``key`` 배열에서 완성된 원소 객체를 순서대로 뽑아낸다.
+
+    문자열 내부의 괄호/이스케이프를 추적하는 단일 패스 스캐너이므로
+    ``feed()`` 에 임의 크기의 조각을 넣어도 된다.
+
+    Example:
+        parser = IncrementalArrayParser("topics")
+        for delta in stream:
+            for topic in parser.feed(delta):
+                ...
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_key = ""
+        self._array_depth = -1
+        self._item_start = -1
+        self._pos = 0
+        self._text = ""
+        self.items_emitted = 0
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """조각을 추가하고 이번에 완성된 원소 객체 리스트를 반환."""
+        if not chunk:
+            return []
+        self._text += chunk
+        completed: list[dict[str, Any]] = []
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        # 루트 객체의 키(또는 문자열 값) 후보
+                        self._last_key = text[self._string_start + 1:i]
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch in "{[":
+                self._depth += 1
+                if ch == "[" and self._depth == 2 and self._last_key == self.key:
+                    self._array_depth = 2
+                elif ch == "{" and self._array_depth == 2 and self._depth == 3:
+                    self._item_start = i
+            elif ch in "}]":
+                if ch == "}" and self._depth == 3 and self._item_start >= 0:
+                    try:
+                        item = loads(text[self._item_start:i + 1])
+                    except json.JSONDecodeError:
+                        item = None
+                    if isinstance(item, dict):
+                        completed.append(item)
+                        self.items_emitted += 1
+                    self._item_start = -1
+                elif ch == "]" and self._depth == 2 and self._array_depth == 2:
+                    self._array_depth = -1
+                self._depth -= 1
+
+        self._pos = len(text)
+        return completed
+
+
+class JSONStreamValidator:
+    """스트리밍 응답의 루트 JSON 객체를 한 번의 스캔으로 검증하고, 완성된 하위 객체를 뽑아낸다.
+
+    - 앞쪽 ``_MAX_PREFIX_CHARS`` 안에 ``{`` 가 없으면 중단 (코드펜스/짧은 설명문은 허용)
+    - 괄호 짝 불일치, 문자열 밖의 JSON에 없는 문자(주석, 작은따옴표, ``True`` 등)면 중단
+    - 루트 객체가 닫히면 ``done`` → 이후 출력은 읽지 않아도 된다
+
+    ``item_key`` 를 주면 루트의 그 키가 가리키는 배열 원소(인덱스)나 객체 멤버(키)가
+    닫힐 때마다 ``(인덱스 또는 키, dict)`` 로 반환한다.
+    """
+
+    def __init__(self, item_key: Optional[str] = None) -> None:
+        self.item_key = item_key
+        self.done = False
+        self._text = ""
+        self._pos = 0
+        self._root_start = -1
+        self._root_end = -1
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_string: dict[int, str] = {}
+        self._container: Optional[str] = None   # item_key 컨테이너 종류 ("{" 또는 "[")
+        self._item_start = -1
+        self._item_name: Union[int, str] = 0
+        self.items_emitted = 0
+
+    @property
+    def root_text(self) -> str:
+        """닫힌 루트 객체 텍스트 (아직 닫히지 않았으면 빈 문자열)."""
+        return self._text[self._root_start:self._root_end + 1] if self.done else ""
+
+    def feed(self, chunk: str) -> list[tuple[Union[int, str], dict[str, Any]]]:
+        """조각을 추가하고 이번에 완성된 하위 객체를 반환. 구조 오류면 JSONStructureError."""
+        if not chunk or self.done:
+            return []
+        self._text += chunk
+        text = self._text
+        completed: list[tuple[Union[int, str], dict[str, Any]]] = []
+
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._root_start < 0:
+                if ch == "{":
+                    self._root_start = i
+                    self._stack.append("{")
+                elif i >= _MAX_PREFIX_CHARS:
+                    raise JSONStructureError(f"No JSON object within first {_MAX_PREFIX_CHARS} chars")
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._last_string[len(self._stack)] = text[self._string_start + 1:i]
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch in "{[":
+                self._stack.append(ch)
+                depth = len(self._stack)
+                if depth == 2 and self.item_key is not None and self._last_string.get(1) == self.item_key:
+                    self._container = ch
+                    self._item_name = 0 if ch == "[" else ""
+                elif depth == 3 and ch == "{" and self._container is not None:
+                    self._item_start = i
+                    if self._container == "{":
+                        self._item_name = self._last_string.get(2, "")
+            elif ch in _CLOSERS:
+                if not self._stack or self._stack[-1] != _CLOSERS[ch]:
+                    raise JSONStructureError(f"Mismatched {ch!r} at offset {i}")
+                depth = len(self._stack)
+                self._stack.pop()
+                if depth == 3 and ch == "}" and self._item_start >= 0:
+                    item = loads(text[self._item_start:i + 1])
+                    completed.append((self._item_name, item))
+                    self.items_emitted += 1
+                    if self._container == "[":
+                        self._item_name = int(self._item_name) + 1
+                    self._item_start = -1
+                elif depth == 2:
+                    self._container = None
+                if not self._stack:
+                    self._root_end = i
+                    self.done = True
+                    break
+            elif ch not in _JSON_BARE_CHARS:
+                raise JSONStructureError(f"Unexpected {ch!r} outside string at offset {i}")
+
+        self._pos = len(text)
+        return completed
@@ -0,0 +1,238 @@
+"""노드별 LLM 호출 통계 수집.
+
+그래프가 노드를 실행할 때 ``collect_llm_stats()`` 로 수집기를 열면,
+그 안에서 일어나는 모든 LLM 호출(동기/비동기)이 ``record_llm_call()`` 로 누적된다.
+수집기는 contextvar로 전달되므로 노드 코드는 신경 쓸 필요가 없다.
+ThreadPoolExecutor 작업자 스레드에는 contextvar가 전달되지 않으므로 ``bind_llm_stats()`` 로 감싼다.
+
+비용은 ``LLM_PRICING`` (모델 접두사별 USD/1M 토큰 단가)로 추정한다.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from ..config import LLM_PRICING
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@functools.lru_cache(maxsize=1)
+def _pricing_table() -> dict[str, tuple[float, float, float]]:
+    """``"gpt-5-mini=0.25/0.025/2.0,..."`` → {모델 접두사: (입력, 캐시 입력, 출력) USD/1M}."""
+    table: dict[str, tuple[float, float, float]] = {}
+    for entry in LLM_PRICING.split(","):
+        key, _, value = entry.strip().partition("=")
+        try:
+            prompt, cached, completion = (float(v) for v in value.split("/"))
+        except ValueError:
+            if entry.strip():
+                LOGGER.warning("LLM_PRICING 항목 무시: %r", entry)
+            continue
+        table[key.strip()] = (prompt, cached, completion)
+    return table
+
+
+def estimate_cost_usd(model: str, prompt_tokens: int, cached_tokens: int, completion_tokens: int) -> float:
+    """모델명의 가장 긴 접두사 단가로 비용 추정 (단가 미등록 모델은 0)."""
+    table = _pricing_table()
+    matches = [key for key in table if model.startswith(key)]
+    if not matches:
+        return 0.0
+    prompt_rate, cached_rate, completion_rate = table[max(matches, key=len)]
+    uncached = max(0, prompt_tokens - cached_tokens)
+    return (uncached * prompt_rate + cached_tokens * cached_rate + completion_tokens * completion_rate) / 1_000_000
+
+
+def normalize_usage(usage: Optional[dict[str, Any]]) -> dict[str, int]:
+    """Chat Completions / Responses API / 정규화된 usage → record_llm_call 토큰 인자."""
+    usage = usage or {}
+    prompt_details = usage.get("prompt_tokens_details") or usage.get("input_tokens_details") or {}
+    completion_details = usage.get("completion_tokens_details") or usage.get("output_tokens_details") or {}
+    return {
+        "prompt_tokens": int(usage.get("prompt_tokens", usage.get("input_tokens")) or 0),
+        "completion_tokens": int(usage.get("completion_tokens", usage.get("output_tokens")) or 0),
+        "cached_tokens": int(usage.get("cached_tokens", prompt_details.get("cached_tokens")) or 0),
+        "reasoning_tokens": int(usage.get("reasoning_tokens", completion_details.get("reasoning_tokens")) or 0),
+    }
+
+
+@dataclass
+class LLMCallStats:
+    """한 노드 실행 동안의 LLM 호출 누적값."""
+
+    node: str = ""
+    calls: int = 0
+    cache_hits: int = 0
+    hedges: int = 0
+    retries: int = 0
+    retry_wait_s: float = 0.0
+    errors: int = 0
+    queue_wait_s: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    reasoning_tokens: int = 0
+    latency_s: float = 0.0
+    cost_usd: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(
+        self,
+        *,
+        queue_wait_s: float = 0.0,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cached_tokens: int = 0,
+        reasoning_tokens: int = 0,
+        latency_s: float = 0.0,
+        model: str = "",
+        error: bool = False,
+    ) -> None:
+        cost = estimate_cost_usd(model, prompt_tokens or 0, cached_tokens or 0, completion_tokens or 0)
+        with self._lock:
+            self.calls += 1
+            self.errors += int(error)
+            self.queue_wait_s += queue_wait_s
+            self.prompt_tokens += prompt_tokens or 0
+            self.completion_tokens += completion_tokens or 0
+            self.cached_tokens += cached_tokens or 0
+            self.reasoning_tokens += reasoning_tokens or 0
+            self.latency_s += latency_s
+            self.cost_usd += cost
+
+    def add_cache_hit(self) -> None:
+        with self._lock:
+            self.cache_hits += 1
+
+    def add_retry(self, wait_s: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.retry_wait_s += wait_s
+
+    def add_hedge(self) -> None:
+        with self._lock:
+            self.hedges += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "cache_hits": self.cache_hits,
+                "hedges": self.hedges,
+                "retries": self.retries,
+                "retry_wait_s": round(self.retry_wait_s, 2),
+                "errors": self.errors,
+                "queue_wait_s": round(self.queue_wait_s, 2),
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "cached_tokens": self.cached_tokens,
+                "reasoning_tokens": self.reasoning_tokens,
+                "latency_s": round(self.latency_s, 2),
+                "cost_usd": round(self.cost_usd, 6),
+            }
+
+
+_CURRENT: contextvars.ContextVar[Optional[LLMCallStats]] = contextvars.ContextVar("llm_call_stats", default=None)
+
+
+def current_llm_stats() -> Optional[LLMCallStats]:
+    return _CURRENT.get()
+
+
+def current_node_name() -> str:
+    stats = _CURRENT.get()
+    return stats.node if stats is not None else ""
+
+
+@contextmanager
+def collect_llm_stats(node: str = "") -> Iterator[LLMCallStats]:
+    """블록 안의 LLM 호출 통계를 새 수집기에 모은다."""
+    stats = LLMCallStats(node=node)
+    token = _CURRENT.set(stats)
+    try:
+        yield stats
+    finally:
+        _CURRENT.reset(token)
+
+
+def record_llm_call(**kwargs) -> None:
+    """현재 수집기가 있으면 호출 1건을 기록 (없으면 무시)."""
+    stats = _CURRENT.get()
+    if stats is not None:
+        stats.add(**kwargs)
+
+
+def record_llm_usage(
+    model: str,
+    usage: Optional[dict[str, Any]],
+    latency_s: float = 0.0,
+    error: bool = False,
+) -> None:
+    """MultiProviderClient를 거치지 않는 raw HTTP 호출(Phase 1/2, 리포트 요약)의 usage 기록."""
+    record_llm_call(model=model, latency_s=latency_s, error=error, **normalize_usage(usage))
+
+
+def bind_llm_stats(fn: Callable[..., T]) -> Callable[..., T]:
+    """현재 수집기를 작업자 스레드에서도 쓰도록 묶는다 (``ex.map(bind_llm_stats(fn), ...)``)."""
+    stats = _CURRENT.get()
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        token = _CURRENT.set(stats)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _CURRENT.reset(token)
+
+    return wrapper
+
+
+_SUMMABLE = (
+    "calls", "cache_hits", "hedges", "retries", "retry_wait_s", "errors", "queue_wait_s", "prompt_tokens",
+    "completion_tokens", "cached_tokens", "reasoning_tokens", "latency_s", "cost_usd",
+)
+
+
+def summarize_llm_metrics(metrics: dict[str, Any]) -> dict[str, Any]:
+    """그래프 metrics의 노드별 ``llm`` 통계를 실행 전체 합계로 집계."""
+    totals: dict[str, Any] = {key: 0 for key in _SUMMABLE}
+    for info in (metrics or {}).values():
+        llm = info.get("llm") if isinstance(info, dict) else None
+        if not isinstance(llm, dict):
+            continue
+        for key in _SUMMABLE:
+            totals[key] += llm.get(key, 0) or 0
+    for key in ("queue_wait_s", "retry_wait_s", "latency_s"):
+        totals[key] = round(totals[key], 2)
+    totals["cost_usd"] = round(totals["cost_usd"], 6)
+    return totals
+
+
+def record_llm_cache_hit() -> None:
+    """응답 캐시 적중 1건 기록 (API 호출 수에는 포함하지 않음)."""
+    stats = _CURRENT.get()
+    if stats is not None:
+        stats.add_cache_hit()
+
+
+def record_llm_hedge() -> None:
+    """hedging 중복 요청 1건 기록."""
+    stats = _CURRENT.get()
+    if stats is not None:
+        stats.add_hedge()
+
+
+def record_llm_retry(wait_s: float) -> None:
+    """일시적 오류 재시도 1건과 대기 시간 기록."""
+    stats = _CURRENT.get()
+    if stats is not None:
+        stats.add_retry(wait_s)
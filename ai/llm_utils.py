@@ -1,59 +1,160 @@
 """LLM 호출 헬퍼: prompt_loader 연동 + JSON 추출.
 
-generate_interface2.py의 extract_json_object() 로직을 재활용한다.
+JSON 추출은 json_parsing.extract_json_object (공용 단일 패스 추출기)를 쓴다.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional, Union
 
-from ..prompts.prompt_loader import load_prompt
-from ..config import PROMPTS_DIR
-from .multi_provider_client import get_multi_provider_client
+from ..prompts.prompt_loader import PromptSpec, compile_prompt
+from ..config import LLM_HEDGE_ENABLED, LLM_MOCK_ENABLED, PROMPTS_DIR
+from .hedging import HedgePolicy, parse_hedge_policy
+from .json_parsing import JSONStreamValidator, extract_json_object
+from .llm_metrics import current_node_name, record_llm_cache_hit
+from .multi_provider_client import get_multi_provider_client, run_async
+from .prompt_vars import fit_variable, serialize_variable, variable_budgets
+from .response_cache import (
+    ResponseCache,
+    get_response_cache,
+    is_cache_bypassed,
+    make_response_key,
+    prompt_file_hash,
+)
+from .retry import acall_with_retry, call_with_retry
+from .structured_output import resolve_schema, response_format_for
 
 LOGGER = logging.getLogger(__name__)
 
 
-def extract_json_object(raw_text: str) -> dict[str, Any]:
-    """응답에서 JSON 객체 추출 (코드블록 처리 포함)."""
-    text = raw_text.strip()
+def _prepare_prompt_call(
+    prompt_name: str,
+    variables: dict[str, Any],
+    prompts_dir: str | Path | None,
+) -> tuple[PromptSpec, dict[str, Any]]:
+    """프롬프트 로드 → chat_completion 호출 인자 생성 (동기·비동기 공용)."""
+    compiled = compile_prompt(prompt_name, prompts_dir or PROMPTS_DIR)
 
-    # 코드블록 제거
-    if text.startswith("```"):
-        text = re.sub(r"^```(?:json)?\s*", "", text)
-        text = re.sub(r"\s*```$", "", text)
+    # 변수를 문자열로 변환 (dict/list -> compact JSON, frontmatter max_tokens.<변수> 예산 적용)
+    budgets = variable_budgets(compiled.base.extra)
+    str_vars: dict[str, str] = {}
+    for k, v in variables.items():
+        if k in budgets:
+            limit, low_priority = budgets[k]
+            str_vars[k] = fit_variable(v, limit, compiled.base.model, low_priority)
+        else:
+            str_vars[k] = serialize_variable(v)
 
-    # 직접 파싱 시도
-    try:
-        parsed = json.loads(text)
-        if isinstance(parsed, dict):
-            return parsed
-        raise ValueError("Model output JSON is not an object.")
-    except json.JSONDecodeError:
-        pass
-
-    # { ... } 범위 추출
-    start = text.find("{")
-    end = text.rfind("}")
-    if start == -1 or end == -1 or end <= start:
-        raise ValueError(f"No JSON object found in model output. (length={len(raw_text)})")
-
-    candidate = text[start: end + 1]
-    parsed = json.loads(candidate)
-    if not isinstance(parsed, dict):
-        raise ValueError("Parsed JSON is not an object.")
+    spec = compiled.render(str_vars)
+
+    messages: list[dict[str, Any]] = []
+    if spec.cache_prefix:
+        # 프롬프트 간 공유 컨텍스트를 맨 앞에 둬야 프로바이더 prefix 캐시가 적중한다
+        messages.append({"role": "system", "content": spec.cache_prefix, "cache_prefix": True})
+    if spec.system_message:
+        messages.append({"role": "system", "content": spec.system_message})
+    messages.append({"role": "user", "content": spec.body})
+
+    call_kwargs: dict[str, Any] = {
+        "provider": spec.provider,
+        "model": spec.model,
+        "messages": messages,
+        "thinking": spec.thinking,
+        "thinking_effort": spec.thinking_effort,
+        "temperature": spec.temperature,
+        "max_tokens": spec.max_tokens,
+        "response_format": (
+            response_format_for(spec.extra["schema"], prompt_name)
+            if spec.extra.get("schema")
+            else {"type": "json_object"}
+            if spec.response_format == "json_object"
+            else None
+        ),
+    }
+    if LLM_MOCK_ENABLED:
+        # 모델명은 유지 (rate limit 토큰 추정·비용 집계가 실제 호출과 같게)
+        call_kwargs["provider"] = "mock"
+        call_kwargs["mock_prompt"] = prompt_name
+    return spec, call_kwargs
+
+
+def _parse_output(spec: PromptSpec, content: str) -> dict[str, Any]:
+    """JSON 추출 + frontmatter ``schema`` 가 있으면 Pydantic 검증 (실패 시 ValueError → 재시도)."""
+    parsed = extract_json_object(content)
+    if spec.extra.get("schema"):
+        resolve_schema(spec.extra["schema"]).model_validate(parsed)
     return parsed
 
 
+def _hedge_policy(spec: PromptSpec) -> Optional[HedgePolicy]:
+    """LLM_HEDGE_ENABLED일 때 프롬프트 hedging 설정 (frontmatter ``hedge: false`` 로 제외)."""
+    if not LLM_HEDGE_ENABLED or str(spec.extra.get("hedge", "true")).lower() in {"false", "0", "no", "off"}:
+        return None
+    policy = parse_hedge_policy(spec.extra)
+    if LLM_MOCK_ENABLED:
+        policy.provider = policy.model = None  # mock 실행 중 중복 요청이 실제 API로 새지 않게
+    return policy
+
+
+def _cache_lookup(
+    prompt_name: str,
+    call_kwargs: dict[str, Any],
+    prompts_dir: str | Path | None,
+) -> tuple[Optional[ResponseCache], str, Optional[dict[str, Any]]]:
+    """응답 캐시 조회. (캐시, 키, 파싱된 결과 또는 None) 반환 — 캐시 미사용 시 (None, "", None)."""
+    cache = get_response_cache()
+    if cache is None or is_cache_bypassed(prompt_name, current_node_name()):
+        return None, "", None
+    key = make_response_key(call_kwargs, prompt_file_hash(prompts_dir or PROMPTS_DIR, prompt_name))
+    content = cache.get(key)
+    if content is None:
+        return cache, key, None
+    try:
+        parsed = extract_json_object(content)
+    except (ValueError, json.JSONDecodeError):
+        return cache, key, None
+    record_llm_cache_hit()
+    LOGGER.info("LLM cache hit: prompt=%s model=%s", prompt_name, call_kwargs.get("model"))
+    return cache, key, parsed
+
+
+def _stream_call(
+    client: Any,
+    spec: PromptSpec,
+    call_kwargs: dict[str, Any],
+    on_item: Optional[Callable[[Union[int, str], dict[str, Any]], None]],
+) -> tuple[dict[str, Any], str]:
+    """스트리밍 호출 + 증분 JSON 검증. (응답, 루트 JSON 텍스트) 반환.
+
+    구조가 깨지면 JSONStructureError로 생성을 즉시 중단하고, 루트 객체가 닫히면 나머지는 읽지 않는다.
+    frontmatter ``stream_items`` 키의 하위 객체가 완성될 때마다 ``on_item(인덱스 또는 키, 객체)`` 를 호출한다.
+    """
+    validator = JSONStreamValidator(spec.extra.get("stream_items") or None)
+
+    def _on_delta(text: str) -> bool:
+        for name, item in validator.feed(text):
+            if on_item is None:
+                continue
+            try:
+                on_item(name, item)
+            except Exception as e:
+                LOGGER.warning("on_item callback failed (ignored): %s", e)
+        return validator.done
+
+    result = client.chat_completion_stream(on_delta=_on_delta, **call_kwargs)
+    return result, validator.root_text or result["choices"][0]["message"]["content"]
+
+
 def call_llm_with_prompt(
     prompt_name: str,
     variables: dict[str, Any],
     prompts_dir: str | Path | None = None,
     max_retries: int = 3,
+    stream: Optional[bool] = None,
+    on_item: Optional[Callable[[Union[int, str], dict[str, Any]], None]] = None,
 ) -> dict[str, Any]:
     """프롬프트 로드 -> LLM 호출 -> JSON 파싱 (재시도 기능 포함).
 
@@ -62,47 +163,43 @@ def call_llm_with_prompt(
         variables: 템플릿에 치환할 변수 (dict/list는 자동 JSON 직렬화).
         prompts_dir: 프롬프트 디렉토리 오버라이드.
         max_retries: JSON 파싱 실패 시 재시도 횟수.
+        stream: 스트리밍 + 증분 JSON 검증 사용 여부 (None이면 frontmatter ``stream``).
+            깨진 출력은 끝까지 받지 않고 중단 후 재시도한다. hedging보다 우선한다.
+        on_item: 스트리밍 시 ``stream_items`` 하위 객체가 완성될 때마다 호출.
+            재시도하면 같은 인덱스/키로 다시 호출될 수 있다.
 
     Returns:
         파싱된 JSON 딕셔너리.
     """
-    # 변수를 문자열로 변환 (dict/list -> JSON string)
-    str_vars: dict[str, str] = {}
-    for k, v in variables.items():
-        if isinstance(v, (dict, list)):
-            str_vars[k] = json.dumps(v, ensure_ascii=False, indent=2)
-        else:
-            str_vars[k] = str(v)
-
-    spec = load_prompt(prompt_name, prompts_dir=prompts_dir or PROMPTS_DIR, **str_vars)
+    spec, call_kwargs = _prepare_prompt_call(prompt_name, variables, prompts_dir)
+    cache, cache_key, cached = _cache_lookup(prompt_name, call_kwargs, prompts_dir)
+    if cached is not None:
+        return cached
     client = get_multi_provider_client()
-
-    messages: list[dict[str, str]] = []
-    if spec.system_message:
-        messages.append({"role": "system", "content": spec.system_message})
-    messages.append({"role": "user", "content": spec.body})
+    hedge = _hedge_policy(spec)
+    if stream is None:
+        stream = str(spec.extra.get("stream", "false")).lower() in {"true", "1", "yes", "on"}
 
     last_exception = None
 
     for attempt in range(max_retries):
         try:
-            result = client.chat_completion(
-                provider=spec.provider,
-                model=spec.model,
-                messages=messages,
-                thinking=spec.thinking,
-                thinking_effort=spec.thinking_effort,
-                temperature=spec.temperature,
-                max_tokens=spec.max_tokens,
-                response_format=(
-                    {"type": "json_object"}
-                    if spec.response_format == "json_object"
-                    else None
-                ),
-            )
+            if stream:
+                result, content = call_with_retry(
+                    lambda: _stream_call(client, spec, call_kwargs, on_item), prompt_name,
+                )
+            elif hedge is not None:
+                result = call_with_retry(
+                    lambda: run_async(client.achat_completion_hedged(hedge, prompt_name, **call_kwargs)), prompt_name,
+                )
+                content = result["choices"][0]["message"]["content"]
+            else:
+                result = call_with_retry(lambda: client.chat_completion(**call_kwargs), prompt_name)
+                content = result["choices"][0]["message"]["content"]
 
-            content = result["choices"][0]["message"]["content"]
-            parsed = extract_json_object(content)
+            parsed = _parse_output(spec, content)
+            if cache is not None:
+                cache.set(cache_key, content)
 
             LOGGER.info(
                 "LLM call done: prompt=%s provider=%s model=%s tokens=%s (attempt %d/%d)",
@@ -125,3 +222,58 @@ def call_llm_with_prompt(
     # 모든 재시도 실패
     LOGGER.error("All %d attempts failed for prompt %s.", max_retries, prompt_name)
     raise last_exception or ValueError(f"Failed to get valid JSON after {max_retries} attempts.")
+
+
+async def acall_llm_with_prompt(
+    prompt_name: str,
+    variables: dict[str, Any],
+    prompts_dir: str | Path | None = None,
+    max_retries: int = 3,
+) -> dict[str, Any]:
+    """call_llm_with_prompt의 비동기 버전.
+
+    한 스레드에서 여러 호출을 ``asyncio.gather`` 로 동시에 실행할 수 있다.
+    동기 코드에서는 ``run_async(asyncio.gather(...))`` 로 공용 루프에서 실행한다.
+    """
+    spec, call_kwargs = _prepare_prompt_call(prompt_name, variables, prompts_dir)
+    cache, cache_key, cached = _cache_lookup(prompt_name, call_kwargs, prompts_dir)
+    if cached is not None:
+        return cached
+    client = get_multi_provider_client()
+    hedge = _hedge_policy(spec)
+
+    last_exception = None
+
+    for attempt in range(max_retries):
+        try:
+            if hedge is not None:
+                result = await acall_with_retry(
+                    lambda: client.achat_completion_hedged(hedge, prompt_name, **call_kwargs), prompt_name,
+                )
+            else:
+                result = await acall_with_retry(lambda: client.achat_completion(**call_kwargs), prompt_name)
+
+            content = result["choices"][0]["message"]["content"]
+            parsed = _parse_output(spec, content)
+            if cache is not None:
+                cache.set(cache_key, content)
+
+            LOGGER.info(
+                "LLM call done (async): prompt=%s provider=%s model=%s tokens=%s (attempt %d/%d)",
+                prompt_name, spec.provider, spec.model, result.get("usage"), attempt + 1, max_retries
+            )
+            return parsed
+
+        except (ValueError, json.JSONDecodeError) as e:
+            last_exception = e
+            LOGGER.warning(
+                "JSON parse failed for prompt %s (attempt %d/%d): %s",
+                prompt_name, attempt + 1, max_retries, e
+            )
+            continue
+        except Exception as e:
+            LOGGER.error("LLM call failed with unexpected error: %s", e)
+            raise e
+
+    LOGGER.error("All %d attempts failed for prompt %s.", max_retries, prompt_name)
+    raise last_exception or ValueError(f"Failed to get valid JSON after {max_retries} attempts.")
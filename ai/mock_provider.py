@@ -0,0 +1,284 @@
+"""오프라인 부하/동시성 테스트용 mock LLM 프로바이더.
+
+OpenAI SDK 클라이언트와 같은 모양(``chat.completions.create`` / ``with_raw_response`` / ``stream=True``)을
+흉내 내므로, MultiProviderClient에 ``register_provider("mock", ...)`` 로 붙이면
+rate limiter, 재시도, hedging, 스트리밍 검증, 노드별 통계 등 실제 호출 경로를 그대로 탄다.
+
+- 응답: ``LLM_MOCK_RESPONSES_DIR/<프롬프트명>.json`` → response_format JSON Schema로 만든 예시 → ``{}``
+- 지연: ``fixed:초`` / ``uniform:최소:최대`` / ``lognormal:중앙값:sigma`` (``LLM_MOCK_LATENCY``)
+- 오류 주입: ``429=0.05,timeout=0.02,503=0.01`` 호출당 확률 (``LLM_MOCK_ERROR_RATES``)
+- 토큰 수: 입력은 토크나이저 추정, 출력은 응답 텍스트 기준 또는 고정값 (``LLM_MOCK_COMPLETION_TOKENS``)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import random
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator, Optional
+
+from ..config import (
+    LLM_MOCK_COMPLETION_TOKENS,
+    LLM_MOCK_ERROR_RATES,
+    LLM_MOCK_LATENCY,
+    LLM_MOCK_RESPONSES_DIR,
+)
+from .rate_limiter import estimate_request_tokens
+from .tokenizer import count_tokens
+
+LOGGER = logging.getLogger(__name__)
+
+_STREAM_CHUNK_CHARS = 32
+_TTFT_RATIO = 0.2  # 전체 지연 중 첫 조각까지의 비율 (나머지는 조각마다 균등 분배)
+
+
+class MockAPIError(Exception):
+    """주입된 HTTP 오류. SDK APIStatusError처럼 ``status_code`` 와 ``response.headers`` 를 가진다."""
+
+    def __init__(self, status_code: int, retry_after_s: float = 1.0) -> None:
+        super().__init__(f"mock provider injected HTTP {status_code}")
+        self.status_code = status_code
+        headers = {"retry-after": f"{retry_after_s:g}"} if status_code == 429 else {}
+        self.response = SimpleNamespace(status_code=status_code, headers=headers)
+
+
+class MockTimeoutError(TimeoutError):
+    """주입된 요청 타임아웃."""
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """``LLM_MOCK_LATENCY`` 문자열 → 지연(초) 샘플러."""
+    kind, _, args = spec.strip().partition(":")
+    try:
+        values = [float(v) for v in args.split(":")] if args else []
+        if kind == "fixed" and len(values) == 1:
+            return lambda rng: values[0]
+        if kind == "uniform" and len(values) == 2:
+            return lambda rng: rng.uniform(values[0], values[1])
+        if kind == "lognormal" and len(values) == 2 and values[0] > 0:
+            return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    except ValueError:
+        pass
+    raise ValueError(f"LLM_MOCK_LATENCY 형식 오류: {spec!r}")
+
+
+def parse_error_rates(spec: str) -> dict[str, float]:
+    """``"429=0.05,timeout=0.02"`` → {"429": 0.05, "timeout": 0.02}."""
+    rates: dict[str, float] = {}
+    for entry in spec.split(","):
+        key, _, value = entry.strip().partition("=")
+        if not key:
+            continue
+        try:
+            rates[key.strip().lower()] = float(value)
+        except ValueError:
+            LOGGER.warning("LLM_MOCK_ERROR_RATES 항목 무시: %r", entry)
+    return rates
+
+
+def example_from_schema(node: dict[str, Any], defs: Optional[dict[str, Any]] = None, name: str = "") -> Any:
+    """JSON Schema를 만족하는 최소 예시 값 (배열은 minItems 또는 1개)."""
+    defs = node.get("$defs", {}) if defs is None else defs
+    if "$ref" in node:
+        return example_from_schema(defs[node["$ref"].rsplit("/", 1)[-1]], defs, name)
+    if "const" in node:
+        return node["const"]
+    if node.get("enum"):
+        return node["enum"][0]
+    for key in ("anyOf", "oneOf"):
+        if key in node:
+            options = [o for o in node[key] if o.get("type") != "null"] or node[key]
+            return example_from_schema(options[0], defs, name)
+
+    kind = node.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    if kind == "object":
+        return {key: example_from_schema(sub, defs, key) for key, sub in node.get("properties", {}).items()}
+    if kind == "array":
+        count = max(int(node.get("minItems", 0)), 1)
+        return [example_from_schema(node.get("items", {}), defs, name) for _ in range(count)]
+    if kind == "string":
+        text = f"mock {name}".strip()
+        return text[: node["maxLength"]] if "maxLength" in node else text
+    if kind == "integer":
+        return int(node.get("minimum", 1))
+    if kind == "number":
+        return float(node.get("minimum", 1))
+    if kind == "boolean":
+        return True
+    return None
+
+
+class _MockCore:
+    """동기/비동기 mock 클라이언트 공용: 지연·오류 샘플링과 응답 생성."""
+
+    def __init__(
+        self,
+        latency: str = LLM_MOCK_LATENCY,
+        error_rates: str = LLM_MOCK_ERROR_RATES,
+        completion_tokens: int = LLM_MOCK_COMPLETION_TOKENS,
+        responses_dir: str | Path | None = LLM_MOCK_RESPONSES_DIR,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.sample_latency = parse_latency(latency)
+        self.error_rates = parse_error_rates(error_rates)
+        self.completion_tokens = completion_tokens
+        self.responses_dir = Path(responses_dir) if responses_dir else None
+        self.rng = random.Random(seed)
+
+    def plan(self) -> tuple[float, Optional[Exception]]:
+        """이번 호출의 (지연 초, 주입할 오류 또는 None)."""
+        latency = max(0.0, self.sample_latency(self.rng))
+        for kind, rate in self.error_rates.items():
+            if self.rng.random() >= rate:
+                continue
+            if kind == "timeout":
+                return latency, MockTimeoutError("mock provider injected timeout")
+            try:
+                return latency, MockAPIError(int(kind))
+            except ValueError:
+                LOGGER.warning("mock 오류 종류 무시: %r", kind)
+        return latency, None
+
+    def content_for(self, prompt_name: str, response_format: Optional[dict[str, Any]]) -> str:
+        if self.responses_dir is not None and prompt_name:
+            path = self.responses_dir / f"{prompt_name}.json"
+            if path.exists():
+                return path.read_text(encoding="utf-8")
+        if response_format and response_format.get("type") == "json_schema":
+            value = example_from_schema(response_format["json_schema"]["schema"])
+            return json.dumps(value, ensure_ascii=False)
+        return "{}"
+
+    def response(self, model: str, messages: list[dict[str, Any]], content: str) -> SimpleNamespace:
+        prompt_tokens = estimate_request_tokens(messages, 0, model)
+        completion_tokens = self.completion_tokens or count_tokens(content, model)
+        return SimpleNamespace(
+            model=model,
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content, role="assistant"))],
+            usage=_usage(prompt_tokens, completion_tokens),
+        )
+
+
+def _usage(prompt_tokens: int, completion_tokens: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=0),
+        completion_tokens_details=SimpleNamespace(reasoning_tokens=0),
+    )
+
+
+def _chunk(content: str = "", usage: Any = None) -> SimpleNamespace:
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class _RawResponse:
+    def __init__(self, response: Any) -> None:
+        self._response = response
+        self.headers: dict[str, str] = {}
+
+    def parse(self) -> Any:
+        return self._response
+
+
+class _MockStream:
+    """``chat.completions.create(stream=True)`` 결과 — 조각 사이에 지연을 나눠 넣는다."""
+
+    def __init__(self, response: SimpleNamespace, latency: float) -> None:
+        self._chunks: Iterator[SimpleNamespace] = self._generate(response, latency)
+        self._closed = False
+
+    @staticmethod
+    def _generate(response: SimpleNamespace, latency: float) -> Iterator[SimpleNamespace]:
+        content = response.choices[0].message.content
+        pieces = [content[i:i + _STREAM_CHUNK_CHARS] for i in range(0, len(content), _STREAM_CHUNK_CHARS)]
+        time.sleep(latency * _TTFT_RATIO)
+        per_piece = latency * (1 - _TTFT_RATIO) / max(len(pieces), 1)
+        for i, piece in enumerate(pieces):
+            if i:
+                time.sleep(per_piece)
+            yield _chunk(piece)
+        yield _chunk(usage=response.usage)
+
+    def __iter__(self) -> "_MockStream":
+        return self
+
+    def __next__(self) -> SimpleNamespace:
+        if self._closed:
+            raise StopIteration
+        return next(self._chunks)
+
+    def close(self) -> None:
+        self._closed = True
+
+
+class _Completions:
+    def __init__(self, core: _MockCore) -> None:
+        self._core = core
+        self.with_raw_response = SimpleNamespace(create=lambda **kw: _RawResponse(self.create(**kw)))
+
+    def create(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        response_format: Optional[dict[str, Any]] = None,
+        stream: bool = False,
+        mock_prompt: str = "",
+        **kwargs: Any,
+    ) -> Any:
+        latency, error = self._core.plan()
+        response = self._core.response(model, messages, self._core.content_for(mock_prompt, response_format))
+        if stream and error is None:
+            return _MockStream(response, latency)
+        time.sleep(latency)
+        if error is not None:
+            raise error
+        return response
+
+
+class _AsyncCompletions:
+    def __init__(self, core: _MockCore) -> None:
+        self._core = core
+        self.with_raw_response = SimpleNamespace(create=self._create_raw)
+
+    async def _create_raw(self, **kwargs: Any) -> _RawResponse:
+        # SDK와 같이 생성만 비동기이고 parse()는 동기
+        return _RawResponse(await self.create(**kwargs))
+
+    async def create(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        response_format: Optional[dict[str, Any]] = None,
+        mock_prompt: str = "",
+        **kwargs: Any,
+    ) -> Any:
+        latency, error = self._core.plan()
+        await asyncio.sleep(latency)
+        if error is not None:
+            raise error
+        return self._core.response(model, messages, self._core.content_for(mock_prompt, response_format))
+
+
+class MockLLMProvider:
+    """OpenAI SDK 모양의 동기 mock 클라이언트."""
+
+    def __init__(self, **options: Any) -> None:
+        self.core = _MockCore(**options)
+        self.chat = SimpleNamespace(completions=_Completions(self.core))
+
+
+class AsyncMockLLMProvider:
+    """OpenAI SDK 모양의 비동기 mock 클라이언트."""
+
+    def __init__(self, **options: Any) -> None:
+        self.core = _MockCore(**options)
+        self.chat = SimpleNamespace(completions=_AsyncCompletions(self.core))
@@ -2,20 +2,41 @@
 
 datapipeline/ai/multi_provider_client.py에서 복제.
 config 의존을 제거하고 환경변수를 직접 참조한다.
+
+동기 ``chat_completion`` 과 같은 반환 형태의 비동기 ``achat_completion`` 을 함께 제공한다.
+비동기 클라이언트(httpx 커넥션 풀)는 이벤트 루프에 묶이므로, 동기 코드에서는
+``run_async()`` 로 프로세스 공용 루프에서 실행한다.
+``chat_completion_stream`` 은 응답 조각마다 콜백을 호출하고, 콜백이 예외를 내면 생성을 즉시 중단한다.
+``achat_completion_hedged`` 는 느린 요청에 중복 요청을 붙여 꼬리 지연을 줄인다 (ai/hedging.py).
+``register_provider`` 로 OpenAI 호환 클라이언트(예: ai/mock_provider.py)를 추가할 수 있다.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
+import inspect
+import json
 import logging
+import threading
 import time
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Mapping, Optional, TypeVar
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
-from ..config import OPENAI_API_KEY, PERPLEXITY_API_KEY, ANTHROPIC_API_KEY
+from ..config import (
+    OPENAI_API_KEY, PERPLEXITY_API_KEY, ANTHROPIC_API_KEY, LLM_HEDGE_DEFAULT_AFTER_S, LLM_MOCK_ENABLED,
+)
+from .hedging import HedgeBudget, HedgePolicy, LatencyTracker, hedged_call
+from .llm_metrics import normalize_usage, record_llm_call, record_llm_hedge
+from .mock_provider import AsyncMockLLMProvider, MockLLMProvider
+from .rate_limiter import RateLimiter, estimate_request_tokens, get_rate_limiter
 
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class MultiProviderClient:
     """OpenAI, Perplexity, Anthropic을 통합 관리하는 AI 클라이언트."""
@@ -31,10 +52,15 @@ class MultiProviderClient:
         anthropic_key = anthropic_key or ANTHROPIC_API_KEY
 
         self.providers: dict[str, Any] = {}
+        self.async_providers: dict[str, Any] = {}
+        self.latency = LatencyTracker()
+        self.hedge_budget = HedgeBudget()
 
+        # SDK 자체 재시도는 끄고 ai/retry.py 한 곳에서만 재시도한다 (중첩 시 시도 횟수가 곱해짐)
         # OpenAI
         if openai_key:
-            self.providers["openai"] = OpenAI(api_key=openai_key)
+            self.providers["openai"] = OpenAI(api_key=openai_key, max_retries=0)
+            self.async_providers["openai"] = AsyncOpenAI(api_key=openai_key, max_retries=0)
             LOGGER.info("OpenAI provider initialized")
 
         # Perplexity (OpenAI 호환 API)
@@ -42,19 +68,44 @@ class MultiProviderClient:
             self.providers["perplexity"] = OpenAI(
                 api_key=perplexity_key,
                 base_url="https://api.perplexity.ai",
+                max_retries=0,
+            )
+            self.async_providers["perplexity"] = AsyncOpenAI(
+                api_key=perplexity_key,
+                base_url="https://api.perplexity.ai",
+                max_retries=0,
             )
             LOGGER.info("Perplexity provider initialized")
 
         # Anthropic (선택적)
         if anthropic_key:
             try:
-                from anthropic import Anthropic
-                self._anthropic_client = Anthropic(api_key=anthropic_key)
+                from anthropic import Anthropic, AsyncAnthropic
+                self._anthropic_client = Anthropic(api_key=anthropic_key, max_retries=0)
                 self.providers["anthropic"] = self._anthropic_client
+                self.async_providers["anthropic"] = AsyncAnthropic(api_key=anthropic_key, max_retries=0)
                 LOGGER.info("Anthropic provider initialized")
             except ImportError:
                 LOGGER.warning("anthropic 패키지 미설치 - pip install anthropic")
 
+        # Mock (오프라인 부하 테스트, OpenAI 호환 경로로 호출됨)
+        if LLM_MOCK_ENABLED:
+            self.register_provider("mock", MockLLMProvider(), AsyncMockLLMProvider())
+
+    def register_provider(self, name: str, client: Any, async_client: Any = None) -> None:
+        """OpenAI SDK 모양(``chat.completions``)의 클라이언트를 프로바이더로 등록."""
+        self.providers[name] = client
+        if async_client is not None:
+            self.async_providers[name] = async_client
+        LOGGER.info("%s provider registered", name)
+
+    def _check_provider(self, provider: str, providers: dict[str, Any]) -> None:
+        if provider not in providers:
+            raise ValueError(
+                f"프로바이더 '{provider}'가 초기화되지 않았습니다. "
+                f"사용 가능: {list(providers.keys())}"
+            )
+
     def chat_completion(
         self,
         provider: str,
@@ -67,12 +118,14 @@ class MultiProviderClient:
         response_format: Optional[dict[str, Any]] = None,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        """프로바이더별 chat completion 호출."""
-        if provider not in self.providers:
-            raise ValueError(
-                f"프로바이더 '{provider}'가 초기화되지 않았습니다. "
-                f"사용 가능: {list(self.providers.keys())}"
-            )
+        """프로바이더별 chat completion 호출 (rate limit 한도 초과 시 대기 후 실행)."""
+        self._check_provider(provider, self.providers)
+
+        limiter = get_rate_limiter()
+        queue_wait_s = (
+            limiter.acquire(provider, model, estimate_request_tokens(messages, max_tokens, model))
+            if limiter else 0.0
+        )
 
         started = time.perf_counter()
         LOGGER.info(
@@ -82,9 +135,9 @@ class MultiProviderClient:
 
         try:
             if provider == "anthropic":
-                result = self._call_anthropic(model, messages, temperature, max_tokens)
+                result, headers = self._call_anthropic(model, messages, temperature, max_tokens, response_format)
             else:
-                result = self._call_openai_compatible(
+                result, headers = self._call_openai_compatible(
                     provider, model, messages, thinking, thinking_effort,
                     temperature, max_tokens, response_format, **kwargs,
                 )
@@ -94,107 +147,448 @@ class MultiProviderClient:
                 "[%s] error model=%s elapsed=%.2fs: %s",
                 provider.upper(), model, elapsed, exc,
             )
+            _observe_call(limiter, provider, model, queue_wait_s, elapsed, exc=exc)
             raise
 
         elapsed = time.perf_counter() - started
         LOGGER.info("[%s] done model=%s elapsed=%.2fs", provider.upper(), model, elapsed)
+        _observe_call(limiter, provider, model, queue_wait_s, elapsed, headers=headers, result=result)
         return result
 
-    def _call_openai_compatible(
-        self, provider: str, model: str, messages: list[dict], thinking: bool,
-        thinking_effort: str, temperature: float, max_tokens: int,
-        response_format: Optional[dict], **kwargs: Any,
+    def chat_completion_stream(
+        self,
+        provider: str,
+        model: str,
+        messages: list[dict[str, str]],
+        on_delta: Callable[[str], bool],
+        thinking: bool = False,
+        thinking_effort: str = "medium",
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        response_format: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
     ) -> dict[str, Any]:
-        """OpenAI 호환 API 호출 (OpenAI, Perplexity)."""
-        client = self.providers[provider]
+        """스트리밍 chat completion (반환 형태는 chat_completion과 동일).
+
+        ``on_delta(text)`` 가 True를 반환하면 이후 출력은 결과에 넣지 않지만, 사용량(usage)과
+        rate limit 헤더를 받기 위해 스트림 끝까지는 읽는다.
+        예외를 내면 연결을 닫고 그 예외를 그대로 전파한다.
+        """
+        self._check_provider(provider, self.providers)
+
+        limiter = get_rate_limiter()
+        queue_wait_s = (
+            limiter.acquire(provider, model, estimate_request_tokens(messages, max_tokens, model))
+            if limiter else 0.0
+        )
 
-        is_gpt5 = provider == "openai" and "gpt-5" in model
+        started = time.perf_counter()
+        LOGGER.info(
+            "[%s] start (stream) model=%s messages=%d thinking=%s",
+            provider.upper(), model, len(messages), thinking,
+        )
+        parts: list[str] = []
+        usage: dict[str, Any] = {}
+        headers: Optional[Mapping[str, str]] = None
+        complete = False
+
+        try:
+            if provider == "anthropic":
+                with self.providers["anthropic"].messages.stream(
+                    **_anthropic_kwargs(model, messages, temperature, max_tokens, response_format)
+                ) as stream:
+                    headers = getattr(getattr(stream, "response", None), "headers", None)
+                    for event in stream:
+                        if event.type != "content_block_delta":
+                            continue
+                        # 텍스트 응답은 text, 구조화 출력(tool 호출)은 partial_json으로 온다
+                        text = getattr(event.delta, "text", None) or getattr(event.delta, "partial_json", None)
+                        if not text:
+                            continue
+                        parts.append(text)
+                        if on_delta(text):
+                            break
+                    # 남은 이벤트를 소진하고 최종 메시지의 usage를 받는다
+                    usage = _normalize_anthropic_response(stream.get_final_message())["usage"]
+            else:
+                call_kwargs = _openai_kwargs(
+                    provider, model, messages, thinking, thinking_effort,
+                    temperature, max_tokens, response_format, **kwargs,
+                )
+                if provider == "openai":
+                    call_kwargs["stream_options"] = {"include_usage": True}
+                stream = self.providers[provider].chat.completions.create(**call_kwargs, stream=True)
+                headers = getattr(getattr(stream, "response", None), "headers", None)
+                try:
+                    for chunk in stream:
+                        if chunk.usage is not None:
+                            usage = _openai_usage(chunk.usage)
+                        # 완결 후에는 include_usage 조각이 올 때까지 읽기만 한다
+                        if complete or not chunk.choices:
+                            continue
+                        text = chunk.choices[0].delta.content or ""
+                        if not text:
+                            continue
+                        parts.append(text)
+                        complete = bool(on_delta(text))
+                finally:
+                    stream.close()
+        except Exception as exc:
+            elapsed = time.perf_counter() - started
+            LOGGER.warning(
+                "[%s] stream aborted model=%s elapsed=%.2fs chars=%d: %s",
+                provider.upper(), model, elapsed, sum(map(len, parts)), exc,
+            )
+            _observe_call(limiter, provider, model, queue_wait_s, elapsed, exc=exc)
+            raise
 
-        call_kwargs: dict[str, Any] = {
+        elapsed = time.perf_counter() - started
+        LOGGER.info("[%s] done (stream) model=%s elapsed=%.2fs", provider.upper(), model, elapsed)
+        result = {
+            "choices": [{"message": {"content": "".join(parts), "role": "assistant"}}],
             "model": model,
-            "messages": messages,
+            "usage": usage,
         }
+        _observe_call(limiter, provider, model, queue_wait_s, elapsed, headers=headers, result=result)
+        return result
 
-        if is_gpt5:
-            call_kwargs["max_completion_tokens"] = max_tokens
-        else:
-            call_kwargs["max_tokens"] = max_tokens
-            call_kwargs["temperature"] = temperature
-
-        if thinking and is_gpt5:
-            call_kwargs["reasoning_effort"] = thinking_effort
+    async def achat_completion(
+        self,
+        provider: str,
+        model: str,
+        messages: list[dict[str, str]],
+        thinking: bool = False,
+        thinking_effort: str = "medium",
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        response_format: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """chat_completion의 비동기 버전 (반환 형태 동일)."""
+        self._check_provider(provider, self.async_providers)
 
-        if response_format:
-            call_kwargs["response_format"] = response_format
+        limiter = get_rate_limiter()
+        queue_wait_s = (
+            await limiter.aacquire(provider, model, estimate_request_tokens(messages, max_tokens, model))
+            if limiter else 0.0
+        )
 
-        call_kwargs.update(kwargs)
+        started = time.perf_counter()
+        LOGGER.info(
+            "[%s] start (async) model=%s messages=%d thinking=%s",
+            provider.upper(), model, len(messages), thinking,
+        )
 
-        response = client.chat.completions.create(**call_kwargs)
+        try:
+            client = self.async_providers[provider]
+            if provider == "anthropic":
+                raw = await client.messages.with_raw_response.create(
+                    **_anthropic_kwargs(model, messages, temperature, max_tokens, response_format)
+                )
+                result = _normalize_anthropic_response(await _aparse(raw))
+            else:
+                raw = await client.chat.completions.with_raw_response.create(
+                    **_openai_kwargs(
+                        provider, model, messages, thinking, thinking_effort,
+                        temperature, max_tokens, response_format, **kwargs,
+                    )
+                )
+                result = _normalize_openai_response(await _aparse(raw))
+        except Exception as exc:
+            elapsed = time.perf_counter() - started
+            LOGGER.error(
+                "[%s] error (async) model=%s elapsed=%.2fs: %s",
+                provider.upper(), model, elapsed, exc,
+            )
+            _observe_call(limiter, provider, model, queue_wait_s, elapsed, exc=exc)
+            raise
 
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": response.choices[0].message.content,
-                        "role": response.choices[0].message.role,
-                    }
-                }
-            ],
-            "model": response.model,
-            "usage": {
-                "prompt_tokens": getattr(response.usage, 'prompt_tokens', 0),
-                "completion_tokens": getattr(response.usage, 'completion_tokens', 0),
-            },
-        }
+        elapsed = time.perf_counter() - started
+        LOGGER.info("[%s] done (async) model=%s elapsed=%.2fs", provider.upper(), model, elapsed)
+        _observe_call(limiter, provider, model, queue_wait_s, elapsed, headers=raw.headers, result=result)
+        return result
 
-    def _call_anthropic(
-        self, model: str, messages: list[dict], temperature: float, max_tokens: int,
+    async def achat_completion_hedged(
+        self,
+        policy: HedgePolicy,
+        key: str,
+        **call_kwargs: Any,
     ) -> dict[str, Any]:
-        """Anthropic Claude API 호출."""
-        client = self._anthropic_client
-
-        system_msg = ""
-        user_messages = []
-        for msg in messages:
-            if msg["role"] == "system":
-                system_msg += msg["content"] + "\n"
-            else:
-                user_messages.append(msg)
+        """achat_completion + hedging. ``key`` (프롬프트명) 단위로 지연 분포와 예산을 관리한다."""
+        provider, model = call_kwargs["provider"], call_kwargs["model"]
+        after_s = policy.after_s
+        if after_s is None:
+            after_s = self.latency.percentile(key, policy.percentile) or LLM_HEDGE_DEFAULT_AFTER_S
+
+        backup_kwargs = dict(call_kwargs)
+        if policy.provider and policy.provider in self.async_providers:
+            backup_kwargs["provider"] = policy.provider
+            backup_kwargs["model"] = policy.model or model
+
+        async def primary() -> dict[str, Any]:
+            started = time.perf_counter()
+            result = await self.achat_completion(**call_kwargs)
+            self.latency.observe(key, time.perf_counter() - started)
+            return result
+
+        def allow_backup() -> bool:
+            if not self.hedge_budget.try_acquire(key, policy.budget):
+                LOGGER.info("[hedge] %s 예산 소진 → 1차 요청 대기", key)
+                return False
+            LOGGER.info(
+                "[hedge] %s %s/%s %.1fs 초과 또는 실패 → %s/%s 중복 요청",
+                key, provider, model, after_s, backup_kwargs["provider"], backup_kwargs["model"],
+            )
+            record_llm_hedge()
+            return True
 
-        if not user_messages:
-            user_messages = [{"role": "user", "content": "위 지시사항을 수행해주세요."}]
+        self.hedge_budget.count_call(key)
+        return await hedged_call(primary, lambda: self.achat_completion(**backup_kwargs), after_s, allow_backup)
 
-        call_kwargs: dict[str, Any] = {
-            "model": model,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "messages": user_messages,
-        }
+    def _call_openai_compatible(
+        self, provider: str, model: str, messages: list[dict], thinking: bool,
+        thinking_effort: str, temperature: float, max_tokens: int,
+        response_format: Optional[dict], **kwargs: Any,
+    ) -> tuple[dict[str, Any], Mapping[str, str]]:
+        """OpenAI 호환 API 호출 (OpenAI, Perplexity). (정규화 응답, 응답 헤더) 반환."""
+        client = self.providers[provider]
+        raw = client.chat.completions.with_raw_response.create(
+            **_openai_kwargs(
+                provider, model, messages, thinking, thinking_effort,
+                temperature, max_tokens, response_format, **kwargs,
+            )
+        )
+        return _normalize_openai_response(raw.parse()), raw.headers
+
+    def _call_anthropic(
+        self, model: str, messages: list[dict], temperature: float, max_tokens: int,
+        response_format: Optional[dict] = None,
+    ) -> tuple[dict[str, Any], Mapping[str, str]]:
+        """Anthropic Claude API 호출. (정규화 응답, 응답 헤더) 반환."""
+        raw = self.providers["anthropic"].messages.with_raw_response.create(
+            **_anthropic_kwargs(model, messages, temperature, max_tokens, response_format)
+        )
+        return _normalize_anthropic_response(raw.parse()), raw.headers
+
+
+def _observe_call(
+    limiter: Optional[RateLimiter],
+    provider: str,
+    model: str,
+    queue_wait_s: float,
+    latency_s: float,
+    headers: Optional[Mapping[str, str]] = None,
+    result: Optional[dict[str, Any]] = None,
+    exc: Optional[BaseException] = None,
+) -> None:
+    """호출 결과를 rate limiter 보정과 노드별 LLM 통계에 반영."""
+    if limiter is not None:
+        if exc is not None:
+            limiter.observe_error(provider, model, exc)
+        else:
+            limiter.update_from_headers(provider, model, headers)
+    record_llm_call(
+        model=model,
+        queue_wait_s=queue_wait_s,
+        latency_s=latency_s,
+        error=exc is not None,
+        **normalize_usage((result or {}).get("usage")),
+    )
+
+
+# ── 요청 빌더 / 응답 정규화 (동기·비동기 공용) ──
+
+def _openai_kwargs(
+    provider: str, model: str, messages: list[dict], thinking: bool,
+    thinking_effort: str, temperature: float, max_tokens: int,
+    response_format: Optional[dict], **kwargs: Any,
+) -> dict[str, Any]:
+    is_gpt5 = provider == "openai" and "gpt-5" in model
+
+    call_kwargs: dict[str, Any] = {
+        "model": model,
+        # cache_prefix 표식은 내부용 — OpenAI는 동일 prefix를 자동 캐시하므로 순서만 유지하면 된다
+        "messages": [{"role": m["role"], "content": m["content"]} for m in messages],
+    }
+
+    if is_gpt5:
+        call_kwargs["max_completion_tokens"] = max_tokens
+    else:
+        call_kwargs["max_tokens"] = max_tokens
+        call_kwargs["temperature"] = temperature
+
+    if thinking and is_gpt5:
+        call_kwargs["reasoning_effort"] = thinking_effort
+
+    if response_format:
+        call_kwargs["response_format"] = response_format
+
+    call_kwargs.update(kwargs)
+    return call_kwargs
+
+
+def _openai_usage(usage: Any) -> dict[str, int]:
+    details = getattr(usage, "prompt_tokens_details", None)
+    completion_details = getattr(usage, "completion_tokens_details", None)
+    return {
+        "prompt_tokens": getattr(usage, 'prompt_tokens', 0),
+        "completion_tokens": getattr(usage, 'completion_tokens', 0),
+        "cached_tokens": getattr(details, "cached_tokens", None) or 0,
+        "reasoning_tokens": getattr(completion_details, "reasoning_tokens", None) or 0,
+    }
+
+
+def _normalize_openai_response(response: Any) -> dict[str, Any]:
+    return {
+        "choices": [
+            {
+                "message": {
+                    "content": response.choices[0].message.content,
+                    "role": response.choices[0].message.role,
+                }
+            }
+        ],
+        "model": response.model,
+        "usage": _openai_usage(response.usage),
+    }
+
+
+async def _aparse(raw: Any) -> Any:
+    """with_raw_response 결과 파싱. OpenAI 레거시 응답은 동기, Anthropic AsyncAPIResponse는 코루틴."""
+    parsed = raw.parse()
+    if inspect.isawaitable(parsed):
+        parsed = await parsed
+    return parsed
+
+
+@functools.lru_cache(maxsize=1)
+def _anthropic_sdk_accepts_temperature() -> bool:
+    """설치된 anthropic SDK의 messages.create가 ``temperature`` 인자를 받는지."""
+    try:
+        from anthropic.resources.messages import Messages
+    except ImportError:
+        return True
+    return "temperature" in inspect.signature(Messages.create).parameters
+
+
+def _anthropic_kwargs(
+    model: str, messages: list[dict], temperature: float, max_tokens: int,
+    response_format: Optional[dict] = None,
+) -> dict[str, Any]:
+    system_msg = ""
+    prefix_blocks: list[dict[str, Any]] = []
+    user_messages = []
+    for msg in messages:
+        if msg["role"] == "system" and msg.get("cache_prefix"):
+            prefix_blocks.append({"type": "text", "text": msg["content"]})
+        elif msg["role"] == "system":
+            system_msg += msg["content"] + "\n"
+        else:
+            user_messages.append(msg)
+
+    if not user_messages:
+        user_messages = [{"role": "user", "content": "위 지시사항을 수행해주세요."}]
+
+    call_kwargs: dict[str, Any] = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "messages": user_messages,
+    }
+    if _anthropic_sdk_accepts_temperature():
+        call_kwargs["temperature"] = temperature
+    else:
+        # 최신 SDK는 create() 시그니처에서 temperature를 뺐다 → 요청 본문으로 그대로 전달
+        call_kwargs["extra_body"] = {"temperature": temperature}
+    if prefix_blocks:
+        # 공유 컨텍스트 뒤에 캐시 breakpoint → 같은 컨텍스트를 쓰는 다른 프롬프트도 적중
+        prefix_blocks[-1]["cache_control"] = {"type": "ephemeral"}
         if system_msg.strip():
-            call_kwargs["system"] = system_msg.strip()
-
-        response = client.messages.create(**call_kwargs)
-
-        content = ""
-        for block in response.content:
-            if hasattr(block, "text"):
-                content += block.text
-
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": content,
-                        "role": "assistant",
-                    }
+            prefix_blocks.append({"type": "text", "text": system_msg.strip()})
+        call_kwargs["system"] = prefix_blocks
+    elif system_msg.strip():
+        call_kwargs["system"] = system_msg.strip()
+
+    if response_format and response_format.get("type") == "json_schema":
+        # Anthropic은 JSON Schema 출력을 강제 tool 호출로 받는다 (tool 입력 = 결과 JSON)
+        spec = response_format["json_schema"]
+        call_kwargs["tools"] = [{
+            "name": spec["name"],
+            "description": "결과를 이 스키마에 맞춰 반환한다.",
+            "input_schema": spec["schema"],
+        }]
+        call_kwargs["tool_choice"] = {"type": "tool", "name": spec["name"]}
+    return call_kwargs
+
+
+def _normalize_anthropic_response(response: Any) -> dict[str, Any]:
+    cache_read = getattr(response.usage, "cache_read_input_tokens", None) or 0
+    cache_write = getattr(response.usage, "cache_creation_input_tokens", None) or 0
+    content = ""
+    for block in response.content:
+        if hasattr(block, "text"):
+            content += block.text
+        elif getattr(block, "type", "") == "tool_use":
+            content += json.dumps(block.input, ensure_ascii=False)
+
+    return {
+        "choices": [
+            {
+                "message": {
+                    "content": content,
+                    "role": "assistant",
                 }
-            ],
-            "model": response.model,
-            "usage": {
-                "prompt_tokens": getattr(response.usage, 'input_tokens', 0),
-                "completion_tokens": getattr(response.usage, 'output_tokens', 0),
-            },
-        }
+            }
+        ],
+        "model": response.model,
+        "usage": {
+            # Anthropic input_tokens는 캐시 읽기/쓰기분을 제외하므로 합산해 OpenAI와 기준을 맞춘다
+            "prompt_tokens": (getattr(response.usage, 'input_tokens', 0) or 0) + cache_read + cache_write,
+            "completion_tokens": getattr(response.usage, 'output_tokens', 0),
+            "cached_tokens": cache_read,
+            "cache_write_tokens": cache_write,
+        },
+    }
+
+
+# ── 공용 이벤트 루프 ──
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """프로세스 공용 이벤트 루프 (데몬 스레드에서 상시 실행)."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="llm-event-loop", daemon=True).start()
+    return _loop
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """동기 코드에서 코루틴을 공용 루프에 올리고 결과를 기다린다.
+
+    비동기 클라이언트를 항상 같은 루프에서 쓰므로 커넥션 풀이 재사용된다.
+    여러 호출을 동시에 돌리려면 ``asyncio.gather`` 로 묶어서 한 번에 넘긴다.
+    """
+    loop = get_event_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError("run_async()는 공용 루프 안에서 호출할 수 없습니다. await를 사용하세요.")
+
+    # 호출 스레드의 contextvar(노드별 LLM 통계 등)를 루프 쪽 task에 그대로 전달
+    ctx = contextvars.copy_context()
+
+    async def _in_caller_context() -> T:
+        for var, value in ctx.items():
+            var.set(value)
+        return await coro
+
+    return asyncio.run_coroutine_threadsafe(_in_caller_context(), loop).result()
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,145 @@
+"""프롬프트 변수 직렬화 + 변수별 토큰 예산.
+
+dict/list 변수는 공백 없는 compact JSON으로 직렬화한다 (indent 공백만큼 입력 토큰 절약).
+프롬프트 frontmatter로 변수별 예산을 줄 수 있다::
+
+    max_tokens.curated_context: 1500
+    low_priority.curated_context: evidence_source_urls,source_ids,url
+
+예산을 넘으면 구조를 유지한 채 줄인다.
+
+1. ``low_priority`` 에 나열한 필드를 앞에서부터 (어느 깊이에 있든) 제거한다.
+2. 가장 큰 리스트의 뒤쪽 항목을 덜어낸다. 리스트는 중요도 순이라고 가정한다.
+3. 가장 긴 문자열의 뒷부분을 자른다.
+
+JSON 문자열로 넘긴 변수도 파싱해서 같은 방식으로 줄인다.
+cache_prefix 변수에 예산을 걸면 그 변수를 공유하는 모든 프롬프트에 같은 예산을 줘야
+prefix가 동일하게 유지된다.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import math
+from typing import Any, Optional
+
+from .json_parsing import loads
+from .tokenizer import count_tokens
+
+LOGGER = logging.getLogger(__name__)
+
+_ELLIPSIS = "…"
+_MIN_STRING_CHARS = 40  # 이보다 짧은 문자열은 자르지 않는다
+
+
+def serialize_variable(value: Any) -> str:
+    """dict/list → compact JSON, 나머지는 str()."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return str(value)
+
+
+def variable_budgets(meta: dict[str, Any]) -> dict[str, tuple[int, tuple[str, ...]]]:
+    """frontmatter extra → {변수명: (최대 토큰, 우선 제거 필드)}."""
+    budgets: dict[str, tuple[int, tuple[str, ...]]] = {}
+    for key, value in meta.items():
+        if not key.startswith("max_tokens."):
+            continue
+        name = key.partition(".")[2]
+        try:
+            limit = int(value)
+        except (TypeError, ValueError):
+            LOGGER.warning("frontmatter %s 값 무시: %r", key, value)
+            continue
+        drop = tuple(f.strip() for f in str(meta.get(f"low_priority.{name}", "")).split(",") if f.strip())
+        budgets[name] = (limit, drop)
+    return budgets
+
+
+def _drop_key(node: Any, key: str) -> None:
+    if isinstance(node, dict):
+        node.pop(key, None)
+        for value in node.values():
+            _drop_key(value, key)
+    elif isinstance(node, list):
+        for value in node:
+            _drop_key(value, key)
+
+
+def _largest(node: Any, parent: Any = None, key: Any = None) -> Optional[tuple[int, Any, Any]]:
+    """줄일 수 있는 가장 큰 리스트(2개 이상)/문자열의 (직렬화 크기, 부모, 키)."""
+    best: Optional[tuple[int, Any, Any]] = None
+    if isinstance(node, str):
+        if len(node) > _MIN_STRING_CHARS and parent is not None:
+            best = (len(node), parent, key)
+        return best
+    children = node.items() if isinstance(node, dict) else enumerate(node) if isinstance(node, list) else ()
+    if isinstance(node, list) and len(node) > 1 and parent is not None:
+        best = (len(serialize_variable(node)), parent, key)
+    for child_key, child in children:
+        found = _largest(child, node, child_key)
+        if found is not None and (best is None or found[0] > best[0]):
+            best = found
+    return best
+
+
+def _shrink(value: Any, limit: int) -> Any:
+    """직렬화 길이가 ``limit`` 자 이하가 될 때까지 가장 큰 리스트/문자열을 줄인다."""
+    root = [value]  # 루트 자체도 부모가 있는 노드로 다룬다
+    while True:
+        excess = len(serialize_variable(root[0])) - limit
+        if excess <= 0:
+            return root[0]
+        found = _largest(root[0], root, 0)
+        if found is None:
+            return root[0]
+        size, parent, key = found
+        node = parent[key]
+        if isinstance(node, str):
+            parent[key] = node[: max(_MIN_STRING_CHARS, len(node) - excess - len(_ELLIPSIS))] + _ELLIPSIS
+        else:
+            # 크기 비례로 여러 항목을 한 번에 덜어내되 최소 1개는 남긴다
+            remove = max(1, math.ceil(len(node) * excess / max(size, 1)))
+            del node[max(1, len(node) - remove):]
+
+
+def fit_variable(value: Any, max_tokens: int, model: str = "", low_priority: tuple[str, ...] = ()) -> str:
+    """``value`` 를 직렬화하고, ``max_tokens`` 를 넘으면 구조를 유지한 채 줄인다."""
+    text = serialize_variable(value)
+    tokens = count_tokens(text, model)
+    if max_tokens <= 0 or tokens <= max_tokens:
+        return text
+
+    # 문자 수로 근사해 반복마다 토큰을 다시 세지 않는다
+    limit = int(len(text) * max_tokens / tokens)
+    if isinstance(value, str):
+        stripped = value.strip()
+        try:
+            value = loads(stripped) if stripped[:1] in ("{", "[") else None
+        except ValueError:
+            value = None
+        if value is None:
+            return text[:limit] + _ELLIPSIS
+    else:
+        value = copy.deepcopy(value)
+
+    for field in low_priority:
+        if len(serialize_variable(value)) <= limit:
+            break
+        _drop_key(value, field)
+    # 잘라낸 부분과 남은 부분의 토큰 밀도가 다를 수 있어 실제 토큰으로 확인하며 더 줄인다.
+    # 직렬화 결과를 문자열로 자르면 JSON이 깨지므로, 더 줄일 곳이 없으면 예산을 넘긴 채 반환한다.
+    fitted = serialize_variable(_shrink(value, limit))
+    fitted_tokens = count_tokens(fitted, model)
+    while fitted_tokens > max_tokens:
+        limit = min(int(len(fitted) * max_tokens / fitted_tokens), len(fitted) - 1)
+        shrunk = serialize_variable(_shrink(value, limit))
+        if len(shrunk) >= len(fitted):
+            LOGGER.warning("프롬프트 변수 예산 초과: 더 줄일 리스트/문자열 없음 (%d > %d tokens)", fitted_tokens, max_tokens)
+            break
+        fitted = shrunk
+        fitted_tokens = count_tokens(fitted, model)
+    LOGGER.info("프롬프트 변수 예산 적용: %d → %d tokens 이하 (%d → %d chars)", tokens, max_tokens, len(text), len(fitted))
+    return fitted
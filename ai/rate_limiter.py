@@ -0,0 +1,208 @@
+"""프로바이더/모델별 LLM 호출 속도 제한 (RPM/TPM 토큰 버킷).
+
+한도는 config의 ``LLM_RATE_LIMITS`` 에서 읽고, 응답의 rate-limit 헤더로
+실제 계정 한도·잔량에 맞춰 스스로 보정한다. 한도를 넘는 호출은 실패시키지 않고
+예약 순서대로 대기시킨 뒤 실행한다 (대기 시간은 호출자에게 반환).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Mapping, Optional
+
+from ..config import LLM_RATE_LIMIT_ENABLED, LLM_RATE_LIMITS
+from .tokenizer import count_tokens
+
+LOGGER = logging.getLogger(__name__)
+
+# 메시지당 role/구분자 오버헤드 근사치
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+class TokenBucket:
+    """분당 ``capacity`` 만큼 채워지는 토큰 버킷.
+
+    ``reserve()`` 는 즉시 차감하고(잔량이 음수가 될 수 있음) 대기해야 할 시간을 돌려준다.
+    음수 잔량이 곧 대기열이므로 먼저 예약한 호출이 먼저 풀린다.
+    """
+
+    def __init__(self, capacity: float) -> None:
+        self.capacity = float(capacity)
+        self.level = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate_per_s(self) -> float:
+        return self.capacity / 60.0
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate_per_s)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.level -= min(amount, self.capacity)
+            wait = -self.level / self.rate_per_s if self.level < 0 else 0.0
+            return max(wait, self._blocked_until - now, 0.0)
+
+    def sync(self, *, limit: Optional[float] = None, remaining: Optional[float] = None) -> None:
+        """헤더로 받은 실제 한도/잔량 반영 (잔량은 줄이는 방향으로만)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if limit and limit > 0 and limit != self.capacity:
+                self.capacity = float(limit)
+            if remaining is not None and remaining < self.level:
+                self.level = float(remaining)
+
+    def block_for(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def parse_rate_limits(spec: str) -> dict[str, tuple[int, int]]:
+    """``"openai=500/500000,openai:gpt-5-mini=500/200000"`` → {키: (RPM, TPM)}."""
+    limits: dict[str, tuple[int, int]] = {}
+    for entry in spec.split(","):
+        key, _, value = entry.strip().partition("=")
+        rpm, _, tpm = value.partition("/")
+        try:
+            limits[key.strip()] = (int(rpm), int(tpm))
+        except ValueError:
+            if entry.strip():
+                LOGGER.warning("LLM_RATE_LIMITS 항목 무시: %r", entry)
+    return limits
+
+
+def _parse_duration_s(value: str) -> Optional[float]:
+    """"1s", "6m0s", "20ms" 같은 OpenAI reset 헤더 또는 RFC3339 시각 → 초."""
+    value = value.strip()
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+        return sum(float(n) * scale[u] for n, u in parts)
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _header_float(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+def estimate_request_tokens(messages: list[dict[str, Any]], max_tokens: int, model: str = "") -> int:
+    """요청이 TPM 한도에서 차지할 토큰 추정 (입력 토큰 + 최대 출력 토큰)."""
+    prompt_tokens = sum(
+        count_tokens(str(m.get("content") or ""), model) + _MESSAGE_OVERHEAD_TOKENS for m in messages
+    )
+    return prompt_tokens + max_tokens
+
+
+class RateLimiter:
+    """provider 및 provider:model 키별 RPM/TPM 버킷 묶음."""
+
+    def __init__(self, limits: dict[str, tuple[int, int]]) -> None:
+        self._buckets: dict[str, tuple[TokenBucket, TokenBucket]] = {
+            key: (TokenBucket(rpm), TokenBucket(tpm)) for key, (rpm, tpm) in limits.items()
+        }
+
+    def _buckets_for(self, provider: str, model: str) -> list[tuple[TokenBucket, TokenBucket]]:
+        return [self._buckets[k] for k in (provider, f"{provider}:{model}") if k in self._buckets]
+
+    def _most_specific(self, provider: str, model: str) -> Optional[tuple[TokenBucket, TokenBucket]]:
+        return self._buckets.get(f"{provider}:{model}") or self._buckets.get(provider)
+
+    def reserve(self, provider: str, model: str, tokens: int) -> float:
+        """호출 1건을 예약하고 실행 전 대기해야 할 시간(초)을 반환."""
+        wait = 0.0
+        for rpm, tpm in self._buckets_for(provider, model):
+            wait = max(wait, rpm.reserve(1), tpm.reserve(tokens))
+        if wait > 0:
+            LOGGER.info("[rate limit] %s/%s 대기 %.2fs (tokens≈%d)", provider, model, wait, tokens)
+        return wait
+
+    def acquire(self, provider: str, model: str, tokens: int) -> float:
+        wait = self.reserve(provider, model, tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, provider: str, model: str, tokens: int) -> float:
+        wait = self.reserve(provider, model, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def update_from_headers(self, provider: str, model: str, headers: Optional[Mapping[str, str]]) -> None:
+        """응답 rate-limit 헤더(OpenAI x-ratelimit-*, Anthropic anthropic-ratelimit-*)로 버킷 보정."""
+        buckets = self._most_specific(provider, model)
+        if not headers or buckets is None:
+            return
+        rpm, tpm = buckets
+        rpm.sync(
+            limit=_header_float(headers, "x-ratelimit-limit-requests", "anthropic-ratelimit-requests-limit"),
+            remaining=_header_float(headers, "x-ratelimit-remaining-requests", "anthropic-ratelimit-requests-remaining"),
+        )
+        tpm.sync(
+            limit=_header_float(headers, "x-ratelimit-limit-tokens", "anthropic-ratelimit-tokens-limit"),
+            remaining=_header_float(headers, "x-ratelimit-remaining-tokens", "anthropic-ratelimit-tokens-remaining"),
+        )
+
+    def observe_error(self, provider: str, model: str, exc: BaseException) -> None:
+        """429 응답이면 retry-after(또는 reset 헤더)만큼 해당 버킷을 막는다."""
+        response = getattr(exc, "response", None)
+        if getattr(exc, "status_code", None) != 429 and getattr(response, "status_code", None) != 429:
+            return
+        buckets = self._most_specific(provider, model)
+        if buckets is None:
+            return
+        headers = getattr(response, "headers", None) or {}
+        self.update_from_headers(provider, model, headers)
+        delay = None
+        for name in ("retry-after", "x-ratelimit-reset-requests", "anthropic-ratelimit-requests-reset"):
+            if headers.get(name):
+                delay = _parse_duration_s(headers[name])
+                if delay is not None:
+                    break
+        delay = delay if delay is not None else 1.0
+        LOGGER.warning("[rate limit] %s/%s 429 수신 → %.2fs 대기", provider, model, delay)
+        for bucket in buckets:
+            bucket.block_for(delay)
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """config 기반 RateLimiter 싱글톤 (비활성 시 None)."""
+    global _limiter
+    if not LLM_RATE_LIMIT_ENABLED:
+        return None
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(parse_rate_limits(LLM_RATE_LIMITS))
+    return _limiter
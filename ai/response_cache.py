@@ -0,0 +1,150 @@
+"""LLM 응답 디스크 캐시 (SQLite).
+
+같은 프롬프트 파일·렌더링된 메시지·호출 파라미터로 다시 호출하면 저장된 응답 텍스트를 돌려준다.
+하위 프롬프트만 고치면서 Interface 2/3를 반복 실행할 때 바뀌지 않은 단계는 즉시 반환된다.
+
+- TTL: 오래된 항목은 조회 시 무시되고, 쓰기 시 정리된다.
+- 용량 제한: 전체 크기가 상한을 넘으면 가장 오래 전에 조회된 항목부터 삭제 (LRU).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from ..config import (
+    LLM_CACHE_BYPASS,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_MB,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_HOURS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def make_response_key(call_kwargs: dict[str, Any], prompt_hash: str) -> str:
+    """(provider, model, messages, temperature, max_tokens, response_format, thinking, 프롬프트 해시) → 키."""
+    material = {
+        "prompt_hash": prompt_hash,
+        **{k: call_kwargs.get(k) for k in (
+            "provider", "model", "messages", "temperature", "max_tokens",
+            "response_format", "thinking", "thinking_effort",
+        )},
+    }
+    return hashlib.sha256(json.dumps(material, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _file_hash(path: str, mtime_ns: int) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def prompt_file_hash(prompts_dir: str | Path, name: str) -> str:
+    """프롬프트 템플릿 파일 내용 해시 (mtime이 바뀔 때만 다시 읽음)."""
+    path = Path(prompts_dir) / f"{name}.md"
+    try:
+        return _file_hash(str(path), path.stat().st_mtime_ns)
+    except OSError:
+        return ""
+
+
+class ResponseCache:
+    """TTL + 용량 제한 SQLite 캐시. 스레드 간 공유 가능."""
+
+    def __init__(self, path: str | Path, ttl_s: Optional[float] = None, max_bytes: Optional[int] = None) -> None:
+        self.path = Path(path)
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if self.ttl_s is not None and now - row[1] > self.ttl_s:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        if self.ttl_s is not None:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_s,))
+        if self.max_bytes is None:
+            return
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # 오래 조회되지 않은 항목부터 상한 아래로 내려갈 때까지 삭제
+        excess = total - self.max_bytes
+        victims: list[str] = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC"):
+            victims.append(key)
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k in victims])
+        LOGGER.info("[LLM 캐시] 용량 초과로 %d건 삭제", len(victims))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """config 기반 캐시 싱글톤 (LLM_CACHE_ENABLED=false면 None)."""
+    global _cache
+    if not LLM_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(
+                LLM_CACHE_PATH,
+                ttl_s=LLM_CACHE_TTL_HOURS * 3600 if LLM_CACHE_TTL_HOURS > 0 else None,
+                max_bytes=int(LLM_CACHE_MAX_MB * 1024 * 1024) if LLM_CACHE_MAX_MB > 0 else None,
+            )
+    return _cache
+
+
+def is_cache_bypassed(prompt_name: str, node_name: str = "") -> bool:
+    """LLM_CACHE_BYPASS(쉼표 구분 노드명/프롬프트명)에 해당하면 캐시를 쓰지 않는다."""
+    bypass = {v.strip() for v in LLM_CACHE_BYPASS.split(",") if v.strip()}
+    return prompt_name in bypass or (bool(node_name) and node_name in bypass)
@@ -0,0 +1,147 @@
+"""LLM 호출의 일시적 오류 재시도 (지수 백오프 + jitter + Retry-After + 실행 단위 예산).
+
+타임아웃, 연결 끊김, 429, 5xx/529(과부하)처럼 다시 보내면 성공할 수 있는 오류만 재시도한다.
+인증·요청 형식 오류(400/401/403/404)는 즉시 전파한다.
+재시도 총량은 실행(run) 단위 예산으로 제한해 장애 시 파이프라인이 무한히 늘어지지 않게 한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from ..config import (
+    LLM_RETRY_BASE_DELAY_S,
+    LLM_RETRY_BUDGET,
+    LLM_RETRY_MAX_ATTEMPTS,
+    LLM_RETRY_MAX_DELAY_S,
+)
+from .llm_metrics import record_llm_retry
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_TRANSIENT_STATUS = frozenset({408, 409, 425, 429, 500, 502, 503, 504, 529})
+# openai/anthropic SDK 공통 예외명 (anthropic은 선택 의존성이라 이름으로 판별)
+_TRANSIENT_TYPES = frozenset({"APIConnectionError", "APITimeoutError", "Timeout", "ConnectionError", "TransportError"})
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_transient(exc: BaseException) -> bool:
+    """다시 보내면 성공할 수 있는 프로바이더 오류인지."""
+    status = _status_code(exc)
+    if status is not None:
+        return status in _TRANSIENT_STATUS
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    return any(cls.__name__ in _TRANSIENT_TYPES for cls in type(exc).__mro__)
+
+
+def retry_after_s(exc: BaseException) -> Optional[float]:
+    """응답의 ``retry-after-ms`` / ``retry-after`` (초 또는 HTTP-date) 헤더."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay_s(attempt: int, exc: BaseException) -> float:
+    """``attempt`` 번째 재시도 대기: Retry-After가 있으면 그 값, 없으면 full-jitter 지수 백오프."""
+    hinted = retry_after_s(exc)
+    if hinted is not None:
+        return min(hinted, LLM_RETRY_MAX_DELAY_S) + random.uniform(0, LLM_RETRY_BASE_DELAY_S)
+    return random.uniform(0, min(LLM_RETRY_MAX_DELAY_S, LLM_RETRY_BASE_DELAY_S * 2 ** (attempt - 1)))
+
+
+class RetryBudget:
+    """실행 단위 재시도 허용 횟수 (모든 노드·스레드 공유)."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+    def reset(self) -> None:
+        with self._lock:
+            self.used = 0
+
+
+_budget = RetryBudget(LLM_RETRY_BUDGET)
+
+
+def get_retry_budget() -> RetryBudget:
+    return _budget
+
+
+def _should_retry(exc: Exception, attempt: int, label: str) -> Optional[float]:
+    """재시도하면 대기 시간(초), 아니면 None."""
+    if not is_transient(exc) or attempt >= LLM_RETRY_MAX_ATTEMPTS:
+        return None
+    if not _budget.try_spend():
+        LOGGER.warning("[retry] %s 실행 단위 재시도 예산(%d) 소진 → 오류 전파", label, _budget.limit)
+        return None
+    delay = backoff_delay_s(attempt, exc)
+    LOGGER.warning(
+        "[retry] %s 일시적 오류 (status=%s, attempt %d/%d) → %.2fs 후 재시도: %s",
+        label, _status_code(exc), attempt, LLM_RETRY_MAX_ATTEMPTS, delay, exc,
+    )
+    return delay
+
+
+def call_with_retry(fn: Callable[[], T], label: str = "") -> T:
+    """``fn()`` 을 일시적 오류에 한해 재시도."""
+    attempt = 1
+    while True:
+        try:
+            return fn()
+        except Exception as exc:
+            delay = _should_retry(exc, attempt, label)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        record_llm_retry(delay)
+        attempt += 1
+
+
+async def acall_with_retry(fn: Callable[[], Awaitable[T]], label: str = "") -> T:
+    """call_with_retry의 비동기 버전."""
+    attempt = 1
+    while True:
+        try:
+            return await fn()
+        except Exception as exc:
+            delay = _should_retry(exc, attempt, label)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        record_llm_retry(delay)
+        attempt += 1
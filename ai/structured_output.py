@@ -0,0 +1,111 @@
+"""프롬프트 frontmatter ``schema:`` → 프로바이더 네이티브 구조화 출력.
+
+``schema`` 값 형식 (쉼표로 여러 키 지정 가능)::
+
+    schema: Framing                       # 루트 = schemas.Framing
+    schema: narrative=NarrativeBody       # {"narrative": NarrativeBody}
+    schema: pages=list[PageDraft]         # {"pages": [PageDraft, ...]}
+
+변환된 JSON Schema는 ``response_format={"type": "json_schema", ...}`` 로 전달되고,
+OpenAI는 strict structured output, Anthropic은 강제 tool 호출로 매핑된다
+(multi_provider_client). 변환 결과는 스펙 문자열/모델 클래스 단위로 캐시한다.
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import logging
+import re
+from typing import Any
+
+from pydantic import BaseModel, create_model
+
+from .. import schemas
+
+LOGGER = logging.getLogger(__name__)
+
+_LIST_TYPE = re.compile(r"^list\[(\w+)\]$")
+_PRIMITIVES: dict[str, type] = {"str": str, "int": int, "float": float, "bool": bool}
+
+
+def _resolve_type(name: str) -> Any:
+    name = name.strip()
+    match = _LIST_TYPE.match(name)
+    if match:
+        return list[_resolve_type(match.group(1))]
+    if name in _PRIMITIVES:
+        return _PRIMITIVES[name]
+    model = getattr(schemas, name, None)
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        raise ValueError(f"schemas.py에 없는 스키마: {name}")
+    return model
+
+
+@functools.lru_cache(maxsize=64)
+def resolve_schema(spec: str) -> type[BaseModel]:
+    """frontmatter ``schema`` 문자열 → Pydantic 모델 클래스."""
+    entries = [e.strip() for e in spec.split(",") if e.strip()]
+    if len(entries) == 1 and "=" not in entries[0]:
+        model = _resolve_type(entries[0])
+        if not (isinstance(model, type) and issubclass(model, BaseModel)):
+            raise ValueError(f"루트 스키마는 모델이어야 합니다: {spec}")
+        return model
+    fields: dict[str, Any] = {}
+    for entry in entries:
+        key, sep, type_name = entry.partition("=")
+        if not sep:
+            raise ValueError(f"schema 항목 형식 오류 (key=Type): {entry}")
+        fields[key.strip()] = (_resolve_type(type_name), ...)
+    name = "PromptOutput_" + hashlib.sha1(spec.encode("utf-8")).hexdigest()[:8]
+    return create_model(name, **fields)
+
+
+def _make_strict(node: Any) -> bool:
+    """JSON Schema를 strict 규칙(모든 속성 required, additionalProperties false)으로 바꾼다.
+
+    자유 형식 객체(dict[str, Any])가 있으면 strict로 표현할 수 없으므로 False 반환.
+    """
+    if isinstance(node, list):
+        return all([_make_strict(value) for value in node])
+    if not isinstance(node, dict):
+        return True
+    strict = True
+    node.pop("default", None)
+    node.pop("title", None)
+    if node.get("type") == "object":
+        if "properties" not in node or node.get("additionalProperties") not in (None, False):
+            strict = False
+        else:
+            node["additionalProperties"] = False
+            node["required"] = list(node["properties"])
+    for key, value in node.items():
+        if key in ("properties", "$defs"):
+            # 필드명/정의명 매핑 — 키 자체가 아니라 값(하위 스키마)만 변환
+            strict = all([_make_strict(sub) for sub in value.values()]) and strict
+        elif isinstance(value, (dict, list)):
+            strict = _make_strict(value) and strict
+    return strict
+
+
+@functools.lru_cache(maxsize=64)
+def _json_schema(model: type[BaseModel]) -> tuple[dict[str, Any], bool]:
+    schema = copy.deepcopy(model.model_json_schema())
+    strict = _make_strict(schema)
+    if not strict:
+        LOGGER.info("스키마 %s는 자유 형식 객체를 포함해 strict=False로 전달", model.__name__)
+    return schema, strict
+
+
+def response_format_for(spec: str, name: str) -> dict[str, Any]:
+    """``schema`` 스펙 → ``{"type": "json_schema", "json_schema": {...}}`` (프로바이더 공통 표현)."""
+    schema, strict = _json_schema(resolve_schema(spec))
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": re.sub(r"[^a-zA-Z0-9_-]", "_", name)[:64],
+            "schema": copy.deepcopy(schema),
+            "strict": strict,
+        },
+    }
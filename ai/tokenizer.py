@@ -0,0 +1,85 @@
+"""토큰 카운터: 모델별 tiktoken 인코딩 기반 토큰 수 계산.
+
+tiktoken 미설치 또는 BPE 파일 로드 실패 시에는 문자 종류별 휴리스틱으로 대체한다.
+(한글 등 비 ASCII 문자는 1자 ≈ 1토큰, ASCII는 4자 ≈ 1토큰)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+# encoding_for_model()이 모르는 신규/타사 모델용 prefix → 인코딩 매핑
+_ENCODING_BY_PREFIX = (
+    ("gpt-5", "o200k_base"),
+    ("gpt-4.1", "o200k_base"),
+    ("gpt-4o", "o200k_base"),
+    ("o1", "o200k_base"),
+    ("o3", "o200k_base"),
+    ("o4", "o200k_base"),
+)
+_DEFAULT_ENCODING = "cl100k_base"
+
+# 토큰 수 캐시: 긴 뉴스 블록·프롬프트 원문을 붙잡아 두지 않도록 텍스트 해시로 키를 잡는다
+_COUNT_CACHE_SIZE = 4096
+_count_cache: OrderedDict[tuple[bytes, str], int] = OrderedDict()
+_count_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _get_encoding(model: str) -> Optional[Any]:
+    """모델명 → tiktoken Encoding (프로세스당 1회 로드). 사용 불가 시 None."""
+    try:
+        import tiktoken
+    except ImportError:
+        LOGGER.info("tiktoken 미설치 - 휴리스틱 토큰 추정 사용 (pip install tiktoken)")
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception as e:
+        LOGGER.warning("tiktoken 인코딩 로드 실패 (model=%s), 휴리스틱 사용: %s", model, e)
+        return None
+
+    name = next(
+        (enc for prefix, enc in _ENCODING_BY_PREFIX if model.lower().startswith(prefix)),
+        _DEFAULT_ENCODING,
+    )
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        LOGGER.warning("tiktoken 인코딩 로드 실패 (%s), 휴리스틱 사용: %s", name, e)
+        return None
+
+
+def _heuristic_tokens(text: str) -> int:
+    """문자 종류별 토큰 수 근사. 한글은 글자당 1토큰 이상이 되는 경우가 많다."""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (len(text) - ascii_chars) + (ascii_chars + 3) // 4
+
+
+def count_tokens(text: str, model: str = "") -> int:
+    """텍스트의 토큰 수를 모델 인코딩 기준으로 계산."""
+    if not text:
+        return 0
+    key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), model)
+    with _count_cache_lock:
+        if key in _count_cache:
+            _count_cache.move_to_end(key)
+            return _count_cache[key]
+
+    encoding = _get_encoding(model or "gpt-4o")
+    tokens = _heuristic_tokens(text) if encoding is None else len(encoding.encode(text, disallowed_special=()))
+    with _count_cache_lock:
+        _count_cache[key] = tokens
+        if len(_count_cache) > _COUNT_CACHE_SIZE:
+            _count_cache.popitem(last=False)
+    return tokens
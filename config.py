@@ -28,10 +28,61 @@ DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "claude-sonnet-4-20250514")
 CHART_MODEL = os.getenv("CHART_MODEL", "gpt-4o-mini")
 CHART_AGENT_MODEL = os.getenv("CHART_AGENT_MODEL", "gpt-5-mini")
 
+# ── LLM Rate Limit (분당 요청 수 RPM / 분당 토큰 수 TPM) ──
+# "provider=RPM/TPM" 또는 "provider:model=RPM/TPM", 쉼표 구분. 모델 항목은 provider 한도와 함께 적용.
+# 응답 헤더(x-ratelimit-*, anthropic-ratelimit-*)로 실제 계정 한도에 맞춰 자동 보정된다.
+LLM_RATE_LIMIT_ENABLED = os.getenv("LLM_RATE_LIMIT_ENABLED", "true").lower() in {"true", "1", "yes", "on"}
+LLM_RATE_LIMITS = os.getenv("LLM_RATE_LIMITS", "openai=500/500000,anthropic=50/80000,perplexity=50/200000")
+
+# ── LLM 일시적 오류 재시도 (timeout, 연결 끊김, 429, 5xx) ──
+# 지수 백오프(full jitter) + Retry-After 존중. BUDGET은 실행(run) 전체의 재시도 허용 횟수.
+LLM_RETRY_MAX_ATTEMPTS = int(os.getenv("LLM_RETRY_MAX_ATTEMPTS", "4"))
+LLM_RETRY_BASE_DELAY_S = float(os.getenv("LLM_RETRY_BASE_DELAY_S", "1.0"))
+LLM_RETRY_MAX_DELAY_S = float(os.getenv("LLM_RETRY_MAX_DELAY_S", "30"))
+LLM_RETRY_BUDGET = int(os.getenv("LLM_RETRY_BUDGET", "30"))
+
+# ── LLM 비용 추정 단가 (USD / 1M 토큰: 입력/캐시 입력/출력, 모델명 접두사 최장 일치) ──
+LLM_PRICING = os.getenv(
+    "LLM_PRICING",
+    "gpt-5-mini=0.25/0.025/2.0,gpt-5-nano=0.05/0.005/0.4,gpt-5.2=1.75/0.175/14.0,gpt-5=1.25/0.125/10.0,"
+    "gpt-4o-mini=0.15/0.075/0.6,claude-sonnet-4=3.0/0.3/15.0,claude-haiku-4-5=1.0/0.1/5.0,sonar=1.0/1.0/1.0",
+)
+
+# ── LLM 요청 hedging (꼬리 지연 완화) ──
+# 1차 요청이 프롬프트별 지연 p{PERCENTILE}를 넘기면 중복 요청을 보내고 먼저 끝난 쪽을 사용.
+# 표본이 MIN_SAMPLES 미만이면 DEFAULT_AFTER_S를 임계값으로 사용. BUDGET은 전체 호출 대비 중복 요청 비율 상한.
+LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "false").lower() in {"true", "1", "yes", "on"}
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_DEFAULT_AFTER_S = float(os.getenv("LLM_HEDGE_DEFAULT_AFTER_S", "60"))
+LLM_HEDGE_BUDGET = float(os.getenv("LLM_HEDGE_BUDGET", "0.1"))
+
+# ── Mock LLM 프로바이더 (오프라인 부하·동시성 테스트) ──
+# ENABLED=true면 call_llm_with_prompt 호출을 실제 API 대신 "mock" 프로바이더로 보낸다.
+# 노드·rate limiter·재시도·hedging 경로는 live와 같고, 한도는 LLM_RATE_LIMITS의 mock=RPM/TPM 항목으로 지정.
+# LATENCY: "fixed:초" | "uniform:최소:최대" | "lognormal:중앙값:sigma"
+# ERROR_RATES: "429=0.05,timeout=0.02,503=0.01" (호출당 확률)
+# COMPLETION_TOKENS: 응답당 출력 토큰 수 (0이면 응답 텍스트로 계산)
+# RESPONSES_DIR: <프롬프트명>.json 고정 응답 (기본: ai/mock_responses — schema 없는 프롬프트용.
+#   파일이 없으면 프롬프트 schema로 생성, schema도 없으면 {})
+LLM_MOCK_ENABLED = os.getenv("LLM_MOCK_ENABLED", "false").lower() in {"true", "1", "yes", "on"}
+LLM_MOCK_LATENCY = os.getenv("LLM_MOCK_LATENCY", "lognormal:1.0:0.5")
+LLM_MOCK_ERROR_RATES = os.getenv("LLM_MOCK_ERROR_RATES", "")
+LLM_MOCK_COMPLETION_TOKENS = int(os.getenv("LLM_MOCK_COMPLETION_TOKENS", "0"))
+LLM_MOCK_RESPONSES_DIR = os.getenv("LLM_MOCK_RESPONSES_DIR", str(INTERFACE_DIR / "ai" / "mock_responses"))
+
 # ── 경로 ──
 OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", str(Path(__file__).parent / "output")))
 PROMPTS_DIR = Path(__file__).parent / "prompts" / "templates"
 
+# ── LLM 응답 캐시 (call_llm_with_prompt, opt-in) ──
+# LLM_CACHE_BYPASS: 캐시를 쓰지 않을 노드명/프롬프트명 (쉼표 구분)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "false").lower() in {"true", "1", "yes", "on"}
+LLM_CACHE_PATH = Path(os.getenv("LLM_CACHE_PATH", str(INTERFACE_DIR / "data" / "cache" / "llm_responses.sqlite")))
+LLM_CACHE_TTL_HOURS = float(os.getenv("LLM_CACHE_TTL_HOURS", "168"))
+LLM_CACHE_MAX_MB = float(os.getenv("LLM_CACHE_MAX_MB", "256"))
+LLM_CACHE_BYPASS = os.getenv("LLM_CACHE_BYPASS", "")
+
 # ── 색상 팔레트 ──
 COLOR_PALETTE = ["#FF6B35", "#004E89", "#1A936F", "#C5D86D", "#8B95A1"]
 
@@ -72,17 +123,42 @@ OPENAI_PHASE1_TEMPERATURE = float(os.getenv("OPENAI_PHASE1_TEMPERATURE", "0.3"))
 OPENAI_PHASE1_MAX_COMPLETION_TOKENS = int(os.getenv("OPENAI_PHASE1_MAX_COMPLETION_TOKENS", "3000"))
 OPENAI_PHASE1_CHUNK_TARGET_INPUT_TOKENS = int(os.getenv("OPENAI_PHASE1_CHUNK_TARGET_INPUT_TOKENS", "3200"))
 OPENAI_PHASE1_SUMMARY_MAX_RETRIES = int(os.getenv("OPENAI_PHASE1_SUMMARY_MAX_RETRIES", "1"))
+OPENAI_PHASE1_MAP_CONCURRENCY = int(os.getenv("OPENAI_PHASE1_MAP_CONCURRENCY", "8"))
+OPENAI_PHASE1_CACHE_ENABLED = os.getenv("OPENAI_PHASE1_CACHE_ENABLED", "true").lower() in {"true", "1", "yes", "on"}
+OPENAI_PHASE1_CACHE_TTL_HOURS = float(os.getenv("OPENAI_PHASE1_CACHE_TTL_HOURS", "48"))
+OPENAI_PHASE1_CACHE_MAX_MB = float(os.getenv("OPENAI_PHASE1_CACHE_MAX_MB", "64"))
+# 내용 기반 청크 경계: 재실행 시 새 기사가 든 구간의 청크만 캐시 미스가 난다. 청크 크기는 앵커 사이 구간 안에서 고르게 맞춘다.
+# false면 전체 균등 분할 — 기사가 추가되면 경계가 밀려 대부분 다시 요약한다.
+OPENAI_PHASE1_STABLE_CHUNKS = os.getenv("OPENAI_PHASE1_STABLE_CHUNKS", "true").lower() in {"true", "1", "yes", "on"}
+OPENAI_PHASE1_STREAM = os.getenv("OPENAI_PHASE1_STREAM", "true").lower() in {"true", "1", "yes", "on"}
+# reasoning 모델은 생각하는 동안 이벤트를 보내지 않으므로 두 한도 모두 비스트리밍 전체 타임아웃(90초)보다 짧게 두지 않는다
+OPENAI_PHASE1_STREAM_FIRST_TOKEN_TIMEOUT_S = float(os.getenv("OPENAI_PHASE1_STREAM_FIRST_TOKEN_TIMEOUT_S", "90"))
+OPENAI_PHASE1_STREAM_STALL_TIMEOUT_S = float(os.getenv("OPENAI_PHASE1_STREAM_STALL_TIMEOUT_S", "90"))
+
+# ── OpenAI Batch API (야간 백필용 비동기 제출) ──
+OPENAI_BATCH_MODE = os.getenv("OPENAI_BATCH_MODE", "false").lower() in {"true", "1", "yes", "on"}
+OPENAI_BATCH_BASE_URL = os.getenv("OPENAI_BATCH_BASE_URL", "https://api.openai.com/v1")
+OPENAI_BATCH_POLL_INTERVAL_S = float(os.getenv("OPENAI_BATCH_POLL_INTERVAL_S", "30"))
+OPENAI_BATCH_TIMEOUT_S = float(os.getenv("OPENAI_BATCH_TIMEOUT_S", "86400"))
 
 # ── Phase 2: GPT-5.2 Web Search 큐레이션 ──
 OPENAI_PHASE2_MODEL = os.getenv("OPENAI_PHASE2_MODEL", "gpt-5.2")
 OPENAI_PHASE2_TEMPERATURE = float(os.getenv("OPENAI_PHASE2_TEMPERATURE", "0.2"))
 OPENAI_PHASE2_MAX_OUTPUT_TOKENS = int(os.getenv("OPENAI_PHASE2_MAX_OUTPUT_TOKENS", "10000"))
+OPENAI_PHASE2_CACHE_ENABLED = os.getenv("OPENAI_PHASE2_CACHE_ENABLED", "true").lower() in {"true", "1", "yes", "on"}
+OPENAI_PHASE2_CACHE_TTL_HOURS = float(os.getenv("OPENAI_PHASE2_CACHE_TTL_HOURS", "24"))
+OPENAI_PHASE2_CACHE_MAX_MB = float(os.getenv("OPENAI_PHASE2_CACHE_MAX_MB", "64"))
+OPENAI_PHASE2_STREAM = os.getenv("OPENAI_PHASE2_STREAM", "true").lower() in {"true", "1", "yes", "on"}
+OPENAI_PHASE2_INPUT_TOKEN_BUDGET = int(os.getenv("OPENAI_PHASE2_INPUT_TOKEN_BUDGET", "12000"))
 
 # ── Research PDF 요약 ──
 OPENAI_RESEARCH_MODEL = os.getenv("OPENAI_RESEARCH_MODEL", "gpt-5-mini")
 OPENAI_RESEARCH_TEMPERATURE = float(os.getenv("OPENAI_RESEARCH_TEMPERATURE", "0.3"))
 OPENAI_RESEARCH_MAX_OUTPUT_TOKENS = int(os.getenv("OPENAI_RESEARCH_MAX_OUTPUT_TOKENS", "2400"))
 
+# ── 뉴스 근접 중복 묶기 (SimHash 해밍 거리, 음수면 비활성) ──
+NEWS_DEDUP_MAX_HAMMING = int(os.getenv("NEWS_DEDUP_MAX_HAMMING", "6"))
+
 # ── Curation ──
 CURATED_TOPICS_MAX = int(os.getenv("CURATED_TOPICS_MAX", "5"))
 SELECTED_STOCKS_MAX = int(os.getenv("SELECTED_STOCKS_MAX", "10"))
@@ -90,6 +166,8 @@ SELECTED_STOCKS_MAX = int(os.getenv("SELECTED_STOCKS_MAX", "10"))
 # ── 데이터 경로 ──
 NEWS_DATA_DIR = Path(os.getenv("NEWS_DATA_DIR", str(INTERFACE_DIR / "data" / "news")))
 RESEARCH_DATA_DIR = Path(os.getenv("RESEARCH_DATA_DIR", str(INTERFACE_DIR / "data" / "research")))
+CACHE_DATA_DIR = Path(os.getenv("CACHE_DATA_DIR", str(INTERFACE_DIR / "data" / "cache")))
+BATCH_DATA_DIR = Path(os.getenv("BATCH_DATA_DIR", str(INTERFACE_DIR / "data" / "batch")))
 
 
 def get_price_period() -> tuple[str, str]:
@@ -0,0 +1,205 @@
+"""로컬 테스트용 OpenAI Batch API 대역 서버.
+
+``/v1/files`` 업로드, ``/v1/batches`` 생성/조회, ``/v1/files/{id}/content`` 다운로드만
+흉내 낸다. 배치는 첫 조회에서 in_progress, 두 번째 조회에서 completed가 된다.
+각 요청의 응답은 ``responder(custom_id, url, body)`` 로 만든다 (기본: 결정적 더미 응답).
+
+사용법:
+    python -m interface.data_collection.batch_stub_server --port 8765
+    OPENAI_BATCH_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_BATCH_MODE=true python -m interface.run ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+Responder = Callable[[str, str, dict], dict]
+
+
+def default_responder(custom_id: str, url: str, body: dict) -> dict:
+    """endpoint별 최소 형태의 더미 응답 body."""
+    if url.endswith("/responses"):
+        text = json.dumps({"title": custom_id, "summary": f"[stub] {custom_id}", "key_points": []}, ensure_ascii=False)
+        return {
+            "object": "response",
+            "output": [{"type": "message", "content": [{"type": "output_text", "text": text}]}],
+        }
+    return {
+        "object": "chat.completion",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": f"[stub] {custom_id}"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0},
+    }
+
+
+class _State:
+    def __init__(self, responder: Responder) -> None:
+        self.responder = responder
+        self.files: dict[str, bytes] = {}
+        self.batches: dict[str, dict] = {}
+        self.polls: dict[str, int] = {}
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def new_id(self, prefix: str) -> str:
+        with self.lock:
+            return f"{prefix}-{next(self.ids)}"
+
+    def run_batch(self, batch: dict) -> None:
+        output_lines: list[str] = []
+        error_lines: list[str] = []
+        for line in self.files[batch["input_file_id"]].decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            req = json.loads(line)
+            try:
+                body = self.responder(req["custom_id"], req["url"], req["body"])
+                output_lines.append(json.dumps({
+                    "custom_id": req["custom_id"],
+                    "response": {"status_code": 200, "body": body},
+                    "error": None,
+                }, ensure_ascii=False))
+            except Exception as e:
+                error_lines.append(json.dumps({
+                    "custom_id": req["custom_id"],
+                    "response": None,
+                    "error": {"message": str(e)},
+                }, ensure_ascii=False))
+
+        batch["status"] = "completed"
+        batch["request_counts"] = {
+            "total": len(output_lines) + len(error_lines),
+            "completed": len(output_lines),
+            "failed": len(error_lines),
+        }
+        for key, lines in (("output_file_id", output_lines), ("error_file_id", error_lines)):
+            if lines:
+                file_id = self.new_id("file")
+                self.files[file_id] = ("\n".join(lines) + "\n").encode("utf-8")
+                batch[key] = file_id
+
+
+def _make_handler(state: _State) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args) -> None:  # noqa: A002 - 표준 시그니처
+            pass
+
+        def _send_json(self, status: int, payload: dict) -> None:
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _read_body(self) -> bytes:
+            return self.rfile.read(int(self.headers.get("Content-Length", "0")))
+
+        def do_POST(self) -> None:
+            if self.path == "/v1/files":
+                raw = self._read_body()
+                message = BytesParser(policy=HTTP).parsebytes(
+                    f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + raw
+                )
+                for part in message.iter_parts():
+                    if part.get_param("name", header="content-disposition") == "file":
+                        file_id = state.new_id("file")
+                        state.files[file_id] = part.get_payload(decode=True)
+                        self._send_json(200, {"id": file_id, "object": "file", "purpose": "batch"})
+                        return
+                self._send_json(400, {"error": {"message": "file part missing"}})
+            elif self.path == "/v1/batches":
+                req = json.loads(self._read_body())
+                if req.get("input_file_id") not in state.files:
+                    self._send_json(404, {"error": {"message": "input file not found"}})
+                    return
+                batch_id = state.new_id("batch")
+                batch = {
+                    "id": batch_id,
+                    "object": "batch",
+                    "endpoint": req.get("endpoint"),
+                    "input_file_id": req["input_file_id"],
+                    "status": "validating",
+                }
+                state.batches[batch_id] = batch
+                self._send_json(200, batch)
+            else:
+                self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+        def do_GET(self) -> None:
+            parts = self.path.strip("/").split("/")
+            if len(parts) == 3 and parts[:2] == ["v1", "batches"] and parts[2] in state.batches:
+                batch = state.batches[parts[2]]
+                polls = state.polls[batch["id"]] = state.polls.get(batch["id"], 0) + 1
+                if batch["status"] != "completed":
+                    if polls == 1:
+                        batch["status"] = "in_progress"
+                    else:
+                        state.run_batch(batch)
+                self._send_json(200, batch)
+            elif len(parts) == 4 and parts[:2] == ["v1", "files"] and parts[3] == "content" and parts[2] in state.files:
+                data = state.files[parts[2]]
+                self.send_response(200)
+                self.send_header("Content-Type", "application/jsonl")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            else:
+                self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    return Handler
+
+
+class BatchStubServer:
+    """스레드에서 도는 Batch API 대역 서버 (context manager)."""
+
+    def __init__(self, responder: Optional[Responder] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.state = _State(responder or default_responder)
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self.state))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "BatchStubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "BatchStubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OpenAI Batch API 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = BatchStubServer(host=args.host, port=args.port)
+    print(f"Batch stub server: {server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""파일 기반 JSON 캐시.
+
+키(입력 해시)별로 ``<dir>/<key[:2]>/<key>.json`` 파일에 값을 저장한다.
+여러 스레드가 동시에 쓰더라도 임시 파일 → rename으로 원자적으로 교체한다.
+용량 상한을 주면 넘칠 때 오래된 파일부터 지운다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """입력 파트들을 직렬화해 sha256 키 생성 (dict/list는 정렬된 JSON)."""
+    h = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, str):
+            part = json.dumps(part, ensure_ascii=False, sort_keys=True)
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+
+class FileCache:
+    """TTL + 용량 제한을 지원하는 디렉토리 기반 JSON 캐시."""
+
+    def __init__(self, directory: str | Path, ttl_s: Optional[float] = None, max_bytes: Optional[int] = None) -> None:
+        self.directory = Path(directory)
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # 첫 쓰기 때 디렉토리를 한 번 훑어 초기화
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 값 반환. 없거나 만료/손상 시 None."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("캐시 읽기 실패 %s: %s", path, e)
+            return None
+
+        if self.ttl_s is not None and time.time() - entry.get("created_at", 0) > self.ttl_s:
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 값 저장. 실패해도 예외를 올리지 않는다 (캐시는 best-effort)."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{time.monotonic_ns()}.tmp")
+            tmp.write_text(
+                json.dumps({"created_at": time.time(), "value": value}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            try:
+                previous = path.stat().st_size
+            except OSError:
+                previous = 0
+            os.replace(tmp, path)
+            size = path.stat().st_size
+        except OSError as e:
+            logger.warning("캐시 쓰기 실패 %s: %s", path, e)
+            return
+        if self.max_bytes is not None:
+            self._account(size - previous)
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """(수정 시각, 크기, 경로) 목록. 다른 프로세스가 지운 파일은 건너뛴다."""
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _account(self, delta: int) -> None:
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += delta
+            if self._total_bytes <= self.max_bytes:
+                return
+            # 만료 여부와 관계없이 오래된 파일부터 상한 아래로 내려갈 때까지 삭제
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            self._total_bytes = total
+        if removed:
+            logger.info("캐시 용량 초과로 %d건 삭제 (%s)", removed, self.directory)
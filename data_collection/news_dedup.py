@@ -0,0 +1,94 @@
+"""뉴스 근접 중복(near-duplicate) 묶기.
+
+여러 매체에 재송고된 통신 기사처럼 제목만 조금 다른 기사를 SimHash로 묶는다.
+문자 n-gram shingle 기반이라 형태소 분석기나 외부 서비스 없이 CPU만으로 동작한다.
+묶인 기사 수(cluster_size)는 이슈 중요도 신호로 대표 기사에 남긴다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+
+from ..config import NEWS_DEDUP_MAX_HAMMING
+
+logger = logging.getLogger(__name__)
+
+_SHINGLE_SIZE = 3
+_HASH_BITS = 64
+_MASK = (1 << _HASH_BITS) - 1
+_NON_WORD = re.compile(r"[^\w]+")
+# [속보], (종합), <사진> 등 매체별 머리표 제거
+_BRACKET_TAG = re.compile(r"[\[\(<【][^\]\)>】]{0,10}[\]\)>】]")
+
+
+def _normalize(text: str) -> str:
+    text = _BRACKET_TAG.sub(" ", text or "")
+    return _NON_WORD.sub("", text.lower())
+
+
+def _shingles(text: str) -> set[str]:
+    if len(text) <= _SHINGLE_SIZE:
+        return {text} if text else set()
+    return {text[i:i + _SHINGLE_SIZE] for i in range(len(text) - _SHINGLE_SIZE + 1)}
+
+
+def simhash(text: str) -> int:
+    """정규화된 텍스트의 문자 shingle 기반 64비트 SimHash."""
+    weights = [0] * _HASH_BITS
+    for shingle in _shingles(_normalize(text)):
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(_HASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    value = 0
+    for bit, w in enumerate(weights):
+        if w > 0:
+            value |= 1 << bit
+    return value & _MASK
+
+
+def _item_text(item: dict) -> str:
+    return f"{item.get('title') or ''} {(item.get('summary') or '')[:200]}"
+
+
+def collapse_near_duplicates(items: list[dict], max_hamming: int = NEWS_DEDUP_MAX_HAMMING) -> list[dict]:
+    """SimHash 해밍 거리 ≤ max_hamming 인 기사를 하나로 묶는다.
+
+    Returns:
+        클러스터별 대표 기사 리스트 (입력 순서 유지). 대표 기사에는
+        ``cluster_size``와 ``cluster_sources``(묶인 매체 목록)가 추가된다.
+    """
+    if max_hamming < 0 or len(items) < 2:
+        return [{**item, "cluster_size": 1, "cluster_sources": [item.get("source", "")]} for item in items]
+
+    hashes = [simhash(_item_text(item)) for item in items]
+    parent = list(range(len(items)))
+
+    def _find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(items)):
+        for j in range(i + 1, len(items)):
+            if (hashes[i] ^ hashes[j]).bit_count() <= max_hamming:
+                ri, rj = _find(i), _find(j)
+                if ri != rj:
+                    parent[rj] = ri
+
+    clusters: dict[int, list[int]] = {}
+    for i in range(len(items)):
+        clusters.setdefault(_find(i), []).append(i)
+
+    collapsed: list[dict] = []
+    for members in sorted(clusters.values(), key=lambda m: m[0]):
+        # 요약이 가장 긴 기사를 대표로 사용
+        rep = max(members, key=lambda i: len(items[i].get("summary") or ""))
+        sources = list(dict.fromkeys(items[i].get("source", "") for i in members))
+        collapsed.append({**items[rep], "cluster_size": len(members), "cluster_sources": sources})
+
+    if len(collapsed) < len(items):
+        logger.info("[뉴스 중복 제거] %d건 → %d 클러스터", len(items), len(collapsed))
+    return collapsed
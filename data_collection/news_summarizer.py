@@ -1,33 +1,55 @@
 """뉴스/리포트 요약: GPT-5 mini Map/Reduce 요약 (v2).
 
-동적 청크 분할 → Map(청크별 요약) → Reduce(통합 요약) 전략.
+동적 청크 분할 → Map(청크별 요약, 병렬) → Reduce(통합 요약) 전략.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import math
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import requests
 
+from ..ai.llm_metrics import bind_llm_stats, record_llm_usage
+from ..ai.tokenizer import count_tokens
 from ..config import (
+    CACHE_DATA_DIR,
+    OPENAI_BATCH_MODE,
+    OPENAI_PHASE1_CACHE_ENABLED,
+    OPENAI_PHASE1_CACHE_MAX_MB,
+    OPENAI_PHASE1_CACHE_TTL_HOURS,
     OPENAI_PHASE1_CHUNK_TARGET_INPUT_TOKENS,
+    OPENAI_PHASE1_MAP_CONCURRENCY,
     OPENAI_PHASE1_MAX_COMPLETION_TOKENS,
     OPENAI_PHASE1_MODEL,
+    OPENAI_PHASE1_STREAM,
+    OPENAI_PHASE1_STREAM_FIRST_TOKEN_TIMEOUT_S,
+    OPENAI_PHASE1_STREAM_STALL_TIMEOUT_S,
+    OPENAI_PHASE1_STABLE_CHUNKS,
     OPENAI_PHASE1_SUMMARY_MAX_RETRIES,
     OPENAI_PHASE1_TEMPERATURE,
     NEWS_DATA_DIR,
     RESEARCH_DATA_DIR,
 )
+from .file_cache import FileCache, make_cache_key
+from .news_dedup import collapse_near_duplicates
+from .openai_batch import run_batch
 
 logger = logging.getLogger(__name__)
 
 OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
 
+# 내용 기반 청크 경계: 블록 해시 % N == 0 이면 경계 후보
+_STABLE_ANCHOR_MODULUS = 4
+
 # ── 프롬프트 (인라인) ──
 
 _NEWS_SUMMARY_PROMPT = """\
@@ -37,8 +59,10 @@ _NEWS_SUMMARY_PROMPT = """\
 
 {news_items}
 
+`N개 매체 보도` 표시는 여러 매체가 같은 내용을 보도한 기사로, 중요도가 높은 이슈입니다.
+
 **출력 형식:**
-- 3~5개 이슈(테마)로 구분
+- 3~5개 이슈(테마)로 구분, 중요도 순으로 정렬
 - 각 이슈당 2~3문장 요약
 - 이슈 제목과 요약을 구분해서 작성"""
 
@@ -55,13 +79,16 @@ _REPORTS_SUMMARY_PROMPT = """\
 - 이슈 제목과 요약을 구분해서 작성"""
 
 
-def _build_payload(prompt: str) -> dict:
+def _build_payload(prompt: str, stream: bool = OPENAI_PHASE1_STREAM) -> dict:
     """모델 호환 파라미터로 Chat Completions payload 생성."""
     payload: dict[str, Any] = {
         "model": OPENAI_PHASE1_MODEL,
         "messages": [{"role": "user", "content": prompt}],
         "max_completion_tokens": OPENAI_PHASE1_MAX_COMPLETION_TOKENS,
     }
+    if stream:
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
     # GPT-5 계열은 temperature 커스텀 미지원 가능 → 전달 시도, 실패 시 제거
     if not OPENAI_PHASE1_MODEL.lower().startswith("gpt-5"):
         payload["temperature"] = OPENAI_PHASE1_TEMPERATURE
@@ -69,23 +96,38 @@ def _build_payload(prompt: str) -> dict:
 
 
 def _estimate_tokens(text: str) -> int:
-    return max(1, (len(text) + 3) // 4)
+    """Phase 1 모델 토크나이저 기준 토큰 수 (최소 1)."""
+    return max(1, count_tokens(text, OPENAI_PHASE1_MODEL))
 
 
 def _chunk_blocks(
     blocks: list[tuple[int, str]],
     target_input_tokens: int,
 ) -> list[list[tuple[int, str]]]:
-    """입력 토큰 예산 기준으로 동적 청크 분할."""
+    """입력 토큰 예산 기준으로 동적 청크 분할.
+
+    필요한 최소 청크 수를 먼저 구한 뒤, 남은 토큰을 남은 청크 수로 나눈 목표치에
+    가깝게 잘라 청크 크기를 고르게 맞춘다. 블록 순서는 유지하고 예산은 넘기지 않는다.
+    """
     target = max(500, target_input_tokens)
+    sized = [(idx, block, _estimate_tokens(block) + 2) for idx, block in blocks]
+    remaining = sum(tokens for _, _, tokens in sized)
+    n_chunks = max(1, math.ceil(remaining / target))
+
     chunks: list[list[tuple[int, str]]] = []
     current: list[tuple[int, str]] = []
     current_tokens = 0
 
-    for idx, block in blocks:
-        block_tokens = _estimate_tokens(block) + 2
-        if current and (current_tokens + block_tokens > target):
+    for idx, block, block_tokens in sized:
+        chunks_left = max(1, n_chunks - len(chunks))
+        goal = remaining / chunks_left
+        # 예산 초과 또는 목표치를 절반 이상 넘기게 되면 현재 청크를 닫는다
+        if current and (
+            current_tokens + block_tokens > target
+            or current_tokens + block_tokens / 2 > goal
+        ):
             chunks.append(current)
+            remaining -= current_tokens
             current = []
             current_tokens = 0
         current.append((idx, block))
@@ -96,22 +138,157 @@ def _chunk_blocks(
     return chunks
 
 
+def _is_chunk_anchor(block: str) -> bool:
+    """블록 내용 해시로 결정되는 청크 경계 후보 여부 (평균 4블록당 1개)."""
+    digest = hashlib.sha1(block.encode("utf-8")).digest()
+    return digest[0] % _STABLE_ANCHOR_MODULUS == 0
+
+
+def _stable_chunk_blocks(
+    blocks: list[tuple[int, str]],
+    target_input_tokens: int,
+) -> list[list[tuple[int, str]]]:
+    """내용 기반(content-defined) 경계로 청크 분할.
+
+    최소 크기(예산의 1/3)를 넘긴 뒤 앵커 블록에서 구간을 닫고, 예산을 넘는 구간은
+    ``_chunk_blocks`` 로 구간 안에서만 고르게 나눈다. 경계가 블록 내용으로만 정해지므로
+    같은 날 재실행 시 새 기사가 들어간 구간의 청크만 바뀌고 나머지는 캐시에 적중한다.
+    """
+    target = max(500, target_input_tokens)
+    min_tokens = target // 3
+    segments: list[list[tuple[int, str]]] = []
+    current: list[tuple[int, str]] = []
+    current_tokens = 0
+
+    for idx, block in blocks:
+        current.append((idx, block))
+        current_tokens += _estimate_tokens(block) + 2
+        if current_tokens >= min_tokens and _is_chunk_anchor(block):
+            segments.append(current)
+            current = []
+            current_tokens = 0
+
+    if current:
+        segments.append(current)
+    return [chunk for segment in segments for chunk in _chunk_blocks(segment, target)]
+
+
+def _get_chunk_cache() -> Optional[FileCache]:
+    if not OPENAI_PHASE1_CACHE_ENABLED:
+        return None
+    return FileCache(
+        CACHE_DATA_DIR / "phase1",
+        ttl_s=OPENAI_PHASE1_CACHE_TTL_HOURS * 3600,
+        max_bytes=int(OPENAI_PHASE1_CACHE_MAX_MB * 1024 * 1024) if OPENAI_PHASE1_CACHE_MAX_MB > 0 else None,
+    )
+
+
+class _StreamAborted(RuntimeError):
+    """스트리밍 응답이 정체되거나 첫 토큰이 늦어 중단됨."""
+
+
+def _post_completion(payload: dict, api_key: str) -> requests.Response:
+    stream = bool(payload.get("stream"))
+    return requests.post(
+        OPENAI_API_URL,
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+        json=payload,
+        # 스트리밍: read timeout = 이벤트 간 최대 공백 (정체 감지)
+        timeout=(10, OPENAI_PHASE1_STREAM_STALL_TIMEOUT_S) if stream else 90,
+        stream=stream,
+    )
+
+
+def _read_sse_completion(resp: requests.Response, started: float) -> dict:
+    """SSE 이벤트를 읽어 content를 모은다. 첫 content 토큰이 늦으면 조기 중단."""
+    parts: list[str] = []
+    finish_reason = None
+    usage: dict = {}
+    ttft_s = None
+
+    try:
+        for line in resp.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                break
+            try:
+                event = json.loads(data)
+            except ValueError:
+                # 깨진 이벤트 하나로 Map 단계 전체를 실패시키지 않는다 (누락 조각은 빈 출력 검사에서 재시도)
+                logger.warning("[요약 호출] SSE 이벤트 파싱 실패, 건너뜀: %r", data[:200])
+                continue
+            if event.get("usage"):
+                usage = event["usage"]
+            for choice in event.get("choices") or []:
+                delta = (choice.get("delta") or {}).get("content") or ""
+                if delta:
+                    if ttft_s is None:
+                        ttft_s = time.perf_counter() - started
+                    parts.append(delta)
+                if choice.get("finish_reason"):
+                    finish_reason = choice["finish_reason"]
+            if ttft_s is None and time.perf_counter() - started > OPENAI_PHASE1_STREAM_FIRST_TOKEN_TIMEOUT_S:
+                raise _StreamAborted(
+                    f"no_content_within_{OPENAI_PHASE1_STREAM_FIRST_TOKEN_TIMEOUT_S:.0f}s"
+                )
+    except requests.exceptions.RequestException as e:
+        raise _StreamAborted(f"stream_stalled: {e}")
+    finally:
+        resp.close()
+
+    return {"content": "".join(parts), "finish_reason": finish_reason, "usage": usage, "ttft_s": ttft_s}
+
+
+def _read_completion(resp: requests.Response, started: float, stream: bool) -> dict:
+    if stream:
+        return _read_sse_completion(resp, started)
+    return _completion_from_json(resp.json())
+
+
+def _completion_from_json(data: dict) -> dict:
+    choice = (data.get("choices") or [{}])[0]
+    return {
+        "content": choice.get("message", {}).get("content", ""),
+        "finish_reason": choice.get("finish_reason"),
+        "usage": data.get("usage", {}),
+        "ttft_s": None,
+    }
+
+
 def _call_chat_summary(prompt: str, api_key: str, max_retries: int) -> dict:
-    """요약 호출. 빈 content/length 종료 시 재시도."""
+    """요약 호출. 빈 content/length 종료/스트림 정체 시 재시도.
+
+    스트리밍 모드(OPENAI_PHASE1_STREAM)에서는 SSE로 받아 첫 토큰 지연·정체를 조기에 감지하고,
+    시도별 time-to-first-token(ttft_s)과 총 소요시간(duration_s)을 ``attempt_log``에 남긴다.
+    """
     retries = max(0, max_retries)
     last_error = "unknown_error"
+    attempt_log: list[dict] = []
 
     for attempt in range(1, retries + 2):
-        payload = _build_payload(prompt)
+        payload = _build_payload(prompt, stream=OPENAI_PHASE1_STREAM)
+        stream = bool(payload.get("stream"))
+        started = time.perf_counter()
+
+        def _log_attempt(outcome: str, ttft_s: Optional[float] = None, usage: Optional[dict] = None) -> None:
+            entry = {
+                "attempt": attempt,
+                "ttft_s": round(ttft_s, 2) if ttft_s is not None else None,
+                "duration_s": round(time.perf_counter() - started, 2),
+                "outcome": outcome,
+            }
+            attempt_log.append(entry)
+            record_llm_usage(payload["model"], usage, entry["duration_s"], error=outcome != "ok")
+            logger.info("[요약 호출] attempt=%d stream=%s ttft=%s duration=%.2fs outcome=%s",
+                        attempt, stream, entry["ttft_s"], entry["duration_s"], outcome)
+
         try:
-            resp = requests.post(
-                OPENAI_API_URL,
-                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                json=payload,
-                timeout=90,
-            )
+            resp = _post_completion(payload, api_key)
         except requests.exceptions.RequestException as e:
             last_error = f"request_error: {e}"
+            _log_attempt(last_error)
             if attempt <= retries:
                 continue
             raise RuntimeError(last_error)
@@ -121,40 +298,46 @@ def _call_chat_summary(prompt: str, api_key: str, max_retries: int) -> dict:
             # GPT-5 temperature 거부 시 제거 후 재시도
             if resp.status_code == 400 and "temperature" in err_body.lower():
                 payload.pop("temperature", None)
-                retry_resp = requests.post(
-                    OPENAI_API_URL,
-                    headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                    json=payload,
-                    timeout=90,
-                )
+                retry_resp = _post_completion(payload, api_key)
                 if retry_resp.ok:
                     resp = retry_resp
                 else:
                     last_error = f"OpenAI API error {resp.status_code}: {err_body}"
+                    _log_attempt(last_error)
                     if attempt <= retries:
                         continue
                     raise RuntimeError(last_error)
             else:
                 last_error = f"OpenAI API error {resp.status_code}: {err_body}"
+                _log_attempt(last_error)
                 if attempt <= retries:
                     continue
                 raise RuntimeError(last_error)
 
-        data = resp.json()
-        choice = data.get("choices", [{}])[0]
-        content = choice.get("message", {}).get("content", "")
-        finish_reason = choice.get("finish_reason")
-        usage = data.get("usage", {})
+        try:
+            completion = _read_completion(resp, started, stream)
+        except _StreamAborted as e:
+            last_error = str(e)
+            _log_attempt(last_error)
+            if attempt <= retries:
+                continue
+            raise RuntimeError(last_error)
+
+        content = completion["content"]
+        finish_reason = completion["finish_reason"]
 
         if isinstance(content, str) and content.strip():
+            _log_attempt("ok", completion["ttft_s"], completion["usage"])
             return {
                 "summary": content.strip(),
                 "finish_reason": finish_reason,
-                "usage": usage,
+                "usage": completion["usage"],
                 "attempts": attempt,
+                "attempt_log": attempt_log,
             }
 
         last_error = f"empty_content (finish_reason={finish_reason})"
+        _log_attempt(last_error, completion["ttft_s"], completion["usage"])
         if attempt <= retries:
             continue
 
@@ -162,17 +345,26 @@ def _call_chat_summary(prompt: str, api_key: str, max_retries: int) -> dict:
 
 
 def _format_news_blocks(items: list[dict]) -> list[tuple[int, str]]:
+    # 재실행 시 청크 구성이 같도록 (날짜, URL, 제목) 순으로 고정
+    items = sorted(items, key=lambda n: (
+        n.get("published_date") or "", n.get("url") or "", n.get("title") or "",
+    ))
     blocks: list[tuple[int, str]] = []
     for i, n in enumerate(items, start=1):
         title = (n.get("title") or "").strip()
         source = (n.get("source") or "").strip()
         summary = (n.get("summary") or "")[:300]
         date = n.get("published_date", "")
-        blocks.append((i, f"- [{source}] {title} ({date})\n  {summary}"))
+        cluster_size = n.get("cluster_size", 1)
+        coverage = f" · {cluster_size}개 매체 보도" if cluster_size > 1 else ""
+        blocks.append((i, f"- [{source}] {title} ({date}){coverage}\n  {summary}"))
     return blocks
 
 
 def _format_report_blocks(items: list[dict]) -> list[tuple[int, str]]:
+    items = sorted(items, key=lambda r: (
+        r.get("date") or "", r.get("source") or "", r.get("title") or "",
+    ))
     blocks: list[tuple[int, str]] = []
     for i, r in enumerate(items, start=1):
         title = (r.get("title") or "").strip()
@@ -187,7 +379,7 @@ def _build_reduce_prompt(kind: str, merged_chunks: str) -> str:
     label = "뉴스" if kind == "news" else "증권/리포트"
     return (
         f"다음은 당일 {label}를 여러 청크로 나눠 요약한 결과입니다.\n"
-        "중복을 제거하고 핵심 이슈만 3~7개로 통합 요약하세요.\n\n"
+        "중복을 제거하고 핵심 이슈만 3~7개로 통합 요약하세요. 여러 청크·매체에 걸친 이슈를 먼저 쓰세요.\n\n"
         f"{merged_chunks}\n\n"
         "출력 형식:\n"
         "## 이슈 제목\n"
@@ -195,6 +387,116 @@ def _build_reduce_prompt(kind: str, merged_chunks: str) -> str:
     )
 
 
+def _reduce_once(kind: str, partials: list[tuple[str, str]], api_key: str, retries: int) -> str:
+    """partial 요약 묶음 1개를 Reduce. 실패 시 원문 이어붙이기로 대체."""
+    merged_input = "\n\n".join(f"### {label}\n{summary}" for label, summary in partials)
+    try:
+        return _call_chat_summary(_build_reduce_prompt(kind, merged_input), api_key, retries)["summary"]
+    except Exception as e:
+        logger.warning("[%s 요약] Reduce 실패, partial 요약 병합으로 대체: %s", kind, e)
+        return "\n\n".join(summary for _, summary in partials)
+
+
+def _trim_summary(summary: str, max_tokens: int) -> str:
+    """partial 요약을 ``max_tokens`` 이하로 앞에서부터 잘라낸다."""
+    tokens = _estimate_tokens(summary)
+    while tokens > max_tokens and summary:
+        # 문자 수 비례로 근사하고, 토큰 밀도 차이는 다시 세어 보정한다
+        summary = summary[: min(len(summary) - 1, int(len(summary) * max_tokens / tokens))].rstrip()
+        tokens = _estimate_tokens(summary)
+    return summary
+
+
+def _tree_reduce(kind: str, partials: list[tuple[str, str]], api_key: str, retries: int) -> str:
+    """입력 토큰 예산 기준 계층형 Reduce.
+
+    partial 요약 전체가 예산을 넘으면 예산 단위로 그룹을 나눠 레벨별로 병렬 Reduce하고,
+    한 그룹에 들어갈 때까지 반복한 뒤 최종 Reduce를 수행한다. 그룹당 1개뿐이라 줄지 않는
+    레벨은 2개씩 묶어 레벨마다 partial 수가 최소 절반으로 줄게 하고, 예산을 넘는 그룹은
+    각 partial을 예산의 균등 몫으로 잘라 모든 Reduce 입력이 예산 안에 들게 한다.
+    """
+    budget = max(500, OPENAI_PHASE1_CHUNK_TARGET_INPUT_TOKENS)
+    level = 0
+
+    while True:
+        blocks = [(i, f"### {label}\n{summary}") for i, (label, summary) in enumerate(partials)]
+        groups = _chunk_blocks(blocks, budget)
+        if len(groups) > (len(partials) + 1) // 2:
+            groups = [blocks[i:i + 2] for i in range(0, len(blocks), 2)]
+
+        grouped: list[list[tuple[str, str]]] = []
+        for group in groups:
+            members = [partials[i] for i, _ in group]
+            if sum(_estimate_tokens(text) + 2 for _, text in group) > budget:
+                share = budget // len(members)
+                members = [
+                    (label, _trim_summary(summary, max(1, share - _estimate_tokens(f"### {label}\n") - 2)))
+                    for label, summary in members
+                ]
+            grouped.append(members)
+
+        if len(grouped) == 1:
+            return _reduce_once(kind, grouped[0], api_key, retries)
+
+        level += 1
+        logger.info("[%s 요약] Tree Reduce level %d: %d개 → %d 그룹", kind, level, len(partials), len(grouped))
+        max_workers = max(1, min(OPENAI_PHASE1_MAP_CONCURRENCY, len(grouped)))
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            reduced = list(ex.map(bind_llm_stats(lambda g: _reduce_once(kind, g, api_key, retries)), grouped))
+        partials = [(f"level {level} group {gi}", text) for gi, text in enumerate(reduced, start=1)]
+
+
+def _chunk_cache_key(chunk_text: str, prompt_template: str) -> str:
+    return make_cache_key(chunk_text, OPENAI_PHASE1_MODEL, prompt_template)
+
+
+def _map_chunks_in_batch(
+    kind: str,
+    chunks: list[list[tuple[int, str]]],
+    prompt_template: str,
+    prompt_key: str,
+    api_key: str,
+    cache: Optional[FileCache],
+) -> list[dict[str, Any]]:
+    """캐시에 없는 청크의 Map 요청을 Batch API로 제출하고 chunk_index 순서로 결과 반환."""
+    mapped: dict[int, dict[str, Any]] = {}
+    bodies: dict[str, dict] = {}
+    keys: dict[str, str] = {}
+
+    for chunk_index, chunk in enumerate(chunks, start=1):
+        chunk_text = "\n\n".join(t for _, t in chunk)
+        cache_key = _chunk_cache_key(chunk_text, prompt_template)
+        cached = cache.get(cache_key) if cache is not None else None
+        if cached:
+            mapped[chunk_index] = {"chunk_index": chunk_index, "summary": cached["summary"], "cached": True}
+            continue
+        custom_id = f"{kind}-chunk-{chunk_index}"
+        bodies[custom_id] = _build_payload(prompt_template.replace(f"{{{prompt_key}}}", chunk_text), stream=False)
+        keys[custom_id] = cache_key
+
+    try:
+        responses = run_batch(bodies, "/v1/chat/completions", api_key=api_key, job_name=f"phase1_{kind}")
+    except Exception as e:
+        logger.warning("[%s 요약] 배치 실패: %s", kind, e)
+        responses = {}
+
+    for custom_id, cache_key in keys.items():
+        chunk_index = int(custom_id.rsplit("-", 1)[1])
+        body = responses.get(custom_id)
+        if body:
+            # 배치 할인은 비용 추정에 반영하지 않음 (상한 추정)
+            record_llm_usage(bodies[custom_id]["model"], body.get("usage"))
+        content = _completion_from_json(body)["content"] if body else ""
+        summary = content.strip() if isinstance(content, str) and content.strip() else None
+        if summary is None:
+            logger.warning("[%s 요약] 청크 %d 배치 결과 없음", kind, chunk_index)
+        elif cache is not None:
+            cache.set(cache_key, {"summary": summary})
+        mapped[chunk_index] = {"chunk_index": chunk_index, "summary": summary}
+
+    return [mapped[i] for i in sorted(mapped)]
+
+
 def _summarize_with_map_reduce(
     *,
     kind: str,
@@ -211,49 +513,62 @@ def _summarize_with_map_reduce(
     if not api_key:
         return f"(OPENAI_API_KEY 미설정) {kind} {len(blocks)}건"
 
-    chunks = _chunk_blocks(blocks, OPENAI_PHASE1_CHUNK_TARGET_INPUT_TOKENS)
+    cache = _get_chunk_cache()
+    if cache is not None and OPENAI_PHASE1_STABLE_CHUNKS:
+        chunks = _stable_chunk_blocks(blocks, OPENAI_PHASE1_CHUNK_TARGET_INPUT_TOKENS)
+    else:
+        chunks = _chunk_blocks(blocks, OPENAI_PHASE1_CHUNK_TARGET_INPUT_TOKENS)
     retries = OPENAI_PHASE1_SUMMARY_MAX_RETRIES
 
     logger.info("[%s 요약] Map/Reduce 시작: %d건 → %d 청크", kind, len(blocks), len(chunks))
 
-    successful_chunks: list[dict[str, Any]] = []
-    failed_chunks = 0
-
-    for chunk_index, chunk in enumerate(chunks, start=1):
+    def _map_one(chunk_index: int, chunk: list[tuple[int, str]]) -> dict[str, Any]:
         chunk_text = "\n\n".join(t for _, t in chunk)
-        prompt = prompt_template.replace(f"{{{prompt_key}}}", chunk_text)
+        cache_key = _chunk_cache_key(chunk_text, prompt_template)
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached:
+                return {"chunk_index": chunk_index, "summary": cached["summary"], "cached": True}
 
+        prompt = prompt_template.replace(f"{{{prompt_key}}}", chunk_text)
         try:
             result = _call_chat_summary(prompt, api_key, retries)
-            successful_chunks.append({
-                "chunk_index": chunk_index,
-                "summary": result["summary"],
-            })
+            if cache is not None:
+                cache.set(cache_key, {"summary": result["summary"]})
+            return {"chunk_index": chunk_index, "summary": result["summary"]}
         except Exception as e:
-            failed_chunks += 1
             logger.warning("[%s 요약] 청크 %d 실패: %s", kind, chunk_index, e)
+            return {"chunk_index": chunk_index, "summary": None}
+
+    if OPENAI_BATCH_MODE:
+        # Map: 전 청크를 하나의 배치 작업으로 제출 (야간 백필용)
+        mapped = _map_chunks_in_batch(kind, chunks, prompt_template, prompt_key, api_key, cache)
+    else:
+        # Map: 청크별 요약을 동시 실행 (결과는 chunk_index 순서 유지)
+        max_workers = max(1, min(OPENAI_PHASE1_MAP_CONCURRENCY, len(chunks)))
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            mapped = list(ex.map(bind_llm_stats(_map_one), range(1, len(chunks) + 1), chunks))
+
+    successful_chunks: list[dict[str, Any]] = [c for c in mapped if c["summary"] is not None]
+    failed_chunks = len(mapped) - len(successful_chunks)
+    cached_chunks = sum(1 for c in mapped if c.get("cached"))
 
     if not successful_chunks:
         return "(요약 실패)"
 
-    merged_input = "\n\n".join(
-        f"### chunk {c['chunk_index']}\n{c['summary']}" for c in successful_chunks
-    )
-    reduce_prompt = _build_reduce_prompt(kind, merged_input)
-
-    try:
-        reduced = _call_chat_summary(reduce_prompt, api_key, retries)
-        final_summary = reduced["summary"]
-    except Exception:
-        final_summary = "\n\n".join(c["summary"] for c in successful_chunks)
+    partials = [(f"chunk {c['chunk_index']}", c["summary"]) for c in successful_chunks]
+    final_summary = _tree_reduce(kind, partials, api_key, retries)
 
-    logger.info("[%s 요약] 완료 (성공 %d/%d 청크)", kind, len(successful_chunks), len(chunks))
+    logger.info(
+        "[%s 요약] 완료 (성공 %d/%d 청크, 실패 %d, 캐시 적중 %d)",
+        kind, len(successful_chunks), len(chunks), failed_chunks, cached_chunks,
+    )
     return final_summary
 
 
 def summarize_news(news_items: list[dict]) -> str:
-    """뉴스 아이템을 GPT-5 mini Map/Reduce로 요약."""
-    blocks = _format_news_blocks(news_items)
+    """뉴스 아이템을 근접 중복 묶기 후 GPT-5 mini Map/Reduce로 요약."""
+    blocks = _format_news_blocks(collapse_near_duplicates(news_items))
     return _summarize_with_map_reduce(
         kind="news",
         blocks=blocks,
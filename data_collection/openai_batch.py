@@ -0,0 +1,164 @@
+"""OpenAI Batch API 제출 유틸리티.
+
+요청 여러 개를 JSONL 배치 파일로 쓰고 → 업로드 → 배치 생성 → 완료까지 폴링 →
+결과 파일을 내려받아 ``custom_id``별 응답 body로 돌려준다.
+야간 백필처럼 지연이 중요하지 않은 요약 작업을 배치 요금/처리량으로 돌릴 때 사용한다.
+
+로컬 테스트는 ``batch_stub_server`` 를 띄우고 ``OPENAI_BATCH_BASE_URL`` 을 바꾸면 된다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from ..config import (
+    BATCH_DATA_DIR,
+    OPENAI_BATCH_BASE_URL,
+    OPENAI_BATCH_POLL_INTERVAL_S,
+    OPENAI_BATCH_TIMEOUT_S,
+)
+
+logger = logging.getLogger(__name__)
+
+# Batch API 입력 파일 제한 (50,000 요청 / 200MB) 보다 약간 작게 분할
+_MAX_REQUESTS_PER_FILE = 50_000
+_MAX_BYTES_PER_FILE = 190 * 1024 * 1024
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _split_lines(lines: list[str]) -> list[list[str]]:
+    parts: list[list[str]] = [[]]
+    size = 0
+    for line in lines:
+        line_bytes = len(line.encode("utf-8")) + 1
+        if parts[-1] and (len(parts[-1]) >= _MAX_REQUESTS_PER_FILE or size + line_bytes > _MAX_BYTES_PER_FILE):
+            parts.append([])
+            size = 0
+        parts[-1].append(line)
+        size += line_bytes
+    return parts
+
+
+def _write_job_file(job_name: str, part_index: int, lines: list[str]) -> Path:
+    BATCH_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = BATCH_DATA_DIR / f"{job_name}_{stamp}_{part_index}.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _run_one_batch(
+    path: Path,
+    endpoint: str,
+    *,
+    api_key: str,
+    base_url: str,
+    poll_interval_s: float,
+    timeout_s: float,
+) -> dict[str, Optional[dict]]:
+    headers = {"Authorization": f"Bearer {api_key}"}
+
+    with path.open("rb") as f:
+        resp = requests.post(
+            f"{base_url}/files",
+            headers=headers,
+            data={"purpose": "batch"},
+            files={"file": (path.name, f, "application/jsonl")},
+            timeout=300,
+        )
+    resp.raise_for_status()
+    input_file_id = resp.json()["id"]
+
+    resp = requests.post(
+        f"{base_url}/batches",
+        headers=headers,
+        json={"input_file_id": input_file_id, "endpoint": endpoint, "completion_window": "24h"},
+        timeout=60,
+    )
+    resp.raise_for_status()
+    batch = resp.json()
+    logger.info("[배치] 제출: %s (file=%s, endpoint=%s)", batch["id"], path.name, endpoint)
+
+    deadline = time.monotonic() + timeout_s
+    while batch.get("status") not in _TERMINAL_STATUSES:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"batch {batch['id']} not finished within {timeout_s:.0f}s")
+        time.sleep(poll_interval_s)
+        resp = requests.get(f"{base_url}/batches/{batch['id']}", headers=headers, timeout=60)
+        resp.raise_for_status()
+        batch = resp.json()
+        logger.info("[배치] %s 상태=%s %s", batch["id"], batch.get("status"), batch.get("request_counts", {}))
+
+    results: dict[str, Optional[dict]] = {}
+    for file_key in ("output_file_id", "error_file_id"):
+        file_id = batch.get(file_key)
+        if not file_id:
+            continue
+        resp = requests.get(f"{base_url}/files/{file_id}/content", headers=headers, timeout=300)
+        resp.raise_for_status()
+        for line in resp.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            ok = not record.get("error") and response.get("status_code") == 200
+            results[record["custom_id"]] = response.get("body") if ok else None
+
+    if batch.get("status") != "completed":
+        logger.warning("[배치] %s 종료 상태=%s (결과 %d건만 회수)", batch["id"], batch.get("status"), len(results))
+    return results
+
+
+def run_batch(
+    bodies: dict[str, dict],
+    endpoint: str,
+    *,
+    api_key: str,
+    job_name: str,
+    base_url: Optional[str] = None,
+    poll_interval_s: Optional[float] = None,
+    timeout_s: Optional[float] = None,
+) -> dict[str, Optional[dict]]:
+    """요청 body들을 배치로 제출하고 완료될 때까지 기다린다.
+
+    Args:
+        bodies: custom_id → 요청 body (예: chat completions payload)
+        endpoint: 배치 endpoint 경로 (예: "/v1/chat/completions")
+        job_name: 배치 파일 이름 접두어 (BATCH_DATA_DIR 아래에 보관)
+
+    Returns:
+        custom_id → 응답 body. 실패했거나 결과가 없는 요청은 None.
+    """
+    if not bodies:
+        return {}
+
+    base_url = (base_url or OPENAI_BATCH_BASE_URL).rstrip("/")
+    poll_interval_s = OPENAI_BATCH_POLL_INTERVAL_S if poll_interval_s is None else poll_interval_s
+    timeout_s = OPENAI_BATCH_TIMEOUT_S if timeout_s is None else timeout_s
+
+    lines = [
+        json.dumps({"custom_id": custom_id, "method": "POST", "url": endpoint, "body": body}, ensure_ascii=False)
+        for custom_id, body in bodies.items()
+    ]
+
+    results: dict[str, Optional[dict]] = {}
+    for part_index, part in enumerate(_split_lines(lines)):
+        path = _write_job_file(job_name, part_index, part)
+        results.update(
+            _run_one_batch(
+                path, endpoint,
+                api_key=api_key, base_url=base_url,
+                poll_interval_s=poll_interval_s, timeout_s=timeout_s,
+            )
+        )
+
+    missing = [cid for cid in bodies if results.get(cid) is None]
+    logger.info("[배치] %s 완료: %d/%d 성공", job_name, len(bodies) - len(missing), len(bodies))
+    return {cid: results.get(cid) for cid in bodies}
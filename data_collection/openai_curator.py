@@ -9,16 +9,28 @@ import json
 import logging
 import os
 import re
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
 
+from ..ai.json_parsing import IncrementalArrayParser, extract_json_object
+from ..ai.llm_metrics import record_llm_usage
 from ..config import (
+    CACHE_DATA_DIR,
+    OPENAI_PHASE2_CACHE_ENABLED,
+    OPENAI_PHASE2_CACHE_MAX_MB,
+    OPENAI_PHASE2_CACHE_TTL_HOURS,
+    OPENAI_PHASE2_INPUT_TOKEN_BUDGET,
     OPENAI_PHASE2_MAX_OUTPUT_TOKENS,
     OPENAI_PHASE2_MODEL,
+    OPENAI_PHASE2_STREAM,
 )
+from .file_cache import FileCache, make_cache_key
+from .prompt_budget import fit_sections_to_budget, split_summary_issues
 
 logger = logging.getLogger(__name__)
 
@@ -236,6 +248,61 @@ def _request_responses(payload: dict, api_key: str) -> dict:
     return resp.json()
 
 
+def _request_responses_stream(
+    payload: dict,
+    api_key: str,
+    on_topic: Optional[Callable[[int, dict], None]] = None,
+) -> dict:
+    """Responses API SSE 스트리밍 호출. 완성된 topic 객체가 닫히는 즉시 on_topic 콜백.
+
+    Returns:
+        response.completed 이벤트의 최종 response 객체 (비스트리밍 응답과 동일 구조)
+    """
+    resp = requests.post(
+        OPENAI_API_URL,
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+        json={**payload, "stream": True},
+        timeout=(10, 180),
+        stream=True,
+    )
+    if not resp.ok:
+        err_body = resp.text[:2000]
+        raise RuntimeError(f"OpenAI Responses API error {resp.status_code}: {err_body}")
+
+    parser = IncrementalArrayParser("topics")
+    try:
+        for line in resp.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                break
+            try:
+                event = json.loads(data)
+            except json.JSONDecodeError:
+                logger.warning("[큐레이션] SSE 이벤트 파싱 실패, 건너뜀: %r", data[:200])
+                continue
+            event_type = event.get("type", "")
+            if event_type == "response.output_text.delta":
+                for topic in parser.feed(event.get("delta", "")):
+                    index = parser.items_emitted - 1
+                    logger.info("[큐레이션] topic %d 스트림 수신: %s", index, str(topic.get("topic", ""))[:40])
+                    if on_topic is not None:
+                        try:
+                            on_topic(index, topic)
+                        except Exception as e:
+                            logger.warning("[큐레이션] on_topic 콜백 실패 (무시): %s", e)
+            elif event_type == "response.completed":
+                return event.get("response") or {}
+            elif event_type in ("response.failed", "response.incomplete", "error"):
+                detail = event.get("response", {}).get("error") or event.get("message") or event_type
+                raise RuntimeError(f"OpenAI Responses API stream {event_type}: {detail}")
+    finally:
+        resp.close()
+
+    raise RuntimeError("OpenAI Responses API stream ended without response.completed")
+
+
 def _parse_web_search_log(output: list) -> dict:
     web_search_calls: list[dict] = []
     citations_used: list[dict] = []
@@ -301,9 +368,12 @@ def _parse_topics(data: dict) -> list[dict]:
     output_text = _extract_output_text(data).strip()
     if not output_text:
         raise ValueError("empty_output_text")
-    parsed = json.loads(output_text)
-    if not isinstance(parsed, dict):
-        raise ValueError("output_root_not_object")
+    try:
+        parsed = extract_json_object(output_text)
+    except json.JSONDecodeError:
+        raise
+    except ValueError as e:
+        raise ValueError("output_root_not_object") from e
     topics = parsed.get("topics")
     if not isinstance(topics, list) or not topics:
         raise ValueError("topics_missing_or_empty")
@@ -355,6 +425,97 @@ def _validate_topics(topics: list[dict], source_catalog: list[dict]) -> tuple[li
     return errors, []
 
 
+def _normalize_url(url: str) -> str:
+    """catalog 매칭용 URL 정규화 (fragment·utm 파라미터·끝 슬래시 제거)."""
+    parts = urlsplit(str(url).strip())
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not k.startswith("utm_")])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
+def _repair_topics(topics: list[dict], source_catalog: list[dict]) -> list[str]:
+    """source_catalog만으로 기계적으로 고칠 수 있는 검증 오류를 로컬에서 보정.
+
+    - ws0_* → ws1_* 보정, catalog에 없는 ID 제거
+    - source_ids가 비면 verified_news / evidence_source_urls의 URL을 catalog ID로 매핑
+    - evidence_source_urls가 비면 source_ids의 catalog URL(없으면 verified_news URL)로 채움
+
+    Returns:
+        적용한 보정 내역 (비어 있으면 보정 없음)
+    """
+    catalog = [s for s in source_catalog if isinstance(s, dict) and s.get("source_id") and s.get("url")]
+    url_by_id = {str(s["source_id"]).strip(): str(s["url"]).strip() for s in catalog}
+    id_by_url: dict[str, str] = {}
+    for s in catalog:
+        id_by_url.setdefault(_normalize_url(s["url"]), str(s["source_id"]).strip())
+
+    repairs: list[str] = []
+    for i, topic in enumerate(topics, start=1):
+        if not isinstance(topic, dict) or not isinstance(topic.get("interface_1_curated_context"), dict):
+            continue
+        topic_name = str(topic.get("topic", f"topic_{i}"))
+        ctx = topic["interface_1_curated_context"]
+
+        raw_ids = [str(v).strip() for v in (ctx.get("source_ids") or []) if str(v).strip()]
+        source_ids: list[str] = []
+        for sid in raw_ids:
+            m = re.fullmatch(r"ws0_s(\d+)", sid)
+            if sid not in url_by_id and m and f"ws1_s{m.group(1)}" in url_by_id:
+                sid = f"ws1_s{m.group(1)}"
+            if sid in url_by_id and sid not in source_ids:
+                source_ids.append(sid)
+
+        evidence_urls = [str(v).strip() for v in (ctx.get("evidence_source_urls") or []) if str(v).strip()]
+        news_urls = [
+            str(n.get("url", "")).strip() for n in (ctx.get("verified_news") or [])
+            if isinstance(n, dict) and str(n.get("url", "")).strip()
+        ]
+
+        if not source_ids:
+            for url in evidence_urls + news_urls:
+                sid = id_by_url.get(_normalize_url(url))
+                if sid and sid not in source_ids:
+                    source_ids.append(sid)
+            if source_ids:
+                repairs.append(f"{topic_name}: source_ids_from_urls={source_ids}")
+
+        if not evidence_urls:
+            evidence_urls = [url_by_id[sid] for sid in source_ids] or list(dict.fromkeys(news_urls))
+            if evidence_urls:
+                repairs.append(f"{topic_name}: evidence_source_urls_backfilled={len(evidence_urls)}")
+
+        if source_ids != raw_ids and not any(r.startswith(f"{topic_name}: source_ids_from_urls") for r in repairs):
+            repairs.append(f"{topic_name}: source_ids_normalized={source_ids}")
+
+        ctx["source_ids"] = source_ids
+        ctx["evidence_source_urls"] = evidence_urls
+
+    return repairs
+
+
+def _get_curation_cache() -> Optional[FileCache]:
+    if not OPENAI_PHASE2_CACHE_ENABLED:
+        return None
+    return FileCache(
+        CACHE_DATA_DIR / "phase2",
+        ttl_s=OPENAI_PHASE2_CACHE_TTL_HOURS * 3600,
+        max_bytes=int(OPENAI_PHASE2_CACHE_MAX_MB * 1024 * 1024) if OPENAI_PHASE2_CACHE_MAX_MB > 0 else None,
+    )
+
+
+def _curation_cache_key(
+    news_summary: str,
+    reports_summary: str,
+    screening_results: str,
+    date: str,
+    market: str,
+) -> str:
+    # 프롬프트/스키마가 바뀌면 키도 바뀌어 이전 결과를 재사용하지 않는다
+    return make_cache_key(
+        news_summary, reports_summary, screening_results, date, market,
+        OPENAI_PHASE2_MODEL, CURATED_TOPICS_JSON_SCHEMA, _CURATED_WEBSEARCH_PROMPT,
+    )
+
+
 def _build_retry_prompt(prompt: str, errors: list[str], available_ids: list[str]) -> str:
     issues = "\n".join(f"- {e}" for e in errors[:20])
     ids_hint = ", ".join(available_ids[:80]) if available_ids else "(없음)"
@@ -374,9 +535,19 @@ def curate_with_websearch(
     screening_results: str,
     date: str,
     market: str,
+    use_cache: bool = True,
+    on_topic: Optional[Callable[[int, dict], None]] = None,
 ) -> tuple[list[dict], dict]:
     """GPT-5.2 + 웹서치로 curated JSON 생성.
 
+    입력 섹션은 OPENAI_PHASE2_INPUT_TOKEN_BUDGET 안으로 압축한다. 뉴스/리포트 요약은
+    뒤쪽(중요도 낮은) 이슈부터, 스크리닝 결과는 아래쪽 줄부터 잘라내므로
+    호출 측은 종목을 중요도(수익률 크기) 순으로 정렬해서 넘겨야 한다.
+
+    동일 입력(요약·스크리닝·날짜·시장·모델·스키마)의 검증 통과 결과는 캐시에서 재생한다.
+    스트리밍 모드(OPENAI_PHASE2_STREAM)에서는 topic 객체가 완성될 때마다
+    ``on_topic(index, topic)`` 을 호출한다 (검증 전 초안이므로 최종 결과와 다를 수 있음).
+
     Returns:
         (topics 리스트, web_search_log dict)
     """
@@ -384,6 +555,28 @@ def curate_with_websearch(
     if not api_key:
         raise ValueError("OPENAI_API_KEY required for v2 curated")
 
+    fitted, budget_stats = fit_sections_to_budget(
+        {
+            "news_summary": split_summary_issues(news_summary) or [news_summary],
+            "reports_summary": split_summary_issues(reports_summary) or [reports_summary],
+            "screening_results": [line for line in screening_results.splitlines() if line.strip()] or [screening_results],
+        },
+        OPENAI_PHASE2_INPUT_TOKEN_BUDGET,
+        model=OPENAI_PHASE2_MODEL,
+        joiners={"screening_results": "\n"},
+    )
+    news_summary = fitted["news_summary"]
+    reports_summary = fitted["reports_summary"]
+    screening_results = fitted["screening_results"]
+
+    cache = _get_curation_cache() if use_cache else None
+    cache_key = _curation_cache_key(news_summary, reports_summary, screening_results, date, market)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached:
+            logger.info("[큐레이션] 캐시 적중 (topics=%d, key=%s)", len(cached["topics"]), cache_key[:12])
+            return cached["topics"], {**cached["websearch_log"], "cache_hit": True}
+
     base_prompt = _CURATED_WEBSEARCH_PROMPT.format(
         news_summary=news_summary,
         reports_summary=reports_summary,
@@ -402,12 +595,22 @@ def curate_with_websearch(
             else _build_retry_prompt(base_prompt, previous_errors, previous_available_ids)
         )
         payload = _build_payload(prompt)
-        data = _request_responses(payload, api_key)
+        started = time.perf_counter()
+        try:
+            if OPENAI_PHASE2_STREAM:
+                data = _request_responses_stream(payload, api_key, on_topic)
+            else:
+                data = _request_responses(payload, api_key)
+        except Exception:
+            record_llm_usage(payload["model"], None, time.perf_counter() - started, error=True)
+            raise
+        record_llm_usage(payload["model"], data.get("usage"), time.perf_counter() - started)
 
         output = data.get("output", [])
         log_data = _parse_web_search_log(output)
         log_data["timestamp"] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
         log_data["market"] = market
+        log_data["input_budget"] = budget_stats
         available_ids = sorted({
             str(s.get("source_id", "")).strip()
             for s in log_data.get("source_catalog", [])
@@ -418,6 +621,13 @@ def curate_with_websearch(
         try:
             topics = _parse_topics(data)
             errors, _ = _validate_topics(topics, log_data.get("source_catalog", []))
+            if errors:
+                # 재검색(60~180초) 전에 catalog 기반 로컬 보정으로 해결 시도
+                repairs = _repair_topics(topics, log_data.get("source_catalog", []))
+                if repairs:
+                    errors, _ = _validate_topics(topics, log_data.get("source_catalog", []))
+                    log_data["local_repair"] = {"repairs": repairs, "resolved": not errors}
+                    logger.info("[큐레이션] 로컬 보정 %d건 (해결=%s)", len(repairs), not errors)
         except (ValueError, json.JSONDecodeError) as e:
             topics = []
             errors = [str(e)]
@@ -431,6 +641,8 @@ def curate_with_websearch(
 
         if not errors:
             logger.info("[큐레이션] 성공 (attempt=%d, topics=%d)", attempt, len(topics))
+            if cache is not None:
+                cache.set(cache_key, {"topics": topics, "websearch_log": log_data})
             return topics, log_data
         previous_errors = errors
 
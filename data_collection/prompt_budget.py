@@ -0,0 +1,96 @@
+"""프롬프트 입력 토큰 예산 관리.
+
+큐레이션 프롬프트에 들어가는 섹션(뉴스 요약, 리포트 요약, 스크리닝 종목)을
+항목 단위로 나누고, 총 토큰이 예산을 넘으면 중요도가 낮은 뒤쪽 항목부터 잘라낸다.
+각 섹션의 항목은 호출 측에서 중요도 내림차순으로 넘겨야 한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Optional
+
+from ..ai.tokenizer import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Reduce 출력의 "## 이슈 제목" 단위로 분리
+_ISSUE_HEADING = re.compile(r"(?m)^(?=#{1,3} )")
+
+
+def split_summary_issues(summary: str) -> list[str]:
+    """요약 텍스트를 이슈 블록 리스트로 분리 (헤딩이 없으면 빈 줄 기준 문단)."""
+    text = (summary or "").strip()
+    if not text:
+        return []
+    blocks = [b.strip() for b in _ISSUE_HEADING.split(text) if b.strip()]
+    if len(blocks) <= 1:
+        blocks = [b.strip() for b in re.split(r"\n\s*\n", text) if b.strip()]
+    return blocks
+
+
+def _allocate(costs: dict[str, int], budget: int) -> dict[str, int]:
+    """섹션별 예산 배분: 균등 몫보다 작게 쓰는 섹션의 남는 몫을 나머지에 재분배."""
+    allocation: dict[str, int] = {}
+    remaining = dict(costs)
+    left = budget
+    while remaining:
+        share = left // len(remaining)
+        small = {name: cost for name, cost in remaining.items() if cost <= share}
+        if not small:
+            for name in remaining:
+                allocation[name] = share
+            break
+        for name, cost in small.items():
+            allocation[name] = cost
+            left -= cost
+            del remaining[name]
+    return allocation
+
+
+def fit_sections_to_budget(
+    sections: dict[str, list[str]],
+    budget: int,
+    model: str = "",
+    joiners: Optional[dict[str, str]] = None,
+) -> tuple[dict[str, str], dict[str, dict[str, int]]]:
+    """섹션별 항목을 예산 안으로 잘라 문자열로 합친다.
+
+    Args:
+        sections: 섹션명 → 중요도 내림차순 항목 리스트
+        budget: 전체 입력 토큰 예산 (0 이하면 자르지 않음)
+        joiners: 섹션별 항목 연결 문자열 (기본: 빈 줄)
+
+    Returns:
+        (섹션명 → 합쳐진 텍스트, 섹션명 → {"items", "kept", "tokens"} 통계)
+    """
+    item_tokens = {
+        name: [count_tokens(item, model) for item in items]
+        for name, items in sections.items()
+    }
+    costs = {name: sum(tokens) for name, tokens in item_tokens.items()}
+    allocation = _allocate(costs, budget) if budget > 0 and sum(costs.values()) > budget else costs
+
+    fitted: dict[str, str] = {}
+    stats: dict[str, dict[str, int]] = {}
+    for name, items in sections.items():
+        joiner = (joiners or {}).get(name, "\n\n")
+        kept: list[str] = []
+        used = 0
+        for item, tokens in zip(items, item_tokens[name]):
+            # 섹션당 최소 1개 항목은 유지
+            if kept and used + tokens > allocation[name]:
+                break
+            kept.append(item)
+            used += tokens
+        dropped = len(items) - len(kept)
+        text = joiner.join(kept)
+        if dropped:
+            text += f"{joiner}(중요도 낮은 {dropped}건 생략)"
+        fitted[name] = text
+        stats[name] = {"items": len(items), "kept": len(kept), "tokens": used}
+
+    if any(s["kept"] < s["items"] for s in stats.values()):
+        logger.info("[프롬프트 예산] %d토큰 예산 적용: %s", budget, stats)
+    return fitted, stats
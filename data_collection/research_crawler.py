@@ -11,6 +11,7 @@ import json
 import logging
 import os
 import re
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Optional
@@ -19,12 +20,16 @@ from urllib.parse import urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
 
+from ..ai.json_parsing import extract_json_object
+from ..ai.llm_metrics import bind_llm_stats, record_llm_usage
 from ..config import (
     OPENAI_API_KEY,
+    OPENAI_BATCH_MODE,
     OPENAI_RESEARCH_MAX_OUTPUT_TOKENS,
     OPENAI_RESEARCH_MODEL,
     RESEARCH_DATA_DIR,
 )
+from .openai_batch import run_batch
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +55,7 @@ You are a Korean financial research analyst. Read the attached PDF report and re
 
 - `summary`: 5-8 sentences in Korean
 - `key_points`: list of 3-8 bullet strings
-- `metrics`: list of objects `{name, value, unit, context}`
+- `metrics`: list of objects `{{name, value, unit, context}}`
 - `topics`, `entities`, `risks`, `recommendations`: lists of strings
 - Keep the JSON compact and valid. Do not include markdown/code fences.
 - `language`: must be `"ko"`
@@ -154,26 +159,14 @@ def _extract_output_text(response_json: dict) -> str:
     return "\n".join(texts).strip()
 
 
-def _normalize_json_text(text: str) -> str:
-    text = (text or "").strip()
-    if text.startswith("```"):
-        text = re.sub(r"^```[a-zA-Z0-9_-]*\s*", "", text)
-        text = re.sub(r"\s*```$", "", text)
-        text = text.strip()
-    if text.startswith("{") and text.endswith("}"):
-        return text
-    match = re.search(r"\{[\s\S]*\}", text)
-    return match.group(0) if match else text
-
-
-def _summarize_pdf_bytes(
+def _build_pdf_payload(
     pdf_bytes: bytes,
     filename: str,
     metadata: dict,
-    api_key: str,
     model: str,
     max_output_tokens: int,
 ) -> dict:
+    """PDF 요약용 Responses API payload 생성."""
     file_size_mb = len(pdf_bytes) / (1024 * 1024)
     if file_size_mb > MAX_PDF_MB:
         raise ValueError(f"PDF too large: {file_size_mb:.2f} MB")
@@ -195,23 +188,15 @@ def _summarize_pdf_bytes(
         "text": {"format": {"type": "json_object"}},
         "max_output_tokens": max_output_tokens,
     }
+    return payload
 
-    resp = requests.post(
-        OPENAI_API_URL,
-        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-        json=payload,
-        timeout=120,
-    )
-    resp.raise_for_status()
-    output_text = _extract_output_text(resp.json())
 
-    normalized = _normalize_json_text(output_text)
-    if normalized:
+def _parse_pdf_summary(output_text: str, metadata: dict) -> dict:
+    """모델 출력 텍스트 → 요약 dict. JSON 파싱 실패 시 원문 일부로 대체."""
+    if (output_text or "").strip():
         try:
-            parsed = json.loads(normalized)
-            if isinstance(parsed, dict):
-                return parsed
-        except json.JSONDecodeError:
+            return extract_json_object(output_text)
+        except ValueError:
             pass
 
     preview = (output_text or "").strip()
@@ -223,15 +208,103 @@ def _summarize_pdf_bytes(
     }
 
 
+def _summarize_pdf_bytes(
+    pdf_bytes: bytes,
+    filename: str,
+    metadata: dict,
+    api_key: str,
+    model: str,
+    max_output_tokens: int,
+) -> dict:
+    payload = _build_pdf_payload(pdf_bytes, filename, metadata, model, max_output_tokens)
+    started = time.perf_counter()
+    resp = requests.post(
+        OPENAI_API_URL,
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+        json=payload,
+        timeout=120,
+    )
+    if not resp.ok:
+        record_llm_usage(model, None, time.perf_counter() - started, error=True)
+    resp.raise_for_status()
+    data = resp.json()
+    record_llm_usage(model, data.get("usage"), time.perf_counter() - started)
+    return _parse_pdf_summary(_extract_output_text(data), metadata)
+
+
+def _download_pdf(item: dict) -> tuple[bytes, str, dict]:
+    pdf_resp = requests.get(
+        item["pdf_url"], headers={"User-Agent": USER_AGENT}, timeout=REQUEST_TIMEOUT, stream=True,
+    )
+    pdf_resp.raise_for_status()
+    filename = os.path.basename(urlparse(item["pdf_url"]).path) or "report.pdf"
+    meta = {k: item[k] for k in ("source", "category", "title", "firm", "date") if k in item}
+    return pdf_resp.content, filename, meta
+
+
+def _summarize_in_batch(
+    items: list[dict],
+    api_key: str,
+    model: str,
+    max_output_tokens: int,
+    max_workers: int,
+    job_name: str,
+) -> list[dict]:
+    """PDF를 병렬로 내려받아 요약 요청을 하나의 배치 작업으로 제출."""
+    prepared: dict[int, dict] = {}
+    results: dict[int, dict] = {}
+
+    def _prepare(index: int, item: dict) -> None:
+        if not item.get("pdf_url"):
+            results[index] = {**item, "summary": "", "summary_status": "skipped_no_pdf"}
+            return
+        try:
+            pdf_bytes, filename, meta = _download_pdf(item)
+            prepared[index] = {
+                "meta": meta,
+                "body": _build_pdf_payload(pdf_bytes, filename, meta, model, max_output_tokens),
+            }
+        except Exception as e:
+            results[index] = {**item, "summary": "", "summary_status": "error", "summary_error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        list(ex.map(_prepare, range(len(items)), items))
+
+    try:
+        responses = run_batch(
+            {f"report-{i}": p["body"] for i, p in prepared.items()},
+            "/v1/responses",
+            api_key=api_key,
+            job_name=job_name,
+        )
+    except Exception as e:
+        logger.warning("[리포트 크롤러] 배치 실패: %s", e)
+        responses = {}
+
+    for index, p in prepared.items():
+        body = responses.get(f"report-{index}")
+        if body is None:
+            results[index] = {**items[index], "summary": "", "summary_status": "error", "summary_error": "batch_failed"}
+            continue
+        record_llm_usage(model, body.get("usage"))
+        summary = _parse_pdf_summary(_extract_output_text(body), p["meta"])
+        results[index] = {**items[index], **summary, "summary_status": "ok"}
+
+    return [results[i] for i in range(len(items))]
+
+
 def crawl_research(
     target_date: dt.date,
     summarize: bool = True,
     api_key: str = "",
     model: str = "",
     max_workers: int = DEFAULT_MAX_WORKERS,
+    batch: Optional[bool] = None,
 ) -> list[dict]:
     """Naver Finance 리포트 크롤링 + PDF 요약.
 
+    batch=True (기본값: OPENAI_BATCH_MODE) 이면 PDF 요약을 Batch API로 한 번에 제출한다.
+
     Returns:
         요약된 리포트 리스트 [{title, source, summary, date, ...}]
     """
@@ -259,23 +332,24 @@ def crawl_research(
         if not item.get("pdf_url"):
             return {**item, "summary": "", "summary_status": "skipped_no_pdf"}
         try:
-            pdf_resp = requests.get(
-                item["pdf_url"], headers={"User-Agent": USER_AGENT}, timeout=REQUEST_TIMEOUT, stream=True,
-            )
-            pdf_resp.raise_for_status()
-            pdf_bytes = pdf_resp.content
-            filename = os.path.basename(urlparse(item["pdf_url"]).path) or "report.pdf"
-            meta = {k: item[k] for k in ("source", "category", "title", "firm", "date") if k in item}
+            pdf_bytes, filename, meta = _download_pdf(item)
             summary = _summarize_pdf_bytes(pdf_bytes, filename, meta, api_key, model, max_output_tokens)
             return {**item, **summary, "summary_status": "ok"}
         except Exception as e:
             return {**item, "summary": "", "summary_status": "error", "summary_error": str(e)}
 
     results: list[dict] = []
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = {ex.submit(_summarize_one, item): item for item in all_items}
-        for fut in as_completed(futures):
-            results.append(fut.result())
+    if OPENAI_BATCH_MODE if batch is None else batch:
+        results = _summarize_in_batch(
+            all_items, api_key, model, max_output_tokens, max_workers,
+            job_name=f"research_{target_date.isoformat()}",
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            summarize_one = bind_llm_stats(_summarize_one)
+            futures = {ex.submit(summarize_one, item): item for item in all_items}
+            for fut in as_completed(futures):
+                results.append(fut.result())
 
     # JSON 저장
     out_path = summary_dir / "all.json"
@@ -3,7 +3,7 @@
 노드 흐름 (22개):
   START → [라우터: input_path 유무]
     ├─ 파일 로드: load_curated_context → run_page_purpose ...
-    └─ 데이터 수집: crawl_news → crawl_research → screen_stocks
+    └─ 데이터 수집: [crawl_news ∥ crawl_research ∥ screen_stocks] → join_data_collection (barrier)
         → summarize_news → summarize_research → curate_topics
         → build_curated_context → run_page_purpose ...
   ... → run_page_purpose → run_historical_case → run_narrative_body
@@ -16,10 +16,11 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Optional, TypedDict
+from typing import Annotated, Any, Callable, Optional, TypedDict
 
 from langgraph.graph import END, START, StateGraph
 
+from .ai.llm_metrics import collect_llm_stats
 from .nodes.crawlers import crawl_news_node, crawl_research_node
 from .nodes.curation import (
     build_curated_context_node,
@@ -128,13 +129,41 @@ class BriefingPipelineState(TypedDict):
 
 
 
+# ── 노드 계측 ──
+
+def _with_llm_stats(node_name: str, node_fn: Callable[[dict], dict]) -> Callable[[dict], dict]:
+    """노드 실행 중 LLM 호출 통계(호출 수, 대기·응답 시간, 토큰, 추정 비용)를 metrics[node_name]["llm"]에 추가."""
+
+    # functools.wraps는 쓰지 않는다: LangGraph가 원본(traceable) 시그니처를 보고 config 인자를 넘기려 함
+    def wrapper(state: dict) -> dict:
+        with collect_llm_stats(node_name) as stats:
+            result = node_fn(state)
+        metrics = result.get("metrics") if isinstance(result, dict) else None
+        if (stats.calls or stats.cache_hits) and isinstance(metrics, dict) and isinstance(metrics.get(node_name), dict):
+            metrics[node_name] = {**metrics[node_name], "llm": stats.as_dict()}
+        return result
+
+    wrapper.__name__ = getattr(node_fn, "__name__", node_name)
+    wrapper.__doc__ = node_fn.__doc__
+    return wrapper
+
+
 # ── 조건부 라우팅 ──
 
-def route_data_source(state: BriefingPipelineState) -> str:
-    """input_path 유무로 데이터 소스 결정."""
+# 서로 입력을 공유하지 않는 데이터 수집 브랜치 (병렬 실행)
+_COLLECTION_BRANCHES = ["crawl_news", "crawl_research", "screen_stocks"]
+
+
+def route_data_source(state: BriefingPipelineState) -> str | list[str]:
+    """input_path 유무로 데이터 소스 결정 (데이터 수집은 3개 브랜치로 fan-out)."""
     if state.get("input_path"):
         return "load_from_file"
-    return "collect_data"
+    return list(_COLLECTION_BRANCHES)
+
+
+def join_data_collection_node(state: dict) -> dict:
+    """데이터 수집 브랜치 합류 지점 (모든 브랜치가 끝난 뒤 한 번만 실행, 상태 변경 없음)."""
+    return {}
 
 
 def check_error(state: BriefingPipelineState) -> str:
@@ -170,41 +199,42 @@ def build_graph() -> Any:
     graph = StateGraph(BriefingPipelineState)
 
     # Data Collection 노드 (7개)
-    graph.add_node("crawl_news", crawl_news_node)
-    graph.add_node("crawl_research", crawl_research_node)
-    graph.add_node("screen_stocks", screen_stocks_node)
-    graph.add_node("summarize_news", summarize_news_node)
-    graph.add_node("summarize_research", summarize_research_node)
-    graph.add_node("curate_topics", curate_topics_node)
-    graph.add_node("build_curated_context", build_curated_context_node)
+    graph.add_node("crawl_news", _with_llm_stats("crawl_news", crawl_news_node))
+    graph.add_node("crawl_research", _with_llm_stats("crawl_research", crawl_research_node))
+    graph.add_node("screen_stocks", _with_llm_stats("screen_stocks", screen_stocks_node))
+    graph.add_node("summarize_news", _with_llm_stats("summarize_news", summarize_news_node))
+    graph.add_node("summarize_research", _with_llm_stats("summarize_research", summarize_research_node))
+    graph.add_node("curate_topics", _with_llm_stats("curate_topics", curate_topics_node))
+    graph.add_node("build_curated_context", _with_llm_stats("build_curated_context", build_curated_context_node))
+    graph.add_node("join_data_collection", join_data_collection_node)
 
     # Interface 1 (파일 로드)
-    graph.add_node("load_curated_context", load_curated_context_node)
+    graph.add_node("load_curated_context", _with_llm_stats("load_curated_context", load_curated_context_node))
 
     # Interface 2 (순차 4단계)
-    graph.add_node("run_page_purpose", run_page_purpose_node)
-    graph.add_node("run_historical_case", run_historical_case_node)
-    graph.add_node("run_narrative_body", run_narrative_body_node)
-    graph.add_node("validate_interface2", validate_interface2_node)
+    graph.add_node("run_page_purpose", _with_llm_stats("run_page_purpose", run_page_purpose_node))
+    graph.add_node("run_historical_case", _with_llm_stats("run_historical_case", run_historical_case_node))
+    graph.add_node("run_narrative_body", _with_llm_stats("run_narrative_body", run_narrative_body_node))
+    graph.add_node("validate_interface2", _with_llm_stats("validate_interface2", validate_interface2_node))
 
     # Interface 3 (10노드 순차)
-    graph.add_node("run_theme", run_theme_node)
-    graph.add_node("run_pages", run_pages_node)
-    graph.add_node("run_hallcheck_pages", run_hallcheck_pages_node)
-    graph.add_node("run_glossary", run_glossary_node)
-    graph.add_node("run_hallcheck_glossary", run_hallcheck_glossary_node)
-    graph.add_node("run_tone_final", run_tone_final_node)
-    graph.add_node("run_chart_agent", run_chart_agent_node)
-    graph.add_node("run_hallcheck_chart", run_hallcheck_chart_node)
-    graph.add_node("collect_sources", collect_sources_node)
-    graph.add_node("assemble_output", assemble_output_node)
+    graph.add_node("run_theme", _with_llm_stats("run_theme", run_theme_node))
+    graph.add_node("run_pages", _with_llm_stats("run_pages", run_pages_node))
+    graph.add_node("run_hallcheck_pages", _with_llm_stats("run_hallcheck_pages", run_hallcheck_pages_node))
+    graph.add_node("run_glossary", _with_llm_stats("run_glossary", run_glossary_node))
+    graph.add_node("run_hallcheck_glossary", _with_llm_stats("run_hallcheck_glossary", run_hallcheck_glossary_node))
+    graph.add_node("run_tone_final", _with_llm_stats("run_tone_final", run_tone_final_node))
+    graph.add_node("run_chart_agent", _with_llm_stats("run_chart_agent", run_chart_agent_node))
+    graph.add_node("run_hallcheck_chart", _with_llm_stats("run_hallcheck_chart", run_hallcheck_chart_node))
+    graph.add_node("collect_sources", _with_llm_stats("collect_sources", collect_sources_node))
+    graph.add_node("assemble_output", _with_llm_stats("assemble_output", assemble_output_node))
 
     # ── 엣지 ──
 
     # START → 라우터
     graph.add_conditional_edges(START, route_data_source, {
         "load_from_file": "load_curated_context",
-        "collect_data": "crawl_news",
+        **{name: name for name in _COLLECTION_BRANCHES},
     })
 
     # 파일 로드 → Interface 2
@@ -214,11 +244,10 @@ def build_graph() -> Any:
         {"continue": "run_page_purpose", "end": END},
     )
 
-    # 데이터 수집 체인 (순차)
-    graph.add_edge("crawl_news", "crawl_research")
-    graph.add_edge("crawl_research", "screen_stocks")
+    # 데이터 수집: 3개 브랜치 병렬 → barrier (전부 끝나야 진행) → 순차 요약/큐레이션
+    graph.add_edge(_COLLECTION_BRANCHES, "join_data_collection")
     graph.add_conditional_edges(
-        "screen_stocks",
+        "join_data_collection",
         check_error,
         {"continue": "summarize_news", "end": END},
     )
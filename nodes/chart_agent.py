@@ -5,7 +5,6 @@ Handles the creation of financial charts by actively fetching data.
 
 from __future__ import annotations
 
-import json
 import logging
 import time
 from typing import Any, Callable
@@ -55,8 +54,6 @@ def run_chart_agent_node(state: dict) -> dict:
         charts: dict[str, Any] = {}
         all_sources: list[dict] = list(state.get("sources") or [])
 
-        internal_context_summary = json.dumps(curated, ensure_ascii=False)[:3000]
-
         for step, title, section_key in SECTION_MAP:
             section = narrative[section_key]
             viz_hint = section.get("viz_hint")
@@ -84,7 +81,7 @@ def run_chart_agent_node(state: dict) -> dict:
                 "section_title": title,
                 "content": section["content"],
                 "viz_hint": viz_hint,
-                "curated_context": internal_context_summary,
+                "curated_context": curated,
             })
 
             tool_calls = reasoning_result.get("tool_calls", [])
@@ -121,8 +118,8 @@ def run_chart_agent_node(state: dict) -> dict:
                 "step": step,
                 "viz_hint": viz_hint,
                 "chart_type": chart_type,
-                "internal_context_summary": internal_context_summary,
-                "tool_outputs": json.dumps(tool_outputs, ensure_ascii=False),
+                "internal_context_summary": curated,
+                "tool_outputs": tool_outputs,
                 "color_palette": COLOR_PALETTE,
             })
 
@@ -192,9 +189,9 @@ def run_hallcheck_chart_node(state: dict) -> dict:
                 continue
 
             result = call_llm_with_prompt("3_hallcheck_chart", {
-                "chart_json": json.dumps(chart, ensure_ascii=False),
-                "source_context": json.dumps(curated, ensure_ascii=False)[:2000],
-                "sources_metadata": json.dumps(state.get("sources", []), ensure_ascii=False),
+                "chart_json": chart,
+                "source_context": curated,
+                "sources_metadata": state.get("sources", []),
             })
 
             new_items = result.get("hallucination_checklist", [])
@@ -175,8 +175,12 @@ def curate_topics_node(state: dict) -> dict:
         news_summary = state.get("news_summary", "(뉴스 없음)")
         research_summary = state.get("research_summary", "(리포트 없음)")
 
-        # 스크리닝 결과를 텍스트로 포맷
-        matched = state.get("matched_stocks", [])
+        # 스크리닝 결과를 텍스트로 포맷 (수익률 크기 순: 예산 초과 시 아래쪽부터 생략)
+        matched = sorted(
+            state.get("matched_stocks", []),
+            key=lambda s: abs(s.get("return_pct") or 0),
+            reverse=True,
+        )
         screening_lines = []
         for s in matched:
             screening_lines.append(
@@ -187,6 +191,16 @@ def curate_topics_node(state: dict) -> dict:
 
         market = state.get("market", "KR")
         date = dt.date.today().isoformat()
+        topic_index = state.get("topic_index", 0)
+
+        def _on_topic(index: int, topic: dict) -> None:
+            # 선택된 topic이 스트림에서 완성되면 나머지 생성 중에 Interface 2를 먼저 시작
+            if index != topic_index:
+                return
+            from .interface2 import prefetch_page_purpose
+
+            raw_ctx = topic.get("interface_1_curated_context", topic)
+            prefetch_page_purpose(CuratedContext.model_validate(raw_ctx).model_dump())
 
         topics, log_data = curate_with_websearch(
             news_summary=news_summary,
@@ -194,6 +208,7 @@ def curate_topics_node(state: dict) -> dict:
             screening_results=screening_results,
             date=date,
             market=market,
+            on_topic=_on_topic,
         )
 
         logger.info("  curate_topics 완료: %d topics", len(topics))
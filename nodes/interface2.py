@@ -11,11 +11,14 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
 
 from langsmith import traceable
 
+from ..ai.llm_metrics import bind_llm_stats
 from ..ai.llm_utils import call_llm_with_prompt
 from ..schemas import RawNarrative
 
@@ -128,6 +131,77 @@ def _mock_hallucination_check(pp: dict, hc: dict, narr: dict) -> dict:
     }
 
 
+# ── page_purpose 선행 실행 (큐레이션 스트리밍 중) ──
+
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_PREFETCHED: dict[str, Future] = {}
+_PREFETCH_LOCK = threading.Lock()
+
+
+def _page_purpose_key(curated: dict) -> str:
+    # 로컬 보정으로 바뀔 수 있는 인용 필드는 키에서 제외
+    body = {k: v for k, v in curated.items() if k not in ("source_ids", "evidence_source_urls")}
+    return json.dumps(body, ensure_ascii=False, sort_keys=True)
+
+
+def _discard_prefetched_locked() -> None:
+    """남은 선행 실행을 취소하고 비운다 (_PREFETCH_LOCK 보유 상태에서 호출).
+
+    아직 시작하지 않은 호출만 취소되고, 이미 실행 중인 호출은 끝까지 돈 뒤 결과가 버려진다.
+    """
+    for future in _PREFETCHED.values():
+        future.cancel()
+    _PREFETCHED.clear()
+
+
+def prefetch_page_purpose(curated: dict) -> None:
+    """검증된 CuratedContext로 page_purpose를 미리 실행.
+
+    나머지 topic이 생성되는 동안 백그라운드에서 돌리고,
+    run_page_purpose_node가 같은 curated_context를 받으면 결과를 재사용한다.
+    executor는 처음 호출될 때 만들고 shutdown_page_purpose_prefetch()로 정리한다.
+    """
+    global _prefetch_executor
+
+    key = _page_purpose_key(curated)
+    with _PREFETCH_LOCK:
+        if key in _PREFETCHED:
+            return
+        _discard_prefetched_locked()  # 한 번에 하나의 실행만 선행 대상
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page_purpose_prefetch")
+        # 선행 호출의 사용량은 호출을 띄운 노드(curate_topics) 통계에 기록
+        _PREFETCHED[key] = _prefetch_executor.submit(
+            bind_llm_stats(call_llm_with_prompt), "page_purpose", {"curated_context": curated},
+        )
+    logger.info("  page_purpose 선행 실행 시작: theme=%s", str(curated.get("theme", ""))[:50])
+
+
+def _take_prefetched_page_purpose(curated: dict) -> Optional[dict]:
+    with _PREFETCH_LOCK:
+        future = _PREFETCHED.pop(_page_purpose_key(curated), None)
+        # 키가 맞지 않은 선행 실행(재시도·curated_context 변경)은 더 이상 쓸 일이 없다
+        _discard_prefetched_locked()
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception as e:
+        logger.warning("  page_purpose 선행 실행 실패, 다시 호출: %s", e)
+        return None
+
+
+def shutdown_page_purpose_prefetch() -> None:
+    """파이프라인 실행 종료 시 남은 선행 실행을 취소하고 executor를 닫는다."""
+    global _prefetch_executor
+
+    with _PREFETCH_LOCK:
+        _discard_prefetched_locked()
+        executor, _prefetch_executor = _prefetch_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 # ── LangGraph 노드들 ──
 
 @traceable(name="run_page_purpose", run_type="llm",
@@ -147,9 +221,13 @@ def run_page_purpose_node(state: dict) -> dict:
         if backend == "mock":
             result = _mock_page_purpose(curated)
         else:
-            result = call_llm_with_prompt("page_purpose", {
-                "curated_context": curated,
-            })
+            result = _take_prefetched_page_purpose(curated)
+            if result is not None:
+                logger.info("  page_purpose 선행 실행 결과 사용")
+            else:
+                result = call_llm_with_prompt("page_purpose", {
+                    "curated_context": curated,
+                })
 
         logger.info("  page_purpose 완료: theme=%s", result.get("theme", "")[:50])
         return {
@@ -6,7 +6,6 @@ viz 브랜치 아키텍처 + jihoon v11 프롬프트 기반 10노드 순차 파
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 import time
@@ -59,7 +58,7 @@ def run_theme_node(state: dict) -> dict:
             result = {"theme": raw["theme"], "one_liner": raw["one_liner"]}
         else:
             result = call_llm_with_prompt("3_theme", {
-                "validated_interface_2": json.dumps(raw, ensure_ascii=False),
+                "validated_interface_2": raw,
             })
 
         logger.info("  run_theme done: theme=%s", result.get("theme", "")[:50])
@@ -109,7 +108,7 @@ def run_pages_node(state: dict) -> dict:
             result = {"pages": pages}
         else:
             result = call_llm_with_prompt("3_pages", {
-                "validated_interface_2": json.dumps(raw, ensure_ascii=False),
+                "validated_interface_2": raw,
             })
 
         page_count = len(result.get("pages", []))
@@ -159,9 +158,9 @@ def run_hallcheck_pages_node(state: dict) -> dict:
             }
         else:
             result = call_llm_with_prompt("3_hallcheck_pages", {
-                "validated_interface_2": json.dumps(raw, ensure_ascii=False),
-                "theme_output": json.dumps(i3_theme, ensure_ascii=False),
-                "pages_output": json.dumps(i3_pages, ensure_ascii=False),
+                "validated_interface_2": raw,
+                "theme_output": i3_theme,
+                "pages_output": i3_pages,
             })
 
         risk = result.get("overall_risk", "unknown")
@@ -222,7 +221,7 @@ def run_glossary_node(state: dict) -> dict:
 
         # 1. Term Extraction
         extraction_result = call_llm_with_prompt("3_glossary_term_extraction", {
-            "validated_pages": json.dumps(validated_pages, ensure_ascii=False),
+            "validated_pages": validated_pages,
         })
         terms_to_search = extraction_result.get("terms_to_search", [])
         logger.info(f"  Extracted {len(terms_to_search)} terms to search.")
@@ -262,8 +261,8 @@ def run_glossary_node(state: dict) -> dict:
 
         # 3. Glossary Generation
         result = call_llm_with_prompt("3_glossary", {
-            "validated_interface_2": json.dumps(raw, ensure_ascii=False),
-            "validated_pages": json.dumps(validated_pages, ensure_ascii=False),
+            "validated_interface_2": raw,
+            "validated_pages": validated_pages,
             "search_results": search_results_text,
         })
 
@@ -318,9 +317,9 @@ def run_hallcheck_glossary_node(state: dict) -> dict:
         else:
             search_context = state.get("i3_glossary_search_context", "(검색 결과 없음)")
             result = call_llm_with_prompt("3_hallcheck_glossary", {
-                "validated_interface_2": json.dumps(raw, ensure_ascii=False),
-                "validated_pages": json.dumps(validated_pages, ensure_ascii=False),
-                "page_glossaries": json.dumps(i3_glossaries, ensure_ascii=False),
+                "validated_interface_2": raw,
+                "validated_pages": validated_pages,
+                "page_glossaries": i3_glossaries,
                 "search_results": search_context,
             })
 
@@ -385,8 +384,8 @@ def run_tone_final_node(state: dict) -> dict:
             result = call_llm_with_prompt("3_tone_final", {
                 "validated_theme": validated_theme,
                 "validated_one_liner": validated_one_liner,
-                "validated_pages": json.dumps(validated_pages, ensure_ascii=False),
-                "validated_page_glossaries": json.dumps(validated_glossaries, ensure_ascii=False),
+                "validated_pages": validated_pages,
+                "validated_page_glossaries": validated_glossaries,
             })
 
         briefing = result.get("interface_3_final_briefing", {})
@@ -11,22 +11,34 @@ datapipeline/prompts/prompt_loader.py에서 복제.
     thinking: true
     thinking_effort: medium
     response_format: json_object
+    cache_prefix: curated_context
     system_message: >
       당신은 투자 전문가입니다.
     ---
     {{include:_tone_guide}} 를 통해 다른 .md 파일을 인라인할 수 있다.
     {{variable}} 를 통해 런타임 변수를 치환할 수 있다.
 
+``cache_prefix`` 에 쉼표로 나열한 변수는 본문에서 빠져 ``PromptSpec.cache_prefix`` 로 모인다.
+여러 프롬프트가 같은 대용량 컨텍스트를 공유할 때 이를 요청 맨 앞에 두어
+프로바이더 프롬프트 캐시(Anthropic cache_control, OpenAI 자동 prefix 캐시)가 적중하게 한다.
+
 ``load_prompt`` 은 ``PromptSpec`` 데이터클래스를 반환한다.
+
+파일 읽기·frontmatter 파싱·include 해결은 ``compile_prompt`` 가 (디렉토리, 이름) 단위로 한 번만 하고,
+본문을 리터럴/변수 조각으로 미리 나눠 둔다. 호출마다 하는 일은 조각 join뿐이다.
+템플릿이나 include 파일의 mtime이 바뀌면 다시 컴파일한다.
 """
 
 from __future__ import annotations
 
+import dataclasses
 import logging
+import os
 import re
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 LOGGER = logging.getLogger(__name__)
 
@@ -57,6 +69,7 @@ class PromptSpec:
     max_tokens: int = 4096
     thinking: bool = False             # GPT-5 thinking 모드 활성화
     thinking_effort: str = "medium"    # low, medium, high
+    cache_prefix: str = ""             # 프롬프트 간 공유되는 컨텍스트 블록 (요청 맨 앞에 배치)
     extra: dict[str, Any] = field(default_factory=dict)
 
 
@@ -103,12 +116,14 @@ def _parse_frontmatter(raw: str) -> tuple[dict[str, str], str]:
     return meta, body
 
 
-def _resolve_includes(body: str, prompts_dir: Path) -> str:
-    """{{include:filename}} 지시자를 참조된 파일 내용으로 치환한다."""
+def _resolve_includes(body: str, prompts_dir: Path, deps: Optional[list[Path]] = None) -> str:
+    """{{include:filename}} 지시자를 참조된 파일 내용으로 치환한다 (참조 경로는 ``deps`` 에 추가)."""
 
     def _replacer(match: re.Match[str]) -> str:
         name = match.group(1)
         include_path = prompts_dir / f"{name}.md"
+        if deps is not None:
+            deps.append(include_path)
         if not include_path.exists():
             LOGGER.warning("Include file not found: %s", include_path)
             return ""
@@ -117,61 +132,91 @@ def _resolve_includes(body: str, prompts_dir: Path) -> str:
     return _INCLUDE_PATTERN.sub(_replacer, body)
 
 
-def _substitute_vars(body: str, variables: dict[str, str]) -> str:
-    """{{variable}} 플레이스홀더를 제공된 값으로 치환한다."""
+def _split_vars(text: str) -> tuple[str, ...]:
+    """본문 → (리터럴, 변수명, 리터럴, 변수명, ..., 리터럴). 홀수 인덱스가 변수명."""
+    return tuple(_VAR_PATTERN.split(text))
 
-    def _replacer(match: re.Match[str]) -> str:
-        key = match.group(1)
-        if key in variables:
-            return variables[key]
-        LOGGER.debug("Unresolved variable: {{%s}}", key)
-        return ""
 
-    return _VAR_PATTERN.sub(_replacer, body)
+def _render(parts: tuple[str, ...], variables: dict[str, str], refs: dict[str, str]) -> str:
+    """조각을 join해 {{variable}} 을 치환한다. ``refs`` 의 변수는 값 대신 참조 문구로 채운다."""
+    out = list(parts)
+    for i in range(1, len(parts), 2):
+        key = parts[i]
+        if key in refs:
+            out[i] = refs[key]
+        elif key in variables:
+            out[i] = variables[key]
+        else:
+            LOGGER.debug("Unresolved variable: {{%s}}", key)
+            out[i] = ""
+    return "".join(out)
 
 
-def _parse_bool(value: str) -> bool:
-    """문자열을 bool로 변환."""
-    return value.strip().lower() in {"true", "1", "yes", "on"}
+def _extract_cache_prefix(names: tuple[str, ...], variables: dict[str, str]) -> tuple[str, dict[str, str]]:
+    """공유 컨텍스트 변수를 prefix 블록으로 모으고, 본문에 남길 참조 문구를 반환한다.
 
+    블록 형식은 프롬프트와 무관하게 변수명·값만으로 정해지므로,
+    같은 값을 넘기는 프롬프트끼리는 prefix가 바이트 단위로 동일하다.
+    """
+    blocks: list[str] = []
+    refs: dict[str, str] = {}
+    for name in names:
+        if name not in variables:
+            continue
+        blocks.append(f"[공유 컨텍스트: {name}]\n{variables[name]}")
+        refs[name] = f"(요청 앞부분의 [공유 컨텍스트: {name}] 참고)"
+    return "\n\n".join(blocks), refs
 
-def load_prompt(
-    name: str,
-    prompts_dir: str | Path | None = None,
-    **kwargs: str,
-) -> PromptSpec:
-    """이름으로 프롬프트 템플릿을 로드하고, include 해결 및 변수 치환을 수행한다.
 
-    Args:
-        name: 확장자 없는 프롬프트 파일 이름 (예: "page_purpose").
-        prompts_dir: 오버라이드 디렉토리. 기본값: ``interface/prompts/templates/``.
-        **kwargs: 템플릿에 치환할 변수.
-
-    Returns:
-        렌더링된 body와 메타데이터가 담긴 PromptSpec.
-    """
-    directory = Path(prompts_dir) if prompts_dir else _DEFAULT_DIR
-    filepath = directory / f"{name}.md"
+def _parse_bool(value: str) -> bool:
+    """문자열을 bool로 변환."""
+    return value.strip().lower() in {"true", "1", "yes", "on"}
 
-    if not filepath.exists():
-        raise FileNotFoundError(f"프롬프트 템플릿을 찾을 수 없습니다: {filepath}")
 
+def _file_stamp(path: Path) -> Optional[tuple[int, int]]:
+    """(mtime_ns, 크기). 파일이 없으면 None (나중에 생기면 변경으로 간주)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """변수 치환 직전까지 처리된 프롬프트 (include 해결, 본문 조각화, 메타데이터 파싱 완료)."""
+
+    base: PromptSpec                      # body/system_message/cache_prefix를 뺀 메타데이터
+    body_parts: tuple[str, ...]
+    system_parts: tuple[str, ...]
+    prefix_names: tuple[str, ...]
+    deps: tuple[tuple[Path, Optional[tuple[int, int]]], ...]  # (템플릿·include 경로, 컴파일 시점 stamp)
+
+    def is_stale(self) -> bool:
+        return any(_file_stamp(path) != stamp for path, stamp in self.deps)
+
+    def render(self, variables: dict[str, str]) -> PromptSpec:
+        cache_prefix, refs = _extract_cache_prefix(self.prefix_names, variables)
+        return dataclasses.replace(
+            self.base,
+            body=_render(self.body_parts, variables, refs).strip(),
+            system_message=_render(self.system_parts, variables, {}),
+            cache_prefix=cache_prefix,
+            extra=dict(self.base.extra),
+        )
+
+
+def _compile(filepath: Path, directory: Path) -> CompiledPrompt:
+    deps: list[Path] = [filepath]
+    stamp = _file_stamp(filepath)
     raw = filepath.read_text(encoding="utf-8")
     meta, body = _parse_frontmatter(raw)
 
-    # include 해결
-    body = _resolve_includes(body, directory)
-
-    # 변수 치환
-    str_kwargs = {k: str(v) for k, v in kwargs.items()}
-    body = _substitute_vars(body, str_kwargs)
-
-    # system_message에도 include/변수 치환 적용
+    body = _resolve_includes(body, directory, deps)
+    # system_message에도 include/변수 치환 적용 (공유 컨텍스트 분리는 본문에만)
     sys_msg = meta.get("system_message", "")
     if sys_msg:
-        sys_msg = _resolve_includes(sys_msg, directory)
-        sys_msg = _substitute_vars(sys_msg, str_kwargs)
-        meta["system_message"] = sys_msg
+        sys_msg = _resolve_includes(sys_msg, directory, deps)
 
     # frontmatter에서 값 추출
     response_format = meta.get("response_format")
@@ -185,14 +230,13 @@ def load_prompt(
     except (TypeError, ValueError):
         max_tokens = 4096
 
-    return PromptSpec(
-        body=body.strip(),
+    base = PromptSpec(
+        body="",
         provider=meta.get("provider", "openai"),
         model=meta.get("model", "gpt-4o-mini"),
         temperature=temperature,
         response_format=response_format if response_format else None,
         role=meta.get("role", ""),
-        system_message=meta.get("system_message", ""),
         max_tokens=max_tokens,
         thinking=_parse_bool(meta.get("thinking", "false")),
         thinking_effort=meta.get("thinking_effort", "medium"),
@@ -201,6 +245,60 @@ def load_prompt(
             if k not in (
                 "provider", "model", "temperature", "response_format",
                 "role", "system_message", "max_tokens", "thinking", "thinking_effort",
+                "cache_prefix",
             )
         },
     )
+    return CompiledPrompt(
+        base=base,
+        body_parts=_split_vars(body),
+        system_parts=_split_vars(sys_msg),
+        prefix_names=tuple(n.strip() for n in meta.get("cache_prefix", "").split(",") if n.strip()),
+        # 첫 항목(템플릿)은 읽기 전 stamp — 읽는 도중 바뀌었으면 다음 호출에서 다시 컴파일
+        deps=((filepath, stamp),) + tuple((p, _file_stamp(p)) for p in deps[1:]),
+    )
+
+
+_compiled: dict[tuple[str, str], CompiledPrompt] = {}
+_compiled_lock = threading.Lock()
+
+
+def compile_prompt(name: str, prompts_dir: str | Path | None = None) -> CompiledPrompt:
+    """(디렉토리, 이름) 단위로 캐시된 컴파일 결과. 템플릿/include mtime이 바뀌면 다시 컴파일한다."""
+    directory = Path(prompts_dir) if prompts_dir else _DEFAULT_DIR
+    key = (str(directory), name)
+    compiled = _compiled.get(key)
+    if compiled is not None and not compiled.is_stale():
+        return compiled
+
+    filepath = directory / f"{name}.md"
+    if not filepath.exists():
+        raise FileNotFoundError(f"프롬프트 템플릿을 찾을 수 없습니다: {filepath}")
+    compiled = _compile(filepath, directory)
+    with _compiled_lock:
+        _compiled[key] = compiled
+    return compiled
+
+
+def clear_prompt_cache() -> None:
+    """컴파일 캐시 비우기."""
+    with _compiled_lock:
+        _compiled.clear()
+
+
+def load_prompt(
+    name: str,
+    prompts_dir: str | Path | None = None,
+    **kwargs: str,
+) -> PromptSpec:
+    """이름으로 프롬프트 템플릿을 로드하고, include 해결 및 변수 치환을 수행한다.
+
+    Args:
+        name: 확장자 없는 프롬프트 파일 이름 (예: "page_purpose").
+        prompts_dir: 오버라이드 디렉토리. 기본값: ``interface/prompts/templates/``.
+        **kwargs: 템플릿에 치환할 변수.
+
+    Returns:
+        렌더링된 body와 메타데이터가 담긴 PromptSpec.
+    """
+    return compile_prompt(name, prompts_dir).render({k: str(v) for k, v in kwargs.items()})
@@ -92,7 +92,10 @@ def main() -> int:
     logger.info("Topic Index: %d", args.topic_index)
 
     # LangGraph 빌드
+    from .ai.llm_metrics import summarize_llm_metrics
+    from .ai.retry import get_retry_budget
     from .graph import build_graph
+    from .nodes.interface2 import shutdown_page_purpose_prefetch
 
     graph = build_graph()
 
@@ -141,7 +144,11 @@ def main() -> int:
 
     # 실행
     started = time.time()
-    final_state = graph.invoke(initial_state)
+    get_retry_budget().reset()
+    try:
+        final_state = graph.invoke(initial_state)
+    finally:
+        shutdown_page_purpose_prefetch()
     elapsed = time.time() - started
 
     # 결과 출력
@@ -161,6 +168,23 @@ def main() -> int:
         for node_name, info in metrics.items():
             logger.info("  %s: %.2fs (%s)", node_name, info["elapsed_s"], info["status"])
 
+        llm_nodes = {name: info["llm"] for name, info in metrics.items() if info.get("llm")}
+        if llm_nodes:
+            logger.info("--- 노드별 LLM 사용량 (비용 내림차순) ---")
+            for node_name, llm in sorted(llm_nodes.items(), key=lambda kv: kv[1].get("cost_usd", 0), reverse=True):
+                logger.info(
+                    "  %s: calls=%d in=%d (cached %d) out=%d (reasoning %d) latency=%.1fs $%.4f",
+                    node_name, llm["calls"], llm["prompt_tokens"], llm["cached_tokens"],
+                    llm["completion_tokens"], llm["reasoning_tokens"], llm["latency_s"], llm["cost_usd"],
+                )
+            total = summarize_llm_metrics(metrics)
+            logger.info(
+                "  합계: calls=%d in=%d (cached %d) out=%d latency=%.1fs retries=%d (%.1fs) $%.4f",
+                total["calls"], total["prompt_tokens"], total["cached_tokens"],
+                total["completion_tokens"], total["latency_s"], total["retries"], total["retry_wait_s"],
+                total["cost_usd"],
+            )
+
     return 0
 
 
@@ -185,6 +185,137 @@ class FinalBriefing(BaseModel):
     hallucination_checklist: list[HallucinationItem]
 
 
+# ────────────────────────────────────────────
+# 프롬프트 출력 계약 (frontmatter ``schema:`` 에서 참조)
+# ────────────────────────────────────────────
+
+class Framing(BaseModel):
+    """page_purpose 출력."""
+    theme: str
+    one_liner: str
+    concept: Concept
+
+
+class Headline(BaseModel):
+    """3_theme 출력."""
+    theme: str
+    one_liner: str
+
+
+class PageDraft(BaseModel):
+    """3_pages 출력 페이지 (차트·용어·퀴즈는 후속 노드에서 채움)."""
+    step: int
+    title: str
+    purpose: str
+    content: str
+    bullets: list[str]
+
+
+class PageGlossary(BaseModel):
+    """3_glossary 출력 페이지별 용어."""
+    step: int
+    glossary: list[GlossaryItem]
+
+
+class GlossaryTerm(BaseModel):
+    """3_glossary_term_extraction 출력 검색 대상 용어."""
+    step: int
+    term: str
+    context_sentence: str
+
+
+class NarrativeIssue(BaseModel):
+    """hallucination_check 검증 이슈."""
+    component: str  # page_purpose|historical_case|narrative
+    field_path: str
+    claim: str
+    evidence_in_curated_context: Optional[str] = None
+    verdict: str  # verified|approximate|unverified|hallucination
+    severity: str  # info|warning|critical
+    fix: str
+
+
+class PageIssue(BaseModel):
+    """3_hallcheck_pages 검증 이슈."""
+    component: str  # theme|one_liner|pages
+    field_path: str
+    claim: str
+    evidence_in_source: Optional[str] = None
+    verdict: str
+    severity: str
+    fix: str
+
+
+class ConsistencyCheck(BaseModel):
+    type: str  # cross_page_consistency|timeline_consistency|numeric_consistency 등
+    severity: str  # warning|critical
+    description: str
+    fix: str
+
+
+class NarrativeCheck(BaseModel):
+    """hallucination_check 출력."""
+    overall_risk: str  # low|medium|high|critical
+    summary: str
+    issues: list[NarrativeIssue]
+    consistency_checks: list[ConsistencyCheck]
+    validated_interface_2: RawNarrative
+
+
+class PagesCheck(BaseModel):
+    """3_hallcheck_pages 출력."""
+    overall_risk: str
+    summary: str
+    issues: list[PageIssue]
+    consistency_checks: list[ConsistencyCheck]
+    validated_theme: str
+    validated_one_liner: str
+    validated_pages: list[PageDraft]
+
+
+class GlossaryIssue(BaseModel):
+    step: int
+    term: str
+    claim: str
+    verdict: str
+    severity: str
+    fix: str
+
+
+class GlossaryCheck(BaseModel):
+    """3_hallcheck_glossary 출력."""
+    overall_risk: str
+    summary: str
+    issues: list[GlossaryIssue]
+    validated_page_glossaries: list[PageGlossary]
+
+
+class GlossedPage(PageDraft):
+    """3_tone_final 출력 페이지 (차트 제외, 검증된 용어 병합)."""
+    glossary: list[GlossaryItem]
+
+
+class ToneFinalBriefing(BaseModel):
+    """3_tone_final 출력 ``interface_3_final_briefing``."""
+    theme: str
+    one_liner: str
+    pages: list[GlossedPage]
+
+
+class ChartToolCall(BaseModel):
+    tool: str
+    args: dict[str, Any]
+
+
+class ChartPlan(BaseModel):
+    """3_chart_reasoning 출력."""
+    chart_type: str
+    reasoning: str
+    data_needs: str
+    tool_calls: list[ChartToolCall]
+    internal_data_to_use: list[str]
+
+
 # ────────────────────────────────────────────
 # 최종 통합 출력
 # ────────────────────────────────────────────
@@ -179,6 +179,48 @@ class TestDataCollectionE2E:
         assert "build_curated_context" in metrics
         assert "assemble_output" in metrics
 
+    def test_collection_branches_run_in_parallel_behind_barrier(self, monkeypatch):
+        """crawl_news/crawl_research/screen_stocks는 동시에 실행되고, 셋 다 끝난 뒤 summarize_news로 진행."""
+        import time
+
+        from interface import graph as graph_module
+
+        def _slow(fn):
+            def wrapper(state):
+                time.sleep(0.3)
+                return fn(state)
+            return wrapper
+
+        for name in ("crawl_news_node", "crawl_research_node", "screen_stocks_node"):
+            monkeypatch.setattr(graph_module, name, _slow(getattr(graph_module, name)))
+        seen = {}
+        original_summarize = graph_module.summarize_news_node
+
+        def _summarize(state):
+            seen.update({k: state.get(k) for k in ("raw_news", "raw_reports", "matched_stocks")})
+            return original_summarize(state)
+
+        monkeypatch.setattr(graph_module, "summarize_news_node", _summarize)
+
+        started = time.perf_counter()
+        final = graph_module.build_graph().invoke(_make_base_state())
+        elapsed = time.perf_counter() - started
+
+        assert final.get("error") is None, f"Pipeline error: {final.get('error')}"
+        assert all(seen.values()), seen
+        assert elapsed < 0.8
+
+    def test_collection_error_stops_after_barrier(self, monkeypatch):
+        from interface import graph as graph_module
+
+        monkeypatch.setattr(graph_module, "screen_stocks_node", lambda state: {
+            "error": "스크리닝 결과가 없습니다.", "metrics": {"screen_stocks": {"status": "failed"}},
+        })
+        final = graph_module.build_graph().invoke(_make_base_state())
+        assert final["error"] == "스크리닝 결과가 없습니다."
+        assert "crawl_news" in final["metrics"] and "crawl_research" in final["metrics"]
+        assert "summarize_news" not in final["metrics"]
+
     def test_file_load_still_works(self, tmp_path):
         """기존 파일 로드 경로가 여전히 동작하는지 확인."""
         import json
@@ -1,5 +1,7 @@
 """데이터 수집 유틸리티 단위 테스트."""
 
+import json
+
 import pytest
 
 
@@ -41,11 +43,64 @@ class TestIntersection:
 
 
 class TestNewsSummarizerUtils:
-    def test_estimate_tokens(self):
+    def test_estimate_tokens_uses_model_encoding(self, monkeypatch):
+        from interface.ai import tokenizer
+        from interface.data_collection import news_summarizer as ns
+
+        class FakeEncoding:
+            def encode(self, text, disallowed_special=()):
+                return text.split()
+
+        models: list[str] = []
+        monkeypatch.setattr(tokenizer, "_count_cache", type(tokenizer._count_cache)())
+        monkeypatch.setattr(tokenizer, "_get_encoding", lambda model: models.append(model) or FakeEncoding())
+        assert ns._estimate_tokens("") == 1
+        assert ns._estimate_tokens("삼성전자 4분기 영업이익") == 3
+        assert models == [ns.OPENAI_PHASE1_MODEL]
+
+    def test_estimate_tokens_exact_for_o200k(self, monkeypatch):
+        from interface.ai import tokenizer
+
+        tiktoken = pytest.importorskip("tiktoken")
+        try:
+            encoding = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            pytest.skip("o200k_base BPE 파일을 불러올 수 없음 (오프라인)")
+        monkeypatch.setattr(tokenizer, "_count_cache", type(tokenizer._count_cache)())
+        monkeypatch.setattr(tokenizer, "_get_encoding", lambda model: encoding)
+        assert tokenizer.count_tokens("hello world", "gpt-5-mini") == 2
+        assert tokenizer.count_tokens("1234", "gpt-5-mini") == 2
+
+    def test_estimate_tokens_falls_back_to_heuristic(self, monkeypatch):
+        from interface.ai import tokenizer
         from interface.data_collection.news_summarizer import _estimate_tokens
+
+        monkeypatch.setattr(tokenizer, "_count_cache", type(tokenizer._count_cache)())
+        monkeypatch.setattr(tokenizer, "_get_encoding", lambda model: None)
         assert _estimate_tokens("") == 1
         assert _estimate_tokens("1234") == 1
         assert _estimate_tokens("12345678") == 2
+        assert _estimate_tokens("반도체 업황") == 6
+
+    def test_heuristic_tokens_counts_korean_per_char(self):
+        from interface.ai.tokenizer import _heuristic_tokens
+        assert _heuristic_tokens("1234") == 1
+        assert _heuristic_tokens("12345678") == 2
+        assert _heuristic_tokens("반도체업황") == 5
+
+    def test_token_count_cache_is_keyed_by_hash_and_bounded(self, monkeypatch):
+        from interface.ai import tokenizer
+
+        monkeypatch.setattr(tokenizer, "_count_cache", type(tokenizer._count_cache)())
+        monkeypatch.setattr(tokenizer, "_COUNT_CACHE_SIZE", 3)
+        long_text = "반도체 업황 " * 2000
+        first = tokenizer.count_tokens(long_text)
+        assert tokenizer.count_tokens(long_text) == first
+        assert all(len(digest) == 16 for digest, _ in tokenizer._count_cache)
+
+        for i in range(5):
+            tokenizer.count_tokens(f"기사 {i}")
+        assert len(tokenizer._count_cache) == 3
 
     def test_chunk_blocks_single(self):
         from interface.data_collection.news_summarizer import _chunk_blocks
@@ -56,10 +111,224 @@ class TestNewsSummarizerUtils:
 
     def test_chunk_blocks_split(self):
         from interface.data_collection.news_summarizer import _chunk_blocks
-        blocks = [(i, "x" * 200) for i in range(10)]
+        blocks = [(i, "반도체 재고 조정이 마무리 국면에 접어들었어요. " * 12) for i in range(10)]
         chunks = _chunk_blocks(blocks, 200)
         assert len(chunks) > 1
 
+    def test_chunk_blocks_balanced(self, monkeypatch):
+        from interface.data_collection import news_summarizer as ns
+        monkeypatch.setattr(ns, "_estimate_tokens", lambda text: len(text))
+        blocks = [(i, "x" * 98) for i in range(11)]
+        chunks = ns._chunk_blocks(blocks, 1000)
+        # 순차 채우기(10+1) 대신 6+5로 균등 분할
+        assert [len(c) for c in chunks] == [6, 5]
+        assert [idx for c in chunks for idx, _ in c] == list(range(11))
+
+    def test_map_reduce_parallel_preserves_chunk_order(self, monkeypatch):
+        import time
+        from interface.data_collection import news_summarizer as ns
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        reduce_inputs: list[str] = []
+
+        def fake_call(prompt: str, api_key: str, max_retries: int) -> dict:
+            if prompt.startswith("다음은 당일"):
+                reduce_inputs.append(prompt)
+                return {"summary": "reduced"}
+            if "block-2" in prompt:
+                raise RuntimeError("boom")
+            # 앞 청크일수록 늦게 끝나도록 지연
+            idx = int(prompt.split("block-")[1][0])
+            time.sleep(0.05 * (5 - idx))
+            return {"summary": f"summary-{idx}"}
+
+        monkeypatch.setattr(ns, "_call_chat_summary", fake_call)
+        monkeypatch.setattr(ns, "_get_chunk_cache", lambda: None)
+        # Map 입력만 블록당 1청크로 나누고, Reduce 단계의 partial은 한 그룹으로 묶는다
+        monkeypatch.setattr(
+            ns, "_chunk_blocks",
+            lambda blocks, target: [[b] for b in blocks] if "block-" in blocks[0][1] else [blocks],
+        )
+
+        blocks = [(i, f"block-{i}") for i in range(1, 5)]
+        result = ns._summarize_with_map_reduce(
+            kind="news", blocks=blocks, prompt_template="{items}",
+            prompt_key="items", no_items_text="(없음)",
+        )
+        assert result == "reduced"
+        merged = reduce_inputs[0]
+        assert "chunk 2" not in merged
+        assert merged.index("summary-1") < merged.index("summary-3") < merged.index("summary-4")
+
+    def test_tree_reduce_groups_oversized_partials(self, monkeypatch):
+        from interface.data_collection import news_summarizer as ns
+
+        reduce_calls: list[str] = []
+
+        def fake_call(prompt: str, api_key: str, max_retries: int) -> dict:
+            reduce_calls.append(prompt)
+            return {"summary": "r" * 100}
+
+        monkeypatch.setattr(ns, "_call_chat_summary", fake_call)
+        monkeypatch.setattr(ns, "OPENAI_PHASE1_CHUNK_TARGET_INPUT_TOKENS", 500)
+
+        partials = [(f"chunk {i}", "x" * 800) for i in range(1, 9)]
+        result = ns._tree_reduce("news", partials, "key", 0)
+        assert result == "r" * 100
+        # level 1 그룹 Reduce 여러 번 + 최종 Reduce 1번
+        assert len(reduce_calls) > 2
+        assert "level 1 group 1" in reduce_calls[-1]
+
+    def test_tree_reduce_halves_and_trims_when_partials_exceed_half_budget(self, monkeypatch):
+        from interface.data_collection import news_summarizer as ns
+
+        reduce_inputs: list[str] = []
+
+        def fake_call(prompt: str, api_key: str, max_retries: int) -> dict:
+            reduce_inputs.append(prompt)
+            return {"summary": "r" * 400}
+
+        monkeypatch.setattr(ns, "_call_chat_summary", fake_call)
+        monkeypatch.setattr(ns, "_build_reduce_prompt", lambda kind, merged: merged)
+        monkeypatch.setattr(ns, "_estimate_tokens", lambda text: max(1, len(text)))
+        monkeypatch.setattr(ns, "OPENAI_PHASE1_CHUNK_TARGET_INPUT_TOKENS", 500)
+
+        # 모든 partial이 예산의 절반(250)보다 커서 예산 그룹핑만으로는 묶이지 않는다
+        partials = [(f"chunk {i}", "x" * 300) for i in range(1, 9)]
+        assert ns._tree_reduce("news", partials, "key", 0) == "r" * 400
+        # 레벨마다 2개씩 묶여 8 → 4 → 2 → 1, 모든 Reduce 입력은 예산 이내
+        assert len(reduce_inputs) == 4 + 2 + 1
+        assert all(len(text) <= 500 for text in reduce_inputs)
+        assert "level 2 group 1" in reduce_inputs[-1] and "level 2 group 2" in reduce_inputs[-1]
+
+    def test_map_results_are_cached_per_chunk(self, monkeypatch, tmp_path):
+        from interface.data_collection import news_summarizer as ns
+        from interface.data_collection.file_cache import FileCache
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(ns, "_get_chunk_cache", lambda: FileCache(tmp_path))
+        calls: list[str] = []
+
+        def fake_call(prompt: str, api_key: str, max_retries: int) -> dict:
+            calls.append(prompt)
+            return {"summary": f"summary-{len(calls)}"}
+
+        monkeypatch.setattr(ns, "_call_chat_summary", fake_call)
+        kwargs = dict(kind="news", prompt_template="{items}", prompt_key="items", no_items_text="(없음)")
+        blocks = [(1, "기사 A"), (2, "기사 B")]
+
+        ns._summarize_with_map_reduce(blocks=blocks, **kwargs)
+        first_run_calls = len(calls)
+        ns._summarize_with_map_reduce(blocks=blocks, **kwargs)
+        # 두 번째 실행은 Map 캐시 적중 → Reduce 1회만 호출
+        assert len(calls) == first_run_calls + 1
+
+    def test_stable_chunk_blocks_localizes_new_items(self, monkeypatch):
+        from interface.data_collection import news_summarizer as ns
+        monkeypatch.setattr(ns, "_estimate_tokens", lambda text: 60)
+
+        blocks = [(i, f"기사 {i:03d}") for i in range(60)]
+        before = ns._stable_chunk_blocks(blocks, 1000)
+        after = ns._stable_chunk_blocks(blocks[:30] + [(999, "신규 기사")] + blocks[30:], 1000)
+
+        def texts(chunks):
+            return {tuple(t for _, t in c) for c in chunks}
+
+        changed = texts(after) - texts(before)
+        assert len(before) > 3
+        assert 1 <= len(changed) <= 2
+
+    def test_stable_chunk_blocks_balances_within_anchor_segments(self, monkeypatch):
+        from interface.data_collection import news_summarizer as ns
+        monkeypatch.setattr(ns, "_estimate_tokens", lambda text: 60)
+        monkeypatch.setattr(ns, "_is_chunk_anchor", lambda block: block == "anchor")
+
+        # 앵커 없이 긴 구간은 예산 안에서 고르게 나뉘고, 앵커 뒤 구간과는 섞이지 않는다
+        blocks = [(i, f"기사 {i}") for i in range(20)] + [(20, "anchor"), (21, "tail")]
+        chunks = ns._stable_chunk_blocks(blocks, 1000)
+        sizes = [len(c) for c in chunks]
+        assert sizes == [11, 10, 1]
+        assert all(sum(62 for _ in c) <= 1000 for c in chunks)
+
+    def test_stable_chunking_is_default_with_cache(self, monkeypatch, tmp_path):
+        from interface.data_collection import news_summarizer as ns
+        from interface.data_collection.file_cache import FileCache
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(ns, "_get_chunk_cache", lambda: FileCache(tmp_path))
+        monkeypatch.setattr(ns, "_call_chat_summary", lambda prompt, api_key, max_retries: {"summary": "s"})
+        used: list[str] = []
+        for name in ("_chunk_blocks", "_stable_chunk_blocks"):
+            original = getattr(ns, name)
+            monkeypatch.setattr(ns, name, lambda blocks, target, _n=name, _f=original: used.append(_n) or _f(blocks, target))
+
+        kwargs = dict(kind="news", blocks=[(1, "기사 A")], prompt_template="{items}", prompt_key="items", no_items_text="")
+        ns._summarize_with_map_reduce(**kwargs)
+        assert used[0] == "_stable_chunk_blocks"
+        monkeypatch.setattr(ns, "OPENAI_PHASE1_STABLE_CHUNKS", False)
+        used.clear()
+        ns._summarize_with_map_reduce(**kwargs)
+        assert used[0] == "_chunk_blocks" and "_stable_chunk_blocks" not in used
+
+    def test_streamed_summary_collects_deltas_and_timing(self, monkeypatch):
+        from interface.data_collection import news_summarizer as ns
+
+        events = [
+            'data: {"choices":[{"delta":{"role":"assistant"}}]}',
+            "",
+            'data: {"choices":[{"delta":{"content":"요약 "}}]}',
+            'data: {"choices":[{"delta":',  # 깨진 이벤트는 건너뛴다
+            'data: {"choices":[{"delta":{"content":"본문"},"finish_reason":"stop"}]}',
+            'data: {"choices":[],"usage":{"prompt_tokens":10,"completion_tokens":3}}',
+            "data: [DONE]",
+        ]
+
+        class FakeStream:
+            ok = True
+            status_code = 200
+
+            def iter_lines(self, decode_unicode=False):
+                return iter(events)
+
+            def close(self):
+                pass
+
+        payloads: list[dict] = []
+
+        def fake_post(url, **kwargs):
+            payloads.append(kwargs["json"])
+            return FakeStream()
+
+        monkeypatch.setattr(ns, "OPENAI_PHASE1_STREAM", True)
+        monkeypatch.setattr(ns.requests, "post", fake_post)
+
+        result = ns._call_chat_summary("prompt", "key", max_retries=0)
+        assert payloads[0]["stream"] is True
+        assert result["summary"] == "요약 본문"
+        assert result["finish_reason"] == "stop"
+        assert result["usage"]["completion_tokens"] == 3
+        assert result["attempt_log"][0]["ttft_s"] is not None
+
+    def test_streamed_summary_retries_when_no_content_arrives(self, monkeypatch):
+        from interface.data_collection import news_summarizer as ns
+
+        class SilentStream:
+            ok = True
+            status_code = 200
+
+            def iter_lines(self, decode_unicode=False):
+                return iter(['data: {"choices":[{"delta":{"role":"assistant"}}]}'] * 3)
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(ns, "OPENAI_PHASE1_STREAM", True)
+        monkeypatch.setattr(ns, "OPENAI_PHASE1_STREAM_FIRST_TOKEN_TIMEOUT_S", -1)
+        monkeypatch.setattr(ns.requests, "post", lambda url, **kwargs: SilentStream())
+
+        with pytest.raises(RuntimeError, match="no_content_within"):
+            ns._call_chat_summary("prompt", "key", max_retries=1)
+
     def test_format_news_blocks(self):
         from interface.data_collection.news_summarizer import _format_news_blocks
         items = [
@@ -81,6 +350,304 @@ class TestNewsSummarizerUtils:
         assert "리포트1" in blocks[0][1]
 
 
+class TestFileCache:
+    def test_size_cap_evicts_oldest_entries(self, tmp_path):
+        import os
+
+        from interface.data_collection.file_cache import FileCache
+
+        cache = FileCache(tmp_path, max_bytes=300)
+        for i, key in enumerate(("aa1", "bb2", "cc3", "dd4")):
+            cache.set(key, "x" * 80)
+            path = cache._path(key)
+            os.utime(path, (1000 + i, 1000 + i))  # 쓰기 순서대로 수정 시각 고정
+
+        # 항목당 약 120바이트 → 상한 300바이트 안에는 가장 최근 2개만 남는다
+        assert cache.get("aa1") is None and cache.get("bb2") is None
+        assert cache.get("cc3") == cache.get("dd4") == "x" * 80
+        assert sum(p.stat().st_size for p in tmp_path.glob("*/*.json")) <= 300
+
+
+class TestNewsDedup:
+    def test_collapse_syndicated_stories(self):
+        from interface.data_collection.news_dedup import collapse_near_duplicates
+        body = "연합뉴스에 따르면 삼성전자는 4분기 영업이익이 6조5천억원으로 시장 기대치를 밑돌았다고 밝혔다."
+        items = [
+            {"title": "[속보] 삼성전자, 4분기 영업이익 6.5조원…시장 기대치 하회", "source": "한경", "summary": body},
+            {"title": "삼성전자 4분기 영업이익 6.5조원…시장 기대치 하회", "source": "매경", "summary": body + " (종합)"},
+            {"title": "환율 1,450원 돌파, 달러 강세 지속", "source": "아시아경제", "summary": "원·달러 환율이 급등했다."},
+        ]
+        collapsed = collapse_near_duplicates(items)
+        assert len(collapsed) == 2
+        assert collapsed[0]["cluster_size"] == 2
+        assert collapsed[0]["cluster_sources"] == ["한경", "매경"]
+        assert collapsed[1]["cluster_size"] == 1
+
+    def test_cluster_size_in_news_block(self):
+        from interface.data_collection.news_summarizer import _format_news_blocks
+        blocks = _format_news_blocks([{"title": "제목", "source": "한경", "cluster_size": 3}])
+        assert "3개 매체 보도" in blocks[0][1]
+
+
+class TestOpenAIBatch:
+    def test_run_batch_roundtrip_with_stub_server(self, monkeypatch, tmp_path):
+        from interface.data_collection import openai_batch
+        from interface.data_collection.batch_stub_server import BatchStubServer
+
+        monkeypatch.setattr(openai_batch, "BATCH_DATA_DIR", tmp_path)
+
+        def responder(custom_id, url, body):
+            if custom_id == "bad":
+                raise ValueError("boom")
+            return {"echo": body["messages"][0]["content"]}
+
+        bodies = {
+            "a": {"messages": [{"role": "user", "content": "첫째"}]},
+            "bad": {"messages": [{"role": "user", "content": "x"}]},
+            "b": {"messages": [{"role": "user", "content": "둘째"}]},
+        }
+        with BatchStubServer(responder) as server:
+            results = openai_batch.run_batch(
+                bodies, "/v1/chat/completions",
+                api_key="test", job_name="t", base_url=server.base_url, poll_interval_s=0,
+            )
+
+        assert list(results) == ["a", "bad", "b"]
+        assert results["a"] == {"echo": "첫째"}
+        assert results["bad"] is None
+        assert len(list(tmp_path.glob("t_*.jsonl"))) == 1
+
+    def test_news_map_in_batch_mode(self, monkeypatch, tmp_path):
+        from interface.data_collection import news_summarizer as ns
+        from interface.data_collection import openai_batch
+        from interface.data_collection.batch_stub_server import BatchStubServer
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(ns, "OPENAI_BATCH_MODE", True)
+        monkeypatch.setattr(ns, "_get_chunk_cache", lambda: None)
+        monkeypatch.setattr(ns, "_chunk_blocks", lambda blocks, target: [[b] for b in blocks])
+        monkeypatch.setattr(openai_batch, "BATCH_DATA_DIR", tmp_path)
+        monkeypatch.setattr(openai_batch, "OPENAI_BATCH_POLL_INTERVAL_S", 0)
+        reduce_prompts: list[str] = []
+
+        def fake_call(prompt: str, api_key: str, max_retries: int) -> dict:
+            reduce_prompts.append(prompt)
+            return {"summary": "final"}
+
+        monkeypatch.setattr(ns, "_call_chat_summary", fake_call)
+
+        with BatchStubServer() as server:
+            monkeypatch.setattr(openai_batch, "OPENAI_BATCH_BASE_URL", server.base_url)
+            result = ns._summarize_with_map_reduce(
+                kind="news", blocks=[(1, "기사 A"), (2, "기사 B")],
+                prompt_template="{items}", prompt_key="items", no_items_text="(없음)",
+            )
+
+        assert result == "final"
+        assert len(reduce_prompts) == 1
+        assert reduce_prompts[0].index("[stub] news-chunk-1") < reduce_prompts[0].index("[stub] news-chunk-2")
+
+    def test_research_summaries_in_batch(self, monkeypatch, tmp_path):
+        from interface.data_collection import openai_batch
+        from interface.data_collection import research_crawler as rc
+        from interface.data_collection.batch_stub_server import BatchStubServer
+
+        monkeypatch.setattr(openai_batch, "BATCH_DATA_DIR", tmp_path)
+        monkeypatch.setattr(openai_batch, "OPENAI_BATCH_POLL_INTERVAL_S", 0)
+        monkeypatch.setattr(rc, "_download_pdf", lambda item: (b"%PDF", "r.pdf", {"title": item["title"]}))
+
+        items = [
+            {"title": "리포트1", "pdf_url": "http://x/1.pdf"},
+            {"title": "리포트2"},
+            {"title": "리포트3", "pdf_url": "http://x/3.pdf"},
+        ]
+        with BatchStubServer() as server:
+            monkeypatch.setattr(openai_batch, "OPENAI_BATCH_BASE_URL", server.base_url)
+            results = rc._summarize_in_batch(items, "key", "gpt-5-mini", 100, 2, job_name="research_test")
+
+        assert [r["summary_status"] for r in results] == ["ok", "skipped_no_pdf", "ok"]
+        assert results[0]["summary"] == "[stub] report-0"
+        assert results[2]["title"] == "report-2"
+
+
+class TestOpenAICuratorCache:
+    def test_identical_inputs_replay_from_cache(self, monkeypatch, tmp_path):
+        from interface.data_collection import openai_curator as oc
+        from interface.data_collection.file_cache import FileCache
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(oc, "_get_curation_cache", lambda: FileCache(tmp_path))
+        requests_made: list[dict] = []
+
+        def fake_request(payload: dict, api_key: str) -> dict:
+            requests_made.append(payload)
+            return {"output": []}
+
+        monkeypatch.setattr(oc, "OPENAI_PHASE2_STREAM", False)
+        monkeypatch.setattr(oc, "_request_responses", fake_request)
+        monkeypatch.setattr(oc, "_parse_web_search_log", lambda output: {"source_catalog": []})
+        monkeypatch.setattr(oc, "_parse_topics", lambda data: [{"topic": "반도체"}])
+        monkeypatch.setattr(oc, "_validate_topics", lambda topics, catalog: ([], []))
+
+        args = dict(news_summary="뉴스", reports_summary="리포트", screening_results="종목", date="2026-01-02", market="KR")
+        topics, log = oc.curate_with_websearch(**args)
+        replay_topics, replay_log = oc.curate_with_websearch(**args)
+
+        assert len(requests_made) == 1
+        assert replay_topics == topics
+        assert replay_log["cache_hit"] is True
+        assert replay_log["schema_validation"]["status"] == "passed"
+
+        oc.curate_with_websearch(**{**args, "market": "US"})
+        oc.curate_with_websearch(**args, use_cache=False)
+        assert len(requests_made) == 3
+
+
+class TestOpenAICuratorRepair:
+    CATALOG = [
+        {"source_id": "ws1_s1", "url": "https://news.example.com/a"},
+        {"source_id": "ws1_s2", "url": "https://news.example.com/b"},
+    ]
+
+    def _topic(self, **ctx):
+        base = {"verified_news": [], "source_ids": [], "evidence_source_urls": []}
+        return {"topic": "반도체", "interface_1_curated_context": {**base, **ctx}}
+
+    def test_repair_maps_news_urls_to_catalog(self):
+        from interface.data_collection.openai_curator import _repair_topics, _validate_topics
+
+        topics = [self._topic(verified_news=[{"url": "https://news.example.com/b/?utm_source=x#top"}])]
+        assert _validate_topics(topics, self.CATALOG)[0]
+
+        repairs = _repair_topics(topics, self.CATALOG)
+        ctx = topics[0]["interface_1_curated_context"]
+        assert repairs
+        assert ctx["source_ids"] == ["ws1_s2"]
+        assert ctx["evidence_source_urls"] == ["https://news.example.com/b"]
+        assert _validate_topics(topics, self.CATALOG)[0] == []
+
+    def test_repair_fixes_ws0_ids(self):
+        from interface.data_collection.openai_curator import _repair_topics
+
+        topics = [self._topic(source_ids=["ws0_s1", "ws9_s9"])]
+        _repair_topics(topics, self.CATALOG)
+        ctx = topics[0]["interface_1_curated_context"]
+        assert ctx["source_ids"] == ["ws1_s1"]
+        assert ctx["evidence_source_urls"] == ["https://news.example.com/a"]
+
+    def test_retry_only_when_repair_insufficient(self, monkeypatch):
+        from interface.data_collection import openai_curator as oc
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(oc, "_get_curation_cache", lambda: None)
+        monkeypatch.setattr(oc, "_parse_web_search_log", lambda output: {"source_catalog": self.CATALOG})
+        requests_made: list[dict] = []
+        monkeypatch.setattr(oc, "OPENAI_PHASE2_STREAM", False)
+        monkeypatch.setattr(oc, "_request_responses", lambda payload, key: requests_made.append(payload) or {})
+
+        repairable = self._topic(verified_news=[{"url": "https://news.example.com/a"}])
+        monkeypatch.setattr(oc, "_parse_topics", lambda data: [json.loads(json.dumps(repairable))])
+        topics, log = oc.curate_with_websearch("n", "r", "s", "2026-01-02", "KR")
+        assert len(requests_made) == 1
+        assert log["local_repair"]["resolved"] is True
+
+        requests_made.clear()
+        monkeypatch.setattr(oc, "_parse_topics", lambda data: [self._topic()])
+        with pytest.raises(oc.CuratorValidationError):
+            oc.curate_with_websearch("n", "r", "s", "2026-01-02", "KR")
+        assert len(requests_made) == 2
+
+
+class TestCuratorStreaming:
+    def test_incremental_parser_emits_topics_as_they_close(self):
+        from interface.ai.json_parsing import IncrementalArrayParser
+
+        text = json.dumps({"topics": [
+            {"topic": "A {괄호} \"따옴표\"", "ctx": {"list": [1, 2]}},
+            {"topic": "B ]}"},
+        ]}, ensure_ascii=False)
+        parser = IncrementalArrayParser("topics")
+        emitted = []
+        for i in range(0, len(text), 7):
+            emitted.append([t["topic"] for t in parser.feed(text[i:i + 7])])
+
+        flat = [t for batch in emitted for t in batch]
+        assert flat == ["A {괄호} \"따옴표\"", "B ]}"]
+        # 첫 topic은 두 번째 topic이 닫히기 전에 나와야 한다
+        first_at = next(i for i, b in enumerate(emitted) if b)
+        assert first_at < len(emitted) - 2
+
+    def test_stream_calls_on_topic_before_completion(self, monkeypatch):
+        from interface.data_collection import openai_curator as oc
+
+        body = json.dumps({"topics": [{"topic": "반도체"}, {"topic": "2차전지"}]}, ensure_ascii=False)
+        final = {"output": [{"type": "message", "status": "completed",
+                             "content": [{"type": "output_text", "text": body}]}]}
+        events = [
+            json.dumps({"type": "response.output_text.delta", "delta": body[:30]}),
+            '{"type": "response.output_text.delta", "delta":',  # 깨진 이벤트는 건너뛴다
+            json.dumps({"type": "response.output_text.delta", "delta": body[30:]}),
+            json.dumps({"type": "response.completed", "response": final}),
+        ]
+        seen: list[tuple[int, str, int]] = []
+
+        class FakeStream:
+            ok = True
+
+            def iter_lines(self, decode_unicode=False):
+                for i, e in enumerate(events):
+                    yield "event: x"
+                    yield f"data: {e}"
+                    seen.append((-1, "", i))
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(oc.requests, "post", lambda url, **kwargs: FakeStream())
+        data = oc._request_responses_stream(
+            {"input": "p"}, "key",
+            on_topic=lambda index, topic: seen.append((index, topic["topic"], len(seen))),
+        )
+
+        assert data == final
+        topic_events = [(i, t) for i, t, _ in seen if i >= 0]
+        assert topic_events == [(0, "반도체"), (1, "2차전지")]
+        # 첫 topic 콜백은 response.completed 이전에 발생
+        assert seen.index(next(e for e in seen if e[0] == 0)) < len(seen) - 1
+
+
+class TestPromptBudget:
+    def test_split_summary_issues(self):
+        from interface.data_collection.prompt_budget import split_summary_issues
+
+        summary = "## 반도체\n요약 A\n\n## 2차전지\n요약 B\n## 조선\n요약 C"
+        assert [b.splitlines()[0] for b in split_summary_issues(summary)] == ["## 반도체", "## 2차전지", "## 조선"]
+        assert split_summary_issues("문단 1\n\n문단 2") == ["문단 1", "문단 2"]
+
+    def test_fit_sections_trims_low_salience_tail(self, monkeypatch):
+        from interface.data_collection import prompt_budget as pb
+
+        monkeypatch.setattr(pb, "count_tokens", lambda text, model="": len(text))
+        sections = {
+            "news": ["a" * 40, "b" * 40, "c" * 40, "d" * 40],
+            "stocks": ["x" * 10, "y" * 10],
+        }
+        fitted, stats = pb.fit_sections_to_budget(sections, budget=100, joiners={"stocks": "\n"})
+
+        # stocks는 20토큰만 쓰므로 남는 예산(80)이 news에 배분된다
+        assert fitted["stocks"] == "x" * 10 + "\n" + "y" * 10
+        assert stats["news"] == {"items": 4, "kept": 2, "tokens": 80}
+        assert fitted["news"].startswith("a" * 40)
+        assert "생략" in fitted["news"]
+
+    def test_fit_sections_keeps_everything_under_budget(self):
+        from interface.data_collection.prompt_budget import fit_sections_to_budget
+
+        fitted, stats = fit_sections_to_budget({"news": ["짧은 요약"]}, budget=10_000)
+        assert fitted["news"] == "짧은 요약"
+        assert stats["news"]["kept"] == 1
+
+
 class TestNewsCrawlerUtils:
     def test_to_news_items(self):
         from interface.data_collection.news_crawler import to_news_items
@@ -0,0 +1,950 @@
+"""LLM 호출 유틸리티 단위 테스트 — 실제 API 호출 없이 fake 클라이언트 사용."""
+
+import asyncio
+import json
+
+import pytest
+
+
+class FakeClient:
+    """chat_completion / achat_completion 반환 형태만 흉내 내는 클라이언트."""
+
+    def __init__(self, content: str = '{"ok": true}', delay_s: float = 0.0) -> None:
+        self.content = content
+        self.delay_s = delay_s
+        self.calls: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _result(self) -> dict:
+        return {
+            "choices": [{"message": {"content": self.content, "role": "assistant"}}],
+            "model": "fake",
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1},
+        }
+
+    def chat_completion(self, **kwargs) -> dict:
+        self.calls.append(kwargs)
+        return self._result()
+
+    async def achat_completion(self, **kwargs) -> dict:
+        self.calls.append(kwargs)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay_s)
+        self.in_flight -= 1
+        return self._result()
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    (tmp_path / "echo.md").write_text(
+        "---\nprovider: openai\nmodel: gpt-5-mini\nresponse_format: json_object\n---\n입력: {{payload}}\n",
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+class TestAsyncLLMCalls:
+    def test_async_call_matches_sync_request(self, monkeypatch, prompts_dir):
+        from interface.ai import llm_utils
+
+        client = FakeClient()
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+
+        sync_result = llm_utils.call_llm_with_prompt("echo", {"payload": {"a": 1}}, prompts_dir=prompts_dir)
+        async_result = asyncio.run(
+            llm_utils.acall_llm_with_prompt("echo", {"payload": {"a": 1}}, prompts_dir=prompts_dir)
+        )
+
+        assert sync_result == async_result == {"ok": True}
+        assert client.calls[0] == client.calls[1]
+        assert client.calls[0]["response_format"] == {"type": "json_object"}
+
+    def test_run_async_gathers_calls_on_shared_loop(self, monkeypatch, prompts_dir):
+        from interface.ai import llm_utils
+        from interface.ai.multi_provider_client import get_event_loop, run_async
+
+        client = FakeClient(delay_s=0.05)
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+
+        async def fan_out():
+            return await asyncio.gather(*[
+                llm_utils.acall_llm_with_prompt("echo", {"payload": i}, prompts_dir=prompts_dir)
+                for i in range(20)
+            ])
+
+        results = run_async(fan_out())
+        assert len(results) == 20
+        assert client.max_in_flight == 20
+        assert run_async(asyncio.sleep(0, result=get_event_loop())) is get_event_loop()
+
+    def test_async_call_retries_on_bad_json(self, monkeypatch, prompts_dir):
+        from interface.ai import llm_utils
+
+        client = FakeClient(content="not json")
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+
+        with pytest.raises((ValueError, json.JSONDecodeError)):
+            asyncio.run(llm_utils.acall_llm_with_prompt("echo", {"payload": 1}, prompts_dir=prompts_dir, max_retries=2))
+        assert len(client.calls) == 2
+
+    def test_achat_completion_with_real_sdk_clients(self):
+        """실제 AsyncOpenAI/AsyncAnthropic 클라이언트의 with_raw_response 경로 (전송만 MockTransport)."""
+        try:  # 최신 SDK는 httpx2 기반
+            import httpx2 as httpx
+        except ImportError:
+            import httpx
+        from anthropic import AsyncAnthropic
+        from openai import AsyncOpenAI
+
+        from interface.ai.multi_provider_client import MultiProviderClient
+
+        bodies: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            headers = {"x-ratelimit-remaining-requests": "99"}
+            if request.url.path.endswith("/messages"):
+                return httpx.Response(200, headers=headers, json={
+                    "id": "msg_1", "type": "message", "role": "assistant", "model": "claude-sonnet-4-20250514",
+                    "content": [{"type": "text", "text": '{"ok": true}'}],
+                    "stop_reason": "end_turn", "stop_sequence": None,
+                    "usage": {"input_tokens": 9, "output_tokens": 2},
+                })
+            return httpx.Response(200, headers=headers, json={
+                "id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "gpt-5-mini",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": '{"ok": true}'}}],
+                "usage": {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+            })
+
+        async def run() -> list[dict]:
+            client = MultiProviderClient()
+            transport = httpx.MockTransport(handler)
+            client.register_provider(
+                "openai", None, AsyncOpenAI(api_key="test", http_client=httpx.AsyncClient(transport=transport)),
+            )
+            client.register_provider(
+                "anthropic", None,
+                AsyncAnthropic(api_key="test", http_client=httpx.AsyncClient(transport=transport)),
+            )
+            messages = [{"role": "user", "content": "hi"}]
+            return [
+                await client.achat_completion(provider="openai", model="gpt-5-mini", messages=messages),
+                await client.achat_completion(
+                    provider="anthropic", model="claude-sonnet-4-20250514", messages=messages, temperature=0.2,
+                ),
+            ]
+
+        openai_result, anthropic_result = asyncio.run(run())
+        assert openai_result["choices"][0]["message"]["content"] == '{"ok": true}'
+        assert openai_result["usage"]["prompt_tokens"] == 12
+        assert anthropic_result["choices"][0]["message"]["content"] == '{"ok": true}'
+        assert bodies[-1]["temperature"] == 0.2
+
+
+    def test_sdk_clients_do_not_retry_on_their_own(self):
+        from interface.ai.multi_provider_client import MultiProviderClient
+
+        client = MultiProviderClient(openai_key="test", perplexity_key="test", anthropic_key="test")
+        sdk_clients = [*client.providers.values(), *client.async_providers.values()]
+        assert len(sdk_clients) >= 6
+        assert all(c.max_retries == 0 for c in sdk_clients if hasattr(c, "max_retries"))
+
+
+class _FakeRaw:
+    def __init__(self, headers: dict) -> None:
+        self.headers = headers
+
+    def parse(self):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"ok": true}', role="assistant"))],
+            model="gpt-5-mini",
+            usage=SimpleNamespace(prompt_tokens=12, completion_tokens=3),
+        )
+
+
+def _fake_openai_provider(headers: dict):
+    from types import SimpleNamespace
+
+    create = lambda **kwargs: _FakeRaw(headers)  # noqa: E731
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        with_raw_response=SimpleNamespace(create=create),
+    )))
+
+
+class TestRateLimiter:
+    def test_parse_rate_limits(self):
+        from interface.ai.rate_limiter import parse_rate_limits
+
+        limits = parse_rate_limits("openai=500/500000, openai:gpt-5-mini=60/1000,bad")
+        assert limits == {"openai": (500, 500000), "openai:gpt-5-mini": (60, 1000)}
+
+    def test_bucket_queues_instead_of_failing(self):
+        from interface.ai.rate_limiter import RateLimiter
+
+        limiter = RateLimiter({"openai": (60, 1_000_000)})  # 초당 1요청
+        waits = [limiter.reserve("openai", "gpt-5-mini", 10) for _ in range(62)]
+        assert waits[:60] == [0.0] * 60
+        assert 0.5 < waits[60] < waits[61] <= 2.1
+
+    def test_model_limit_applies_with_provider_limit(self):
+        from interface.ai.rate_limiter import RateLimiter
+
+        limiter = RateLimiter({"openai": (1000, 1_000_000), "openai:gpt-5.2": (600, 6000)})
+        assert limiter.reserve("openai", "gpt-5.2", 6000) == 0.0
+        assert limiter.reserve("openai", "gpt-5.2", 600) > 5
+        assert limiter.reserve("openai", "gpt-5-mini", 600) == 0.0
+
+    def test_headers_and_429_adjust_buckets(self):
+        from types import SimpleNamespace
+
+        from interface.ai.rate_limiter import RateLimiter
+
+        limiter = RateLimiter({"anthropic": (1000, 1_000_000)})
+        limiter.update_from_headers("anthropic", "claude", {
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "0",
+        })
+        assert limiter.reserve("anthropic", "claude", 1) > 0.5
+
+        limiter = RateLimiter({"openai": (1000, 1_000_000)})
+        exc = SimpleNamespace(status_code=429, response=SimpleNamespace(status_code=429, headers={"retry-after": "3"}))
+        limiter.observe_error("openai", "gpt-5-mini", exc)
+        assert 2.5 < limiter.reserve("openai", "gpt-5-mini", 1) <= 3
+
+    def test_client_records_queue_wait_in_node_stats(self, monkeypatch):
+        from interface.ai import multi_provider_client as mpc
+        from interface.ai.llm_metrics import collect_llm_stats
+        from interface.ai.rate_limiter import RateLimiter
+
+        limiter = RateLimiter({"openai": (1000, 1_000_000)})
+        monkeypatch.setattr(mpc, "get_rate_limiter", lambda: limiter)
+        client = mpc.MultiProviderClient(openai_key="", perplexity_key="", anthropic_key="")
+        client.providers["openai"] = _fake_openai_provider({"x-ratelimit-remaining-requests": "0"})
+
+        messages = [{"role": "user", "content": "hi"}]
+        with collect_llm_stats() as stats:
+            result = client.chat_completion("openai", "gpt-5-mini", messages, max_tokens=10)
+
+        assert result["usage"]["prompt_tokens"] == 12
+        assert result["usage"]["completion_tokens"] == 3
+        assert stats.as_dict()["calls"] == 1
+        assert stats.as_dict()["prompt_tokens"] == 12
+        # 헤더의 잔량 0 반영 → 다음 예약은 대기
+        assert limiter.reserve("openai", "gpt-5-mini", 1) > 0
+
+    def test_graph_node_wrapper_adds_llm_stats(self):
+        from interface.ai.llm_metrics import record_llm_call
+        from interface.graph import _with_llm_stats
+
+        def node(state: dict) -> dict:
+            record_llm_call(queue_wait_s=0.25, prompt_tokens=5, completion_tokens=2)
+            return {"metrics": {"my_node": {"elapsed_s": 0.1, "status": "success"}}}
+
+        result = _with_llm_stats("my_node", node)({})
+        llm = result["metrics"]["my_node"]["llm"]
+        assert llm["calls"] == 1
+        assert llm["queue_wait_s"] == 0.25
+
+
+class TestResponseCache:
+    def test_ttl_and_lru_eviction(self, tmp_path, monkeypatch):
+        from interface.ai import response_cache
+
+        cache = response_cache.ResponseCache(tmp_path / "c.sqlite", ttl_s=60, max_bytes=25)
+        cache.set("a", "x" * 10)
+        cache.set("b", "y" * 10)
+        assert cache.get("a") == "x" * 10  # a가 최근 조회 → b가 먼저 밀려남
+        cache.set("c", "z" * 10)
+        assert cache.get("b") is None
+        assert cache.get("a") and cache.get("c")
+
+        now = response_cache.time.time()
+        monkeypatch.setattr(response_cache.time, "time", lambda: now + 61)
+        assert cache.get("a") is None
+
+    def test_call_llm_uses_cache_until_prompt_changes(self, tmp_path, monkeypatch, prompts_dir):
+        from interface.ai import llm_utils
+        from interface.ai.llm_metrics import collect_llm_stats
+        from interface.ai.response_cache import ResponseCache
+
+        cache = ResponseCache(tmp_path / "c.sqlite")
+        client = FakeClient()
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+        monkeypatch.setattr(llm_utils, "get_response_cache", lambda: cache)
+
+        with collect_llm_stats("my_node") as stats:
+            first = llm_utils.call_llm_with_prompt("echo", {"payload": 1}, prompts_dir=prompts_dir)
+            second = asyncio.run(llm_utils.acall_llm_with_prompt("echo", {"payload": 1}, prompts_dir=prompts_dir))
+        assert first == second == {"ok": True}
+        assert len(client.calls) == 1
+        assert stats.cache_hits == 1
+
+        # 프롬프트 파일이 바뀌면 다시 호출
+        path = prompts_dir / "echo.md"
+        path.write_text(path.read_text(encoding="utf-8") + "추가 지시\n", encoding="utf-8")
+        llm_utils.call_llm_with_prompt("echo", {"payload": 1}, prompts_dir=prompts_dir)
+        assert len(client.calls) == 2
+
+    def test_bypass_by_node_name(self, tmp_path, monkeypatch, prompts_dir):
+        from interface.ai import llm_utils, response_cache
+        from interface.ai.llm_metrics import collect_llm_stats
+
+        cache = response_cache.ResponseCache(tmp_path / "c.sqlite")
+        client = FakeClient()
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+        monkeypatch.setattr(llm_utils, "get_response_cache", lambda: cache)
+        monkeypatch.setattr(response_cache, "LLM_CACHE_BYPASS", "fresh_node")
+
+        with collect_llm_stats("fresh_node"):
+            for _ in range(2):
+                llm_utils.call_llm_with_prompt("echo", {"payload": 1}, prompts_dir=prompts_dir)
+        assert len(client.calls) == 2
+
+
+class TestPromptPrefixCache:
+    def test_shared_context_is_identical_prefix_across_prompts(self, tmp_path):
+        from interface.ai.llm_utils import _prepare_prompt_call
+
+        for name, intro in (("first", "테마를 만드세요."), ("second", "사례를 찾으세요.")):
+            (tmp_path / f"{name}.md").write_text(
+                "---\nprovider: anthropic\nmodel: claude\ncache_prefix: curated_context\n"
+                f"system_message: >\n  {name} 역할\n---\n{intro}\n[컨텍스트]\n{{{{curated_context}}}}\n",
+                encoding="utf-8",
+            )
+        context = {"theme": "반도체", "stocks": [1, 2]}
+        _, first = _prepare_prompt_call("first", {"curated_context": context}, tmp_path)
+        _, second = _prepare_prompt_call("second", {"curated_context": context}, tmp_path)
+
+        assert first["messages"][0] == second["messages"][0]
+        assert first["messages"][0]["cache_prefix"] is True
+        assert '"반도체"' in first["messages"][0]["content"]
+        assert '"반도체"' not in first["messages"][-1]["content"]
+
+    def test_anthropic_request_marks_breakpoint_and_reports_cache_usage(self):
+        from types import SimpleNamespace
+
+        from interface.ai.multi_provider_client import (
+            _anthropic_kwargs,
+            _normalize_anthropic_response,
+            _openai_kwargs,
+        )
+
+        messages = [
+            {"role": "system", "content": "공유", "cache_prefix": True},
+            {"role": "system", "content": "역할"},
+            {"role": "user", "content": "질문"},
+        ]
+        kwargs = _anthropic_kwargs("claude", messages, 0.3, 100)
+        assert kwargs["system"] == [
+            {"type": "text", "text": "공유", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "역할"},
+        ]
+        assert _openai_kwargs("openai", "gpt-5-mini", messages, False, "low", 0.3, 100, None)["messages"][0] == {
+            "role": "system", "content": "공유",
+        }
+
+        response = SimpleNamespace(
+            content=[SimpleNamespace(text="{}")],
+            model="claude",
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5, cache_read_input_tokens=900,
+                                  cache_creation_input_tokens=0),
+        )
+        usage = _normalize_anthropic_response(response)["usage"]
+        assert usage["prompt_tokens"] == 910
+        assert usage["cached_tokens"] == 900
+
+
+class TestHedging:
+    def test_slow_primary_is_hedged_and_cancelled(self):
+        from interface.ai.hedging import hedged_call
+
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "slow"
+
+        async def fast():
+            return "fast"
+
+        async def run():
+            result = await hedged_call(slow, fast, 0.05, lambda: True)
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(run()) == "fast"
+        assert cancelled == [True]
+
+    def test_failed_primary_falls_back_and_budget_limits_hedges(self):
+        from interface.ai.hedging import HedgeBudget, hedged_call
+
+        backups: list[str] = []
+
+        async def boom():
+            raise _StatusError(503)
+
+        async def bad_request():
+            raise _StatusError(400)
+
+        async def ok():
+            backups.append("ok")
+            return "ok"
+
+        assert asyncio.run(hedged_call(boom, ok, 10, lambda: True)) == "ok"
+        with pytest.raises(_StatusError):
+            asyncio.run(hedged_call(boom, ok, 10, lambda: False))
+        # 다시 보내도 실패할 오류는 backup 없이 바로 올린다
+        with pytest.raises(_StatusError, match="400"):
+            asyncio.run(hedged_call(bad_request, ok, 10, lambda: True))
+        assert backups == ["ok"]
+
+        budget = HedgeBudget()
+        allowed = 0
+        for _ in range(20):
+            budget.count_call("p")
+            allowed += budget.try_acquire("p", 0.1)
+        assert allowed == 2
+
+    def test_client_hedges_to_alternate_provider_after_percentile(self, monkeypatch):
+        from interface.ai import multi_provider_client as mpc
+        from interface.ai.hedging import HedgePolicy
+        from interface.ai.llm_metrics import collect_llm_stats
+
+        client = mpc.MultiProviderClient(openai_key="", perplexity_key="", anthropic_key="")
+        client.async_providers = {"anthropic": object(), "openai": object()}
+        for _ in range(20):
+            client.latency.observe("echo", 0.05)
+
+        async def fake(**kwargs):
+            await asyncio.sleep(1 if kwargs["provider"] == "anthropic" else 0)
+            return {"provider": kwargs["provider"], "model": kwargs["model"]}
+
+        monkeypatch.setattr(client, "achat_completion", fake)
+        policy = HedgePolicy(budget=1.0, provider="openai", model="gpt-5.2")
+        with collect_llm_stats() as stats:
+            result = mpc.run_async(client.achat_completion_hedged(
+                policy, "echo", provider="anthropic", model="claude", messages=[],
+            ))
+        assert result == {"provider": "openai", "model": "gpt-5.2"}
+        assert stats.hedges == 1
+
+
+class TestUsageAccounting:
+    def test_normalize_usage_handles_chat_and_responses_shapes(self):
+        from interface.ai.llm_metrics import normalize_usage
+
+        chat = {"prompt_tokens": 100, "completion_tokens": 50,
+                "prompt_tokens_details": {"cached_tokens": 40},
+                "completion_tokens_details": {"reasoning_tokens": 30}}
+        responses = {"input_tokens": 100, "output_tokens": 50,
+                     "input_tokens_details": {"cached_tokens": 40},
+                     "output_tokens_details": {"reasoning_tokens": 30}}
+        expected = {"prompt_tokens": 100, "completion_tokens": 50, "cached_tokens": 40, "reasoning_tokens": 30}
+        assert normalize_usage(chat) == normalize_usage(responses) == expected
+        assert normalize_usage(None)["prompt_tokens"] == 0
+
+    def test_cost_uses_longest_model_prefix(self):
+        from interface.ai.llm_metrics import estimate_cost_usd
+
+        # gpt-5-mini: 0.25 / 0.025 / 2.0 per 1M
+        assert estimate_cost_usd("gpt-5-mini", 1_000_000, 0, 0) == pytest.approx(0.25)
+        assert estimate_cost_usd("gpt-5-mini-2025", 1_000_000, 1_000_000, 1_000_000) == pytest.approx(2.025)
+        assert estimate_cost_usd("unknown-model", 1000, 0, 1000) == 0.0
+
+    def test_worker_thread_usage_reaches_node_and_run_totals(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from interface.ai.llm_metrics import (
+            bind_llm_stats,
+            collect_llm_stats,
+            record_llm_usage,
+            summarize_llm_metrics,
+        )
+
+        def work(_):
+            record_llm_usage("gpt-5-mini", {"input_tokens": 10, "output_tokens": 5}, latency_s=0.5)
+
+        with collect_llm_stats("summarize_news") as stats:
+            with ThreadPoolExecutor(max_workers=4) as ex:
+                list(ex.map(bind_llm_stats(work), range(8)))
+
+        assert stats.calls == 8 and stats.prompt_tokens == 80 and stats.latency_s == pytest.approx(4.0)
+        totals = summarize_llm_metrics({
+            "summarize_news": {"elapsed_s": 1, "status": "success", "llm": stats.as_dict()},
+            "run_theme": {"elapsed_s": 1, "status": "success", "llm": {"calls": 2, "cost_usd": 0.5}},
+            "crawl_news": {"elapsed_s": 1, "status": "success"},
+        })
+        assert totals["calls"] == 10
+        assert totals["cost_usd"] == pytest.approx(stats.cost_usd + 0.5)
+
+
+class FakeStreamClient:
+    """chat_completion_stream: 응답들을 순서대로 8자씩 흘려보낸다."""
+
+    def __init__(self, responses: list[str]) -> None:
+        self.responses = list(responses)
+        self.sent_chars: list[int] = []
+
+    def chat_completion_stream(self, on_delta, **kwargs) -> dict:
+        content = self.responses.pop(0)
+        sent = 0
+        try:
+            for i in range(0, len(content), 8):
+                sent = i + 8
+                if on_delta(content[i:i + 8]):
+                    break
+        finally:
+            self.sent_chars.append(min(sent, len(content)))
+        return {"choices": [{"message": {"content": content[:sent], "role": "assistant"}}], "usage": {}}
+
+
+def _sse(events: list[tuple[str, dict]]) -> bytes:
+    return "".join(
+        (f"event: {name}\n" if name else "") + f"data: {json.dumps(data)}\n\n" for name, data in events
+    ).encode()
+
+
+class TestStreamUsage:
+    def test_early_terminated_stream_still_reports_usage(self):
+        """on_delta가 완결을 알린 뒤에도 usage 조각/최종 메시지와 헤더를 받는다 (실제 SDK, MockTransport)."""
+        try:  # 최신 SDK는 httpx2 기반
+            import httpx2 as httpx
+        except ImportError:
+            import httpx
+        from anthropic import Anthropic
+        from openai import OpenAI
+
+        from interface.ai.llm_metrics import collect_llm_stats
+        from interface.ai.multi_provider_client import MultiProviderClient
+
+        def chunk(content=None, usage=None):
+            choices = [{"index": 0, "delta": {"content": content}}] if content else []
+            return "", {"id": "c", "object": "chat.completion.chunk", "created": 0, "model": "gpt-5-mini",
+                        "choices": choices, "usage": usage}
+
+        openai_body = _sse([
+            chunk('{"a": 1}'), chunk("\n뒤따르는 설명"),
+            chunk(usage={"prompt_tokens": 11, "completion_tokens": 5, "total_tokens": 16}),
+        ]) + b"data: [DONE]\n\n"
+        message = {"id": "m", "type": "message", "role": "assistant", "model": "claude", "content": [],
+                   "stop_reason": None, "stop_sequence": None, "usage": {"input_tokens": 9, "output_tokens": 1}}
+        anthropic_body = _sse([
+            ("message_start", {"type": "message_start", "message": message}),
+            ("content_block_start", {"type": "content_block_start", "index": 0,
+                                     "content_block": {"type": "text", "text": ""}}),
+            ("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                     "delta": {"type": "text_delta", "text": '{"a": 1}'}}),
+            ("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                     "delta": {"type": "text_delta", "text": "\n뒤따르는 설명"}}),
+            ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+            ("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                               "usage": {"output_tokens": 7}}),
+            ("message_stop", {"type": "message_stop"}),
+        ])
+
+        def handler(request):
+            body = anthropic_body if request.url.path.endswith("/messages") else openai_body
+            return httpx.Response(200, content=body, headers={
+                "content-type": "text/event-stream", "x-ratelimit-remaining-requests": "7",
+            })
+
+        client = MultiProviderClient(openai_key="", perplexity_key="", anthropic_key="")
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        client.register_provider("openai", OpenAI(api_key="test", http_client=http_client))
+        client.register_provider("anthropic", Anthropic(api_key="test", http_client=http_client))
+
+        with collect_llm_stats() as stats:
+            results = [
+                client.chat_completion_stream(
+                    provider=provider, model=model, messages=[{"role": "user", "content": "hi"}],
+                    on_delta=lambda text: text.endswith("}"),
+                )
+                for provider, model in (("openai", "gpt-5-mini"), ("anthropic", "claude-sonnet-4-20250514"))
+            ]
+        assert [r["choices"][0]["message"]["content"] for r in results] == ['{"a": 1}', '{"a": 1}']
+        assert results[0]["usage"]["completion_tokens"] == 5
+        assert results[1]["usage"]["completion_tokens"] == 7
+        assert stats.completion_tokens == 12 and stats.prompt_tokens == 20
+
+
+class TestStreamingJSON:
+    def test_validator_emits_items_and_rejects_broken_structure(self):
+        from interface.ai.json_parsing import JSONStreamValidator, JSONStructureError
+
+        validator = JSONStreamValidator("pages")
+        items = []
+        for ch in '```json\n{"pages": [{"t": "a}"}, {"t": "b"}], "n": 2}\n```':
+            items += validator.feed(ch)
+        assert items == [(0, {"t": "a}"}), (1, {"t": "b"})]
+        assert validator.done and validator.root_text.endswith('"n": 2}')
+
+        sections = JSONStreamValidator("narrative").feed('{"narrative": {"bg": {"c": 1}, "hist": {"c": 2}}}')
+        assert [name for name, _ in sections] == ["bg", "hist"]
+
+        for broken in ('{"a": [1}', "{'a': 1}", '{"a": True}', "설명 " * 100):
+            with pytest.raises(JSONStructureError):
+                JSONStreamValidator().feed(broken)
+
+    def test_stream_aborts_malformed_output_early_and_retries(self, monkeypatch, prompts_dir):
+        from interface.ai import llm_utils
+
+        broken = '{"pages": [{"t": 1}, {\'t\': 2}' + ', {"t": 3}' * 500 + "]}"
+        good = '{"pages": [{"t": 1}, {"t": 2}]}\n추가 설명은 읽지 않음' + "." * 500
+        client = FakeStreamClient([broken, good])
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+        (prompts_dir / "stream.md").write_text(
+            "---\nprovider: openai\nmodel: gpt-5-mini\nstream: true\nstream_items: pages\n---\n{{payload}}\n",
+            encoding="utf-8",
+        )
+
+        seen = []
+        result = llm_utils.call_llm_with_prompt(
+            "stream", {"payload": 1}, prompts_dir=prompts_dir, on_item=lambda i, item: seen.append((i, item)),
+        )
+        assert result == {"pages": [{"t": 1}, {"t": 2}]}
+        assert client.sent_chars[0] < 40 and client.sent_chars[1] < 60
+        assert seen[-2:] == [(0, {"t": 1}), (1, {"t": 2})]
+
+
+class TestStructuredOutput:
+    def test_schema_spec_compiles_to_strict_json_schema(self):
+        from interface.ai.structured_output import response_format_for
+
+        fmt = response_format_for("pages=list[PageDraft]", "3_pages")
+        schema = fmt["json_schema"]["schema"]
+        page = schema["$defs"]["PageDraft"]
+        assert fmt["type"] == "json_schema" and fmt["json_schema"]["strict"] is True
+        assert schema["required"] == ["pages"] and schema["additionalProperties"] is False
+        assert "title" in page["properties"] and page["required"] == ["step", "title", "purpose", "content", "bullets"]
+
+        # 자유 형식 dict(PlotlyChart)가 있으면 strict로 표현 불가
+        assert response_format_for("Page", "page")["json_schema"]["strict"] is False
+        with pytest.raises(ValueError):
+            response_format_for("NoSuchModel", "x")
+
+    def test_anthropic_maps_schema_to_forced_tool_call(self):
+        from types import SimpleNamespace
+
+        from interface.ai.multi_provider_client import _anthropic_kwargs, _normalize_anthropic_response
+        from interface.ai.structured_output import response_format_for
+
+        fmt = response_format_for("Headline", "3_theme")
+        kwargs = _anthropic_kwargs("claude", [{"role": "user", "content": "q"}], 0.3, 100, fmt)
+        assert kwargs["tool_choice"] == {"type": "tool", "name": "3_theme"}
+        assert kwargs["tools"][0]["input_schema"]["required"] == ["theme", "one_liner"]
+
+        response = SimpleNamespace(
+            content=[SimpleNamespace(type="tool_use", input={"theme": "반도체", "one_liner": "한 줄"})],
+            model="claude",
+            usage=SimpleNamespace(input_tokens=1, output_tokens=1),
+        )
+        content = _normalize_anthropic_response(response)["choices"][0]["message"]["content"]
+        assert json.loads(content) == {"theme": "반도체", "one_liner": "한 줄"}
+
+    def test_schema_violation_is_retried(self, monkeypatch, prompts_dir):
+        from interface.ai import llm_utils
+
+        (prompts_dir / "headline.md").write_text(
+            "---\nprovider: openai\nmodel: gpt-5-mini\nschema: Headline\n---\n{{payload}}\n", encoding="utf-8",
+        )
+
+        class SequenceClient(FakeClient):
+            def __init__(self, contents):
+                super().__init__()
+                self.contents = list(contents)
+
+            def chat_completion(self, **kwargs):
+                self.content = self.contents.pop(0)
+                return super().chat_completion(**kwargs)
+
+        client = SequenceClient(['{"theme": "a"}', '{"theme": "a", "one_liner": "b"}'])
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+
+        result = llm_utils.call_llm_with_prompt("headline", {"payload": 1}, prompts_dir=prompts_dir)
+        assert result == {"theme": "a", "one_liner": "b"}
+        assert len(client.calls) == 2
+        assert client.calls[0]["response_format"]["json_schema"]["name"] == "headline"
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int, headers: dict | None = None) -> None:
+        from types import SimpleNamespace
+
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+class TestTransientRetry:
+    def test_classification_and_retry_after(self):
+        from interface.ai.retry import backoff_delay_s, is_transient, retry_after_s
+
+        assert is_transient(_StatusError(429)) and is_transient(_StatusError(529))
+        assert is_transient(TimeoutError()) and is_transient(ConnectionResetError())
+        assert not is_transient(_StatusError(400)) and not is_transient(ValueError("bad json"))
+        assert retry_after_s(_StatusError(429, {"retry-after": "2"})) == 2
+        assert retry_after_s(_StatusError(429, {"retry-after-ms": "1500"})) == 1.5
+        assert 2 <= backoff_delay_s(1, _StatusError(429, {"retry-after": "2"})) <= 3
+
+    def test_call_llm_retries_transient_errors_within_budget(self, monkeypatch, prompts_dir):
+        from interface.ai import llm_utils, retry
+        from interface.ai.llm_metrics import collect_llm_stats
+
+        monkeypatch.setattr(retry, "LLM_RETRY_BASE_DELAY_S", 0.001)
+        monkeypatch.setattr(retry, "_budget", retry.RetryBudget(2))
+        failures = [_StatusError(503), ConnectionResetError()]
+
+        class FlakyClient(FakeClient):
+            def chat_completion(self, **kwargs):
+                if failures:
+                    self.calls.append(kwargs)
+                    raise failures.pop(0)
+                return super().chat_completion(**kwargs)
+
+        client = FlakyClient()
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+        with collect_llm_stats() as stats:
+            assert llm_utils.call_llm_with_prompt("echo", {"payload": 1}, prompts_dir=prompts_dir) == {"ok": True}
+        assert len(client.calls) == 3
+        assert stats.retries == 2
+
+        # 예산 소진 후에는 즉시 전파, 비일시적 오류는 재시도하지 않음
+        failures.extend([_StatusError(503)])
+        with pytest.raises(_StatusError):
+            llm_utils.call_llm_with_prompt("echo", {"payload": 2}, prompts_dir=prompts_dir)
+        retry.get_retry_budget().reset()
+        failures.extend([_StatusError(401)])
+        with pytest.raises(_StatusError):
+            llm_utils.call_llm_with_prompt("echo", {"payload": 3}, prompts_dir=prompts_dir)
+        assert retry.get_retry_budget().used == 0
+
+
+class TestExtractJSONObject:
+    def test_fences_prose_and_braces_inside_strings(self):
+        from interface.ai.json_parsing import extract_json_object
+
+        assert extract_json_object('```json\n{"a": 1}\n```') == {"a": 1}
+        text = '설명 {참고} 입니다.\n{"title": "a } b { c", "q": "\\"}\\""}\n이상입니다 }'
+        assert extract_json_object(text) == {"title": "a } b { c", "q": '"}"'}
+
+    def test_non_object_root_and_missing_object_raise(self):
+        from interface.ai.json_parsing import extract_json_object
+
+        with pytest.raises(ValueError):
+            extract_json_object('[{"a": 1}]')
+        with pytest.raises(ValueError):
+            extract_json_object("JSON 없음")
+        with pytest.raises(ValueError):
+            extract_json_object('{"a": [1, 2')
+
+
+class TestMockProvider:
+    def _client(self, **options):
+        from interface.ai.mock_provider import AsyncMockLLMProvider, MockLLMProvider
+        from interface.ai.multi_provider_client import MultiProviderClient
+
+        client = MultiProviderClient()
+        options.setdefault("latency", "fixed:0.01")
+        client.register_provider("mock", MockLLMProvider(seed=1, **options), AsyncMockLLMProvider(seed=1, **options))
+        return client
+
+    def test_schema_examples_validate_for_all_templates(self):
+        from interface.ai.mock_provider import MockLLMProvider
+        from interface.ai.structured_output import resolve_schema, response_format_for
+        from interface.config import PROMPTS_DIR
+        from interface.prompts.prompt_loader import load_prompt
+
+        core = MockLLMProvider().core
+        missing: list[str] = []
+        for path in sorted(PROMPTS_DIR.glob("[!_]*.md")):
+            spec_str = load_prompt(path.stem, prompts_dir=PROMPTS_DIR).extra.get("schema")
+            if not spec_str:
+                missing.append(path.stem)
+                continue
+            # canned 응답이 있으면 그 내용을, 없으면 스키마 예시를 검증한다
+            content = core.content_for(path.stem, response_format_for(spec_str, path.stem))
+            resolve_schema(spec_str).model_validate(json.loads(content))
+        assert missing == []
+
+    def test_prompt_call_goes_through_client_path(self, monkeypatch, tmp_path):
+        from interface.ai import llm_utils
+        from interface.ai.llm_metrics import collect_llm_stats
+
+        (tmp_path / "headline.md").write_text(
+            "---\nprovider: anthropic\nmodel: claude-sonnet-4-20250514\nresponse_format: json_object\n"
+            "schema: Headline\n---\n입력: {{payload}}\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "canned").mkdir()
+        (tmp_path / "canned" / "echo.json").write_text('{"canned": true}', encoding="utf-8")
+        (tmp_path / "echo.md").write_text(
+            "---\nprovider: openai\nmodel: gpt-5-mini\nresponse_format: json_object\nstream: true\n---\n{{payload}}\n",
+            encoding="utf-8",
+        )
+        client = self._client(responses_dir=tmp_path / "canned", completion_tokens=7)
+        monkeypatch.setattr(llm_utils, "LLM_MOCK_ENABLED", True)
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+
+        with collect_llm_stats() as stats:
+            headline = llm_utils.call_llm_with_prompt("headline", {"payload": 1}, prompts_dir=tmp_path)
+            canned = llm_utils.call_llm_with_prompt("echo", {"payload": 2}, prompts_dir=tmp_path)
+            async_headline = llm_utils.run_async(
+                llm_utils.acall_llm_with_prompt("headline", {"payload": 3}, prompts_dir=tmp_path)
+            )
+        assert set(headline) >= {"theme", "one_liner"} and async_headline == headline
+        assert canned == {"canned": True}
+        # 스트리밍 호출도 루트 객체가 닫힌 뒤 usage 조각까지 읽어 사용량을 기록한다
+        assert stats.calls == 3 and stats.prompt_tokens > 0 and stats.completion_tokens == 21
+
+    def test_injected_errors_are_retried_as_transient(self, monkeypatch, prompts_dir):
+        from interface.ai import llm_utils, retry
+        from interface.ai.llm_metrics import collect_llm_stats
+        from interface.ai.mock_provider import MockAPIError
+
+        monkeypatch.setattr(retry, "LLM_RETRY_BASE_DELAY_S", 0.001)
+        monkeypatch.setattr(retry, "LLM_RETRY_MAX_DELAY_S", 0.001)
+        monkeypatch.setattr(retry, "_budget", retry.RetryBudget(2))
+        monkeypatch.setattr(llm_utils, "LLM_MOCK_ENABLED", True)
+        client = self._client(error_rates="429=1.0")
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+
+        with collect_llm_stats() as stats, pytest.raises(MockAPIError) as excinfo:
+            llm_utils.call_llm_with_prompt("echo", {"payload": 1}, prompts_dir=prompts_dir)
+        assert excinfo.value.status_code == 429
+        assert stats.calls == 3 and stats.errors == 3 and stats.retries == 2
+
+    def test_canned_responses_pass_node_side_parsing(self, monkeypatch):
+        """schema 없는 프롬프트는 기본 고정 응답으로 live 노드를 끝까지 통과한다."""
+        from pathlib import Path
+
+        from interface.ai import llm_utils
+        from interface.config import LLM_MOCK_RESPONSES_DIR, PROMPTS_DIR
+        from interface.nodes.chart_agent import run_chart_agent_node, run_hallcheck_chart_node
+        from interface.nodes.interface2 import validate_interface2_node
+        from interface.nodes.interface3 import (
+            run_glossary_node,
+            run_hallcheck_glossary_node,
+            run_hallcheck_pages_node,
+            run_tone_final_node,
+        )
+        from interface.schemas import HallucinationItem, Page, PageDraft, PlotlyChart, RawNarrative, SourceItem
+
+        canned = {path.stem for path in Path(LLM_MOCK_RESPONSES_DIR).glob("*.json")}
+        assert canned and all((PROMPTS_DIR / f"{name}.md").exists() for name in canned)
+
+        client = self._client(latency="fixed:0")
+        monkeypatch.setattr(llm_utils, "LLM_MOCK_ENABLED", True)
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+
+        state: dict = {
+            "backend": "live", "metrics": {}, "curated_context": {"theme": "mock"},
+            "page_purpose": {"theme": "", "one_liner": "", "concept": {}}, "historical_case": {}, "narrative": {},
+            "i3_theme": {}, "i3_pages": [],
+        }
+        for node in (
+            validate_interface2_node, run_hallcheck_pages_node, run_glossary_node,
+            run_hallcheck_glossary_node, run_tone_final_node, run_chart_agent_node, run_hallcheck_chart_node,
+        ):
+            update = node(state)
+            assert not update.get("error"), update.get("error")
+            state.update(update)
+
+        RawNarrative.model_validate(state["raw_narrative"])
+        assert [PageDraft.model_validate(p).step for p in state["i3_validated"]["validated_pages"]] == list(range(1, 7))
+        assert len(state["i3_validated_glossaries"]) == 6
+        pages = [Page.model_validate(p) for p in state["pages"]]
+        assert len(pages) == 6 and any(p.glossary for p in pages)
+        charts = [PlotlyChart.model_validate(c) for c in state["charts"].values() if c]
+        assert charts and all(SourceItem.model_validate(s).used_in_pages for s in state["sources"])
+        assert [HallucinationItem.model_validate(h) for h in state["hallucination_checklist"]]
+
+
+class TestCompiledPromptCache:
+    def test_compiled_once_and_invalidated_by_include_change(self, tmp_path):
+        import os
+
+        from interface.prompts.prompt_loader import compile_prompt, load_prompt
+
+        (tmp_path / "_guide.md").write_text("가이드 v1 {{tone}}", encoding="utf-8")
+        (tmp_path / "p.md").write_text(
+            "---\nprovider: openai\nsystem_message: >\n  시스템 {{tone}}\n---\n"
+            "{{include:_guide}}\n본문 {{a}} / {{missing}} / {{a}}\n",
+            encoding="utf-8",
+        )
+        first = compile_prompt("p", tmp_path)
+        assert compile_prompt("p", tmp_path) is first
+        spec = load_prompt("p", prompts_dir=tmp_path, a="{{tone}}", tone="해요체")
+        assert spec.body == "가이드 v1 해요체\n본문 {{tone}} /  / {{tone}}"
+        assert spec.system_message == "시스템 해요체"
+
+        guide = tmp_path / "_guide.md"
+        guide.write_text("가이드 v2", encoding="utf-8")
+        stat = guide.stat()
+        os.utime(guide, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert compile_prompt("p", tmp_path) is not first
+        assert load_prompt("p", prompts_dir=tmp_path, a="x").body.startswith("가이드 v2\n")
+
+
+class TestPromptVariableBudget:
+    def test_variables_are_serialized_compactly(self, monkeypatch, prompts_dir):
+        from interface.ai import llm_utils
+
+        client = FakeClient()
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+        llm_utils.call_llm_with_prompt("echo", {"payload": {"a": [1, 2], "b": "값"}}, prompts_dir=prompts_dir)
+        assert client.calls[0]["messages"][-1]["content"] == '입력: {"a":[1,2],"b":"값"}'
+
+    def test_budget_drops_low_priority_fields_then_trims_lists(self):
+        from interface.ai.prompt_vars import fit_variable
+        from interface.ai.tokenizer import count_tokens
+
+        curated = {
+            "theme": "반도체 업황 반등",
+            "verified_news": [
+                {"title": f"뉴스 {i}", "url": f"https://example.com/{i}", "summary": "요약 " * 40}
+                for i in range(30)
+            ],
+            "evidence_source_urls": [f"https://example.com/e/{i}" for i in range(50)],
+        }
+        fitted = fit_variable(curated, 400, low_priority=("evidence_source_urls", "url"))
+        parsed = json.loads(fitted)
+        assert count_tokens(fitted) <= 400
+        assert "evidence_source_urls" not in parsed and "url" not in parsed["verified_news"][0]
+        assert parsed["theme"] == curated["theme"]
+        assert [n["title"] for n in parsed["verified_news"]] == [f"뉴스 {i}" for i in range(len(parsed["verified_news"]))]
+
+        # JSON 문자열로 넘긴 값도 같은 방식으로 줄이고, 예산 안이면 그대로 compact 직렬화
+        assert json.loads(fit_variable(json.dumps(curated), 400, low_priority=("url",)))["theme"] == curated["theme"]
+        assert fit_variable({"a": 1}, 400) == '{"a":1}'
+
+    def test_budget_never_slices_json_when_nothing_is_left_to_shrink(self):
+        from interface.ai.prompt_vars import fit_variable
+
+        # 자를 수 없는 짧은 값만 많은 dict — 예산을 넘겨도 JSON은 유지한다
+        value = {f"key_{i}": f"짧은 값 {i}" for i in range(200)}
+        fitted = fit_variable(value, 50)
+        assert json.loads(fitted) == value
+
+    def test_frontmatter_budget_is_applied(self, monkeypatch, tmp_path):
+        from interface.ai import llm_utils
+
+        (tmp_path / "budgeted.md").write_text(
+            "---\nprovider: openai\nmodel: gpt-4o-mini\nresponse_format: json_object\n"
+            "max_tokens.ctx: 50\nlow_priority.ctx: noise\n---\n{{ctx}}\n",
+            encoding="utf-8",
+        )
+        client = FakeClient()
+        monkeypatch.setattr(llm_utils, "get_multi_provider_client", lambda: client)
+        llm_utils.call_llm_with_prompt(
+            "budgeted", {"ctx": {"keep": "핵심", "noise": "x" * 2000}}, prompts_dir=tmp_path,
+        )
+        assert client.calls[0]["messages"][-1]["content"] == '{"keep":"핵심"}'
@@ -63,6 +63,60 @@ class TestInterface2Nodes:
         assert "page_purpose" in result
         assert result["page_purpose"]["theme"]
 
+    def test_page_purpose_uses_prefetched_result(self, monkeypatch):
+        from interface.nodes import interface2
+
+        calls: list[dict] = []
+
+        def fake_llm(prompt_name: str, variables: dict) -> dict:
+            calls.append(variables)
+            return {"theme": "선행", "one_liner": "x", "concept": {}}
+
+        monkeypatch.setattr(interface2, "call_llm_with_prompt", fake_llm)
+        curated = {"theme": "반도체", "source_ids": ["ws1_s1"], "evidence_source_urls": []}
+        interface2.prefetch_page_purpose(curated)
+
+        # 로컬 보정으로 인용 필드만 바뀐 curated_context도 선행 결과를 재사용
+        repaired = {**curated, "source_ids": ["ws1_s2"], "evidence_source_urls": ["https://a"]}
+        result = interface2.run_page_purpose_node(
+            {"curated_context": repaired, "backend": "live", "metrics": {}}
+        )
+        assert result["page_purpose"]["theme"] == "선행"
+        assert len(calls) == 1
+
+        interface2.run_page_purpose_node(
+            {"curated_context": {**curated, "theme": "다른 테마"}, "backend": "live", "metrics": {}}
+        )
+        assert len(calls) == 2
+
+    def test_superseded_prefetch_is_cancelled_and_executor_shut_down(self, monkeypatch):
+        import threading
+
+        from interface.nodes import interface2
+
+        release = threading.Event()
+        themes: list[str] = []
+
+        def fake_llm(prompt_name: str, variables: dict) -> dict:
+            release.wait(5)
+            themes.append(variables["curated_context"]["theme"])
+            return {"theme": variables["curated_context"]["theme"], "one_liner": "x", "concept": {}}
+
+        monkeypatch.setattr(interface2, "call_llm_with_prompt", fake_llm)
+        interface2.prefetch_page_purpose({"theme": "A"})  # 워커 점유
+        interface2.prefetch_page_purpose({"theme": "B"})  # 대기 중
+        pending = interface2._PREFETCHED[interface2._page_purpose_key({"theme": "B"})]
+        interface2.prefetch_page_purpose({"theme": "C"})
+        assert pending.cancelled()
+
+        release.set()
+        result = interface2.run_page_purpose_node({"curated_context": {"theme": "C"}, "backend": "live", "metrics": {}})
+        assert result["page_purpose"]["theme"] == "C"
+        assert interface2._PREFETCHED == {} and "B" not in themes
+
+        interface2.shutdown_page_purpose_prefetch()
+        assert interface2._prefetch_executor is None
+
     def test_historical_case_mock(self, curated_context: dict):
         from interface.nodes.interface2 import run_historical_case_node, _mock_page_purpose
 